@@ -40,5 +40,19 @@ def download_ephemeris():
             print(f"Error downloading {filename}: {e}")
 
 
+def build_ephemeris_table():
+    # Precomputed Chebyshev table for fast chart lookups (optional at runtime)
+    from src.astronomy.ephemeris_table import EphemerisTable, DEFAULT_TABLE_PATH
+
+    if EphemerisTable.load_if_available() is not None:
+        print("  Ephemeris table already exists (skipping).")
+        return
+
+    print("🧮 Building precomputed ephemeris table (1900-2100)...")
+    table = EphemerisTable.build()
+    print(f"Built {DEFAULT_TABLE_PATH} ({table.coefficients.nbytes / 1e6:.1f} MB)")
+
+
 if __name__ == "__main__":
     download_ephemeris()
+    build_ephemeris_table()
@@ -1,23 +1,58 @@
+import io
 import json
 import os
+import tempfile
 import uvicorn
-import torch
-import torch.nn as nn
-from datetime import datetime
-from fastapi import FastAPI, HTTPException
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from itertools import islice
+from typing import Optional
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
-from src.api.schemas import BirthDetails, ChartResponse
+from src.api.schemas import (
+    BirthDetails,
+    ChartResponse,
+    BatchBirthDetails,
+    BatchChartResponse,
+    RectificationRequest,
+    RectificationResponse,
+    DashaQueryRequest,
+    DashaQueryResponse,
+    DashaSystemsRequest,
+    PanchangRequest,
+)
 
 # --- IMPORT ENGINES ---
-from src.astronomy.engine import VedicAstroEngine
-from src.astronomy.dasha import VimshottariDasha
+from src.astronomy.chart import Planet
+from src.astronomy.engine import PLANET_NAMES, VedicAstroEngine
+from src.astronomy.ephemeris_table import EphemerisTable
+from src.astronomy.events import EVENT_KINDS, EventCatalog, datetime64_to_jd
+from src.astronomy.vargas import VARGA_NAMES
+from src.astronomy.dasha import (
+    DASHA_SYSTEMS,
+    PATH_KEYS,
+    VimshottariDasha,
+    dasha_timelines,
+    parse_dasha_path,
+)
 from src.astronomy.transits import TransitEngine
+from src.astronomy.forecast import CHUNK_SIZE, BatchForecaster
+from src.astronomy.jaimini import jaimini_analysis
+from src.astronomy.transit_windows import WINDOW_NAMES, TransitWindowFinder
+from src.astronomy.upagrahas import UpagrahaEngine
+from src.astronomy.life_events import TIMELINE_SOURCES, LifeTimeline
 from src.astronomy.match import MatchMaker
+from src.astronomy.panchang import PanchangEngine, to_parquet
+from src.astronomy.rectification import RectificationEngine
+from src.astronomy.tables import SIGN_NAMES
 from src.astronomy.yogas import YogaEngine
+from src.astronomy.worker_pool import ChartWorkerPool, pack_births, process_births, use_engines
 from src.model.inference import generate_horoscope_reading, chat_with_astrologer
-from src.utils.chart_plotter import draw_north_indian_chart
+from src.utils.lazy import LazyResource, start_warm_up, warm_up
 
 app = FastAPI(title="PanditAI: Neuro-Symbolic Engine")
 
@@ -33,136 +68,198 @@ app.add_middleware(
 # ==========================================
 # 1. INITIALIZE ENGINES
 # ==========================================
-astro_engine = VedicAstroEngine()
+# Precomputed ephemeris is optional: build it with `python -m src.astronomy.ephemeris_table`
+ephemeris_table = EphemerisTable.load_if_available()
+# Ingress/station catalog, likewise optional: `python -m src.astronomy.events`
+event_catalog = EventCatalog.load_if_available()
+window_finder = TransitWindowFinder(event_catalog) if event_catalog is not None else None
+astro_engine = VedicAstroEngine(ephemeris_table=ephemeris_table)
 dasha_engine = VimshottariDasha()
-transit_engine = TransitEngine()
+transit_engine = TransitEngine(ephemeris_table=ephemeris_table, event_catalog=event_catalog)
 match_engine = MatchMaker()
 yoga_engine = YogaEngine()
+rectification_engine = RectificationEngine(astro_engine)
+upagraha_engine = UpagrahaEngine()
+panchang_engine = PanchangEngine(ephemeris_table=ephemeris_table)
+
+# Optional process pool for bulk jobs: set CHART_WORKERS=<n> (0/unset = in-process)
+CHART_WORKERS = int(os.getenv("CHART_WORKERS", "0"))
+chart_pool = None
+# The in-process path shares the engines (and ephemeris table) loaded above
+use_engines(astro_engine, dasha_engine, yoga_engine)
 
-# ==========================================
-# 2. LOAD PREDICTION DATA
-# ==========================================
-PREDICTION_DB = {}
-p_path = os.path.join("data", "planets_data.json")
-if os.path.exists(p_path):
-    with open(p_path, "r", encoding="utf-8") as f:
-        for item in json.load(f):
-            PREDICTION_DB[item["id"]] = item
 
-l_path = os.path.join("data", "house_lords.json")
-if os.path.exists(l_path):
-    with open(l_path, "r", encoding="utf-8") as f:
-        for item in json.load(f):
-            PREDICTION_DB[item["id"]] = item
+@app.on_event("startup")
+def start_chart_pool():
+    global chart_pool
+    if CHART_WORKERS > 0:
+        chart_pool = ChartWorkerPool(workers=CHART_WORKERS)
 
 
+@app.on_event("shutdown")
+def stop_chart_pool():
+    if chart_pool is not None:
+        chart_pool.close()
+
 # ==========================================
-# 3. DEEP LEARNING MODEL
+# 2. HEAVY SUBSYSTEMS (LAZY)
 # ==========================================
-class DestinyNet(nn.Module):
-    def __init__(self):
-        super(DestinyNet, self).__init__()
-        self.fc1 = nn.Linear(18, 128)
-        self.fc2 = nn.Linear(128, 64)
-        self.fc3 = nn.Linear(64, 32)
-        self.fc4 = nn.Linear(32, 1)
-        self.relu = nn.ReLU()
-        self.sigmoid = nn.Sigmoid()
-
-    def forward(self, x):
-        return self.sigmoid(
-            self.fc4(self.relu(self.fc3(self.relu(self.fc2(self.relu(self.fc1(x)))))))
-        )
+# torch, matplotlib and the 1 MB rule DB are only loaded on first use or by the warm-up.
+# STARTUP_MODE: "background" (default, warm up after the server starts accepting requests),
+#               "lazy" (first request pays), "eager" (block startup until everything is loaded)
+STARTUP_MODE = os.getenv("STARTUP_MODE", "background").lower()
 
 
-destiny_model = DestinyNet()
-if os.path.exists("models/destiny_net.pth"):
-    try:
-        destiny_model.load_state_dict(torch.load("models/destiny_net.pth"))
-        destiny_model.eval()
-        print("  DL Model Loaded")
-    except:
-        print("⚠️ DL Model Load Failed")
-
-
-def get_dl_vector(chart):
-    vec = []
-    for p in [
-        "Sun",
-        "Moon",
-        "Mars",
-        "Mercury",
-        "Jupiter",
-        "Venus",
-        "Saturn",
-        "Rahu",
-        "Ketu",
-    ]:
-        if p in chart:
-            vec.extend([chart[p]["sign_id"], chart[p].get("house_number", 1)])
-        else:
-            vec.extend([0, 0])
-    return torch.tensor([vec], dtype=torch.float32)
+def load_prediction_db():
+    db = {}
+    p_path = os.path.join("data", "planets_data.json")
+    if os.path.exists(p_path):
+        with open(p_path, "r", encoding="utf-8") as f:
+            for item in json.load(f):
+                db[item["id"]] = item
+
+    l_path = os.path.join("data", "house_lords.json")
+    if os.path.exists(l_path):
+        with open(l_path, "r", encoding="utf-8") as f:
+            for item in json.load(f):
+                db[item["id"]] = item
+    return db
+
+
+def load_destiny_scorer():
+    # DestinyNet: importing torch is most of the startup cost
+    from src.model.destiny_net import destiny_score, load_destiny_model
+    return partial(destiny_score, load_destiny_model())
+
+
+def load_chart_renderer():
+    from src.utils.chart_plotter import draw_north_indian_chart
+    return draw_north_indian_chart
+
+
+prediction_db = LazyResource("prediction_db", load_prediction_db)
+destiny_scorer = LazyResource("destiny_model", load_destiny_scorer)
+chart_renderer = LazyResource("chart_renderer", load_chart_renderer)
+HEAVY_RESOURCES = [prediction_db, chart_renderer, destiny_scorer]
+
+
+@app.on_event("startup")
+def start_heavy_resources():
+    if STARTUP_MODE == "eager":
+        warm_up(HEAVY_RESOURCES)
+    elif STARTUP_MODE == "background":
+        start_warm_up(HEAVY_RESOURCES)
 
 
 # ==========================================
-# 4. HELPER: RULE KEY GENERATOR
+# 3. HELPER: RULE KEY GENERATOR
 # ==========================================
 def get_rules_for_chart(chart, asc_id):
     found_rules = []
     text_summary = "=== PLANETARY PLACEMENTS ===\n"
 
-    for p, data in chart.items():
-        if p == "Ascendant":
+    sign_short = [
+        "ARI",
+        "TAU",
+        "GEM",
+        "CAN",
+        "LEO",
+        "VIR",
+        "LIB",
+        "SCO",
+        "SAG",
+        "CAP",
+        "AQU",
+        "PIS",
+    ]
+    p_short = ["SUN", "MOON", "MAR", "MER", "JUP", "VEN", "SAT", "RAH", "KET"]
+    rules_db = prediction_db.get()
+
+    for pos in chart.positions[: Planet.ASCENDANT]:
+        if pos is None:
             continue
-        h = data["house_number"]
-        sign_short = [
-            "ARI",
-            "TAU",
-            "GEM",
-            "CAN",
-            "LEO",
-            "VIR",
-            "LIB",
-            "SCO",
-            "SAG",
-            "CAP",
-            "AQU",
-            "PIS",
-        ][data["sign_id"]]
-        p_short = {
-            "Sun": "SUN",
-            "Moon": "MOON",
-            "Mars": "MAR",
-            "Mercury": "MER",
-            "Jupiter": "JUP",
-            "Venus": "VEN",
-            "Saturn": "SAT",
-            "Rahu": "RAH",
-            "Ketu": "KET",
-        }.get(p)
-
-        if p_short:
-            key = f"{p_short}_{sign_short}_H{h}"
-            if key in PREDICTION_DB:
-                rule = PREDICTION_DB[key]
-                found_rules.append(rule)
-                text_summary += f"* {p} in House {h}: {rule.get('prediction', '')}\n"
+        h = pos.house_number
+        key = f"{p_short[pos.planet]}_{sign_short[pos.sign_id]}_H{h}"
+        if key in rules_db:
+            rule = rules_db[key]
+            found_rules.append(rule)
+            text_summary += f"* {pos.name} in House {h}: {rule.get('prediction', '')}\n"
 
     return found_rules, text_summary
 
 
+def serialize_dasha_node(node, path=None):
+    """
+    path: the node's /dasha/expand path (e.g. "md=3/ad=5"); only Maha/Antar/Pratyantar have one.
+    """
+    obj = {
+        "lord": node["lord"],
+        "start": node["start"].strftime("%Y-%m-%d"),
+        "end": node["end"].strftime("%Y-%m-%d"),
+        "type": node.get("type", "Unknown"),
+    }
+    if path is not None:
+        obj["path"] = path
+    if "sub_periods" in node and node["sub_periods"]:
+        depth = path.count("/") + 1 if path else len(PATH_KEYS)
+        key = PATH_KEYS[depth] if depth < len(PATH_KEYS) else None
+        obj["sub_periods"] = [
+            serialize_dasha_node(child, f"{path}/{key}={i}" if key else None)
+            for i, child in enumerate(node["sub_periods"])
+        ]
+    return obj
+
+
+def birth_local(value, tz):
+    """
+    Dates in dasha / timeline requests are the birth's local wall time (naive, like the
+    birth details). Offset-aware inputs are converted to that wall time at tz hours from UT.
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return (value.astimezone(timezone.utc) + timedelta(hours=tz)).replace(tzinfo=None)
+
+
+def serialize_dasha_current(current):
+    return {
+        k: {
+            "lord": v["lord"],
+            "start": v["start"].strftime("%Y-%m-%d"),
+            "end": v["end"].strftime("%Y-%m-%d"),
+        }
+        for k, v in (current or {}).items()
+    }
+
+
+def dasha_system_timeline(d, system):
+    """
+    Chart + DashaTimeline of one system for a birth; 400 for an unknown system.
+    """
+    if system not in DASHA_SYSTEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown dasha system '{system}' (available: {', '.join(DASHA_SYSTEMS)})",
+        )
+    chart = astro_engine.calculate_chart(
+        d.year, d.month, d.day, d.hour, d.minute, d.latitude, d.longitude, d.timezone, d.ayanamsa
+    )
+    birth_dt = datetime(d.year, d.month, d.day, d.hour, d.minute)
+    return DASHA_SYSTEMS[system].timeline(chart, birth_dt)
+
+
 # ==========================================
-# 5. API ENDPOINTS
+# 4. API ENDPOINTS
 # ==========================================
 
 
-# Maintain backward compatibility with /calculate if needed by frontend
-@app.post("/calculate", response_model=ChartResponse)
 @app.post("/predict")
-def predict_horoscope(d: BirthDetails):
+def predict_horoscope(d: BirthDetails, dasha_depth: int = Query(1, ge=1, le=4)):
+    """
+    dasha_depth: dasha tree levels to include (1 = Mahadashas only; 4 = full tree).
+    """
     try:
-        # A. Calculate Chart
+        # A. Calculate Chart (house numbers included; read-only, possibly cached). Same
+        # ayanamsa as /dasha/expand, so the dasha paths below index the same timeline
         chart = astro_engine.calculate_chart(
             d.year,
             d.month,
@@ -172,18 +269,14 @@ def predict_horoscope(d: BirthDetails):
             d.latitude,
             d.longitude,
             d.timezone,
+            d.ayanamsa,
         )
-        asc_id = chart["Ascendant"]["sign_id"]
-
-        # B. Assign House Numbers
-        for p, data in chart.items():
-            if p != "Ascendant":
-                data["house_number"] = (data["sign_id"] - asc_id) % 12 + 1
+        asc_id = chart.ascendant.sign_id
 
         # C. DL Score
         score = 50
         try:
-            score = int(destiny_model(get_dl_vector(chart)).item() * 100)
+            score = destiny_scorer.get()(chart)
         except:
             pass
 
@@ -192,58 +285,39 @@ def predict_horoscope(d: BirthDetails):
 
         # E. DASHA CALCULATION
         dasha_data = {"timeline": [], "current": {}}
-        if "Moon" in chart:
-            moon_deg = chart["Moon"]["absolute_longitude"]
+        if chart.positions[Planet.MOON] is not None:
+            moon = chart.positions[Planet.MOON]
             birth_dt = datetime(d.year, d.month, d.day, d.hour, d.minute)
 
-            raw_timeline = dasha_engine.calculate_dashas(moon_deg, birth_dt)
-            raw_current = dasha_engine.get_current_dasha_details(raw_timeline)
-
-            def serialize_node(node):
-                obj = {
-                    "lord": node["lord"],
-                    "start": node["start"].strftime("%Y-%m-%d"),
-                    "end": node["end"].strftime("%Y-%m-%d"),
-                    "type": node.get("type", "Unknown"),
-                }
-                if "sub_periods" in node and node["sub_periods"]:
-                    obj["sub_periods"] = [
-                        serialize_node(child) for child in node["sub_periods"]
-                    ]
-                return obj
-
-            dasha_data["timeline"] = [serialize_node(md) for md in raw_timeline]
-
-            if raw_current:
-                for k, v in raw_current.items():
-                    dasha_data["current"][k] = {
-                        "lord": v["lord"],
-                        "start": v["start"].strftime("%Y-%m-%d"),
-                        "end": v["end"].strftime("%Y-%m-%d"),
-                    }
+            timeline = dasha_engine.calculate_timeline(
+                moon.absolute_longitude, birth_dt, nakshatra_id=moon.nakshatra_id
+            )
+            raw_timeline = timeline.to_tree(depth=dasha_depth)
+            raw_current = timeline.current()
+
+            # Deeper levels are fetched on demand from /dasha/expand using each node's "path"
+            dasha_data["timeline"] = [
+                serialize_dasha_node(md, f"md={i}") for i, md in enumerate(raw_timeline)
+            ]
+
+            dasha_data["current"] = serialize_dasha_current(raw_current)
 
         # F. YOGA CALCULATION
         yogas = yoga_engine.check_yogas(chart)
 
-        # G. AI Generation
+        # G. JAIMINI (karakas, arudha padas, upapada) in one pass
+        jaimini = jaimini_analysis(chart)
+
+        # H. AI Generation
         meta = {
             "fact_sheet": fact_sheet,
-            "ascendant_sign": [
-                "Aries",
-                "Taurus",
-                "Gemini",
-                "Cancer",
-                "Leo",
-                "Virgo",
-                "Libra",
-                "Scorpio",
-                "Sagittarius",
-                "Capricorn",
-                "Aquarius",
-                "Pisces",
-            ][asc_id],
+            "ascendant_sign": SIGN_NAMES[asc_id],
             "destiny_score": score,
-            "house_structure": {},
+            # Same shape the knowledge graph expects: {"House 1": {"Sign": ..., "Ruler": ...}}
+            "house_structure": {
+                f"House {h}": {"Sign": SIGN_NAMES[(asc_id + h - 1) % 12], "Ruler": lord.label}
+                for h, lord in enumerate(chart.house_lords, start=1)
+            },
         }
         ai_reading = generate_horoscope_reading(rules, meta)
 
@@ -254,7 +328,8 @@ def predict_horoscope(d: BirthDetails):
             "ai_reading": ai_reading,
             "dasha": dasha_data,
             "yogas": yogas,
-            "jaimini_karakas": {},
+            "jaimini_karakas": jaimini["karakas"],
+            "jaimini": jaimini,
         }
 
     except Exception as e:
@@ -264,6 +339,187 @@ def predict_horoscope(d: BirthDetails):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Maintain backward compatibility with /calculate for the frontend: its TimelineViewer
+# renders each Mahadasha's sub_periods, so Antardashas are included by default
+@app.post("/calculate", response_model=ChartResponse)
+def calculate_horoscope(d: BirthDetails, dasha_depth: int = Query(2, ge=1, le=4)):
+    return predict_horoscope(d, dasha_depth)
+
+
+@app.get("/ready")
+def ready():
+    """
+    Readiness probe: 200 once the lazy subsystems are loaded, 503 while warming up
+    (always 200 in "lazy" mode, where loading on first use is intended).
+    Astronomy endpoints work before that; the first /predict or /chart-image may be slower.
+    """
+    subsystems = {r.name: r.status() for r in HEAVY_RESOURCES}
+    is_ready = all(r.state == "ready" for r in HEAVY_RESOURCES)
+    return JSONResponse(
+        {"ready": is_ready, "startup_mode": STARTUP_MODE, "subsystems": subsystems},
+        status_code=200 if is_ready or STARTUP_MODE == "lazy" else 503,
+    )
+
+
+@app.post("/calculate/batch", response_model=BatchChartResponse)
+def calculate_batch(r: BatchBirthDetails):
+    """
+    Columnar chart calculation for up to 1000 births per call.
+    """
+    births = r.births
+    cols = astro_engine.calculate_charts_batch(
+        [b.year for b in births],
+        [b.month for b in births],
+        [b.day for b in births],
+        [b.hour for b in births],
+        [b.minute for b in births],
+        [b.latitude for b in births],
+        [b.longitude for b in births],
+        [b.timezone for b in births],
+        [b.ayanamsa for b in births],
+    )
+    return {
+        "count": len(births),
+        "planets": cols["planets"],
+        "absolute_longitude": cols["absolute_longitude"].tolist(),
+        "sign_id": cols["sign_id"].tolist(),
+        "degree": cols["degree"].tolist(),
+        "d9_sign_id": cols["d9_sign_id"].tolist(),
+        "is_retrograde": cols["is_retrograde"].tolist(),
+        "house_number": cols["house_number"].tolist(),
+        "ascendant": {k: v.tolist() for k, v in cols["ascendant"].items()},
+    }
+
+
+@app.post("/analyze/batch")
+async def analyze_batch(r: BatchBirthDetails):
+    """
+    Bulk chart + running dasha + yoga summary. Uses the process pool when configured.
+    """
+    births = pack_births(
+        [b.year for b in r.births],
+        [b.month for b in r.births],
+        [b.day for b in r.births],
+        [b.hour for b in r.births],
+        [b.minute for b in r.births],
+        [b.latitude for b in r.births],
+        [b.longitude for b in r.births],
+        [b.timezone for b in r.births],
+        [b.ayanamsa for b in r.births],
+    )
+    if chart_pool is not None:
+        results = await chart_pool.calculate(births)
+    else:
+        raw = await run_in_threadpool(
+            process_births, births.tobytes(), datetime.now().timestamp()
+        )
+        results = ChartWorkerPool._collect([raw])
+
+    lords = dasha_engine.DASHA_ORDER
+    yoga_names = yoga_engine.YOGA_NAMES
+    return [
+        {
+            "ascendant_sign_id": int(row["asc_sign_id"]),
+            "sign_id": row["sign_id"].tolist(),
+            "house_number": row["house_number"].tolist(),
+            "mahadasha": lords[row["mahadasha"]] if row["mahadasha"] >= 0 else None,
+            "antardasha": lords[row["antardasha"]] if row["antardasha"] >= 0 else None,
+            "yogas": [yoga_names[i] for i in np.flatnonzero(np.unpackbits(row["yoga_bits"], bitorder="little")[:len(yoga_names)])],
+        }
+        for row in results
+    ]
+
+
+@app.post("/dasha/expand")
+def dasha_expand(d: BirthDetails, path: str = "", system: str = "vimshottari"):
+    """
+    Children of one dasha node, one level deep. path: "" (Mahadashas), "md=3",
+    "md=3/ad=5", "md=3/ad=5/pd=1" (0-based indices as listed by /predict or this endpoint).
+    system: any of /dasha/systems (default vimshottari).
+    """
+    try:
+        indices = parse_dasha_path(path)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    timeline = dasha_system_timeline(d, system)
+    try:
+        periods = timeline.expand(indices)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    path = "/".join(f"{k}={i}" for k, i in zip(PATH_KEYS, indices))
+    # Only levels that have children of their own get a path (Chara stops at Pratyantardasha)
+    expandable = len(indices) < min(len(PATH_KEYS), timeline.template.depth - 1)
+    key = PATH_KEYS[len(indices)] if expandable else None
+    prefix = f"{path}/" if path else ""
+    return {
+        "path": path,
+        "periods": [
+            serialize_dasha_node(p, f"{prefix}{key}={i}" if key else None)
+            for i, p in enumerate(periods)
+        ],
+    }
+
+
+MAX_DASHA_POINTS = 100000
+
+
+@app.post("/dasha/at", response_model=DashaQueryResponse)
+def dasha_at(r: DashaQueryRequest):
+    """
+    Running Maha/Antar/Pratyantar/Sookshma lords at many dates, computed from the
+    Moon longitude and birth instant without building the dasha tree.
+    """
+    if r.dates is not None:
+        dates = np.array([birth_local(date, r.timezone) for date in r.dates], dtype="datetime64[us]")
+    elif r.start is not None and r.end is not None:
+        start = np.datetime64(birth_local(r.start, r.timezone), "us")
+        end = np.datetime64(birth_local(r.end, r.timezone), "us")
+        step = np.timedelta64(int(round(r.step_days * 86400e6)), "us")
+        count = (end - start) / step
+        if count > MAX_DASHA_POINTS:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_DASHA_POINTS} dates per query")
+        dates = np.arange(start, end, step)
+    else:
+        raise HTTPException(status_code=400, detail="Provide 'dates' or 'start' and 'end'")
+    if len(dates) > MAX_DASHA_POINTS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_DASHA_POINTS} dates per query")
+
+    lords = dasha_system_timeline(r, r.system).lords_at(dates)
+    return {"dates": dates.tolist(), **lords}
+
+
+@app.post("/dasha/systems")
+def dasha_systems(r: DashaSystemsRequest):
+    """
+    Every requested dasha system (default: all) for one chart in one call: Mahadashas
+    (expandable through /dasha/expand?system=...) and the periods running at `date`.
+    """
+    chart = astro_engine.calculate_chart(
+        r.year, r.month, r.day, r.hour, r.minute, r.latitude, r.longitude, r.timezone, r.ayanamsa
+    )
+    birth_dt = datetime(r.year, r.month, r.day, r.hour, r.minute)
+    try:
+        timelines = dasha_timelines(chart, birth_dt, r.systems)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    target = birth_local(r.date, r.timezone) or datetime.now()
+    return {
+        "systems": {
+            name: {
+                "timeline": [
+                    serialize_dasha_node(md, f"md={i}")
+                    for i, md in enumerate(timeline.to_tree(depth=1))
+                ],
+                "current": serialize_dasha_current(timeline.current(target)),
+            }
+            for name, timeline in timelines.items()
+        }
+    }
+
+
 @app.post("/daily_forecast")
 def daily_forecast(d: BirthDetails):
     c = astro_engine.calculate_chart(
@@ -276,6 +532,274 @@ def daily_forecast(d: BirthDetails):
     }
 
 
+# Request bodies above this spill from memory to a temporary file
+SPOOL_BYTES = 16 * 1024 * 1024
+
+
+@app.post("/daily_forecast/batch")
+async def daily_forecast_batch(
+    request: Request,
+    predictions: bool = False,
+    chunk_size: int = Query(CHUNK_SIZE, ge=1, le=100000),
+):
+    """
+    Bulk subscriber forecasts. Body: NDJSON, one subscriber per line, either birth details
+    or stored {"id", "ascendant_sign_id", "moon_sign_id"}. Response: NDJSON, a sky header
+    line and then one line per subscriber, all against the same sky snapshot.
+    """
+    # The body is spooled first (disk beyond SPOOL_BYTES) so the response can stream
+    # without holding every subscriber in memory
+    body = tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES)
+    async for block in request.stream():
+        body.write(block)
+    body.seek(0)
+
+    def lines():
+        with body:
+            yield from body
+
+    forecaster = BatchForecaster(transit_engine, predictions=predictions)
+    return StreamingResponse(
+        forecaster.stream(lines(), chunk_size=chunk_size), media_type="application/x-ndjson"
+    )
+
+
+MAX_EVENTS = 20000
+
+
+def require_event_catalog():
+    if event_catalog is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Event catalog not built (run `python -m src.astronomy.events`)",
+        )
+    return event_catalog
+
+
+def parse_name_list(value, names, label):
+    """
+    "Saturn,jupiter" -> [6, 4] (indices into names); empty -> every index. 400 on unknown names.
+    """
+    if not value:
+        return list(range(len(names)))
+    lookup = {n.lower(): i for i, n in enumerate(names)}
+    indices = []
+    for item in value.split(","):
+        if item.strip().lower() not in lookup:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown {label} '{item.strip()}' (expected: {', '.join(names)})",
+            )
+        indices.append(lookup[item.strip().lower()])
+    return indices
+
+
+def local_to_jd(dt, tz):
+    return float(datetime64_to_jd(np.datetime64(dt, "ms"))) - tz / 24.0
+
+
+@app.get("/events")
+def list_events(
+    start: datetime,
+    end: datetime,
+    planets: str = "",
+    kinds: str = "",
+    tz: float = 0.0,
+    limit: int = Query(MAX_EVENTS, ge=1, le=MAX_EVENTS),
+):
+    """
+    Ingress / station calendar from the precomputed event catalog.
+    start, end: local time at `tz` (hours from UTC); planets, kinds: comma-separated
+    (kinds: sign, nakshatra, pada, retrograde, direct; default: all).
+    """
+    catalog = require_event_catalog()
+    events = catalog.between(
+        local_to_jd(start, tz),
+        local_to_jd(end, tz),
+        parse_name_list(planets, PLANET_NAMES, "planet"),
+        parse_name_list(kinds, EVENT_KINDS, "event kind"),
+    )
+    return {
+        "ayanamsa": catalog.ayanamsa,
+        "count": len(events),
+        "truncated": len(events) > limit,
+        "events": catalog.describe(events[:limit], tz),
+    }
+
+
+@app.get("/events/next")
+def next_event(
+    planet: str,
+    kind: str = "sign",
+    index: Optional[int] = None,
+    after: Optional[datetime] = None,
+    tz: float = 0.0,
+):
+    """
+    Next event of one kind for a planet, e.g. planet=Saturn&kind=sign&index=11 (enters Pisces).
+    index: sign (0-11), nakshatra (0-26) or pada (0-107) entered. after: local time (default now).
+    """
+    catalog = require_event_catalog()
+    body = parse_name_list(planet, PLANET_NAMES, "planet")[0]
+    kind_id = parse_name_list(kind, EVENT_KINDS, "event kind")[0]
+    jd = local_to_jd(after, tz) if after else local_to_jd(datetime.utcnow(), 0.0)
+    event = catalog.next_event(body, kind_id, jd, index)
+    if event is None:
+        raise HTTPException(status_code=404, detail="No such event in the catalog range")
+    return catalog.describe(event, tz)[0]
+
+
+@app.post("/transits/windows")
+def transit_windows(d: BirthDetails, years: int = Query(100, ge=1, le=120), windows: str = ""):
+    """
+    Lifetime Saturn / Jupiter transit windows (Sade Sati, Ashtama and Kantaka Shani, returns,
+    transits over the Moon and Lagna) from exact catalog ingresses, plus every sign stay of
+    both grahas with its house from the Moon and Lagna. windows: comma-separated subset of
+    the window names (default: all). Times are local at the birth timezone.
+    """
+    catalog = require_event_catalog()
+    # Natal signs in the catalog's ayanamsa, so natal and transit signs share one zodiac
+    chart = astro_engine.calculate_chart(
+        d.year, d.month, d.day, d.hour, d.minute, d.latitude, d.longitude, d.timezone, catalog.ayanamsa
+    )
+    natal = {
+        "moon": chart[Planet.MOON].sign_id,
+        "lagna": chart.ascendant.sign_id,
+        "saturn": chart[Planet.SATURN].sign_id,
+        "jupiter": chart[Planet.JUPITER].sign_id,
+    }
+    start_jd = local_to_jd(datetime(d.year, d.month, d.day, d.hour, d.minute), d.timezone)
+    wanted = [WINDOW_NAMES[i] for i in parse_name_list(windows, WINDOW_NAMES, "window")]
+    result = window_finder.find(natal, start_jd, years, d.timezone, wanted)
+    return {
+        "ayanamsa": catalog.ayanamsa,
+        "natal": {k: SIGN_NAMES[v] for k, v in natal.items()},
+        "start": result["start"],
+        "end": result["end"],
+        "windows": result["windows"],
+        "transits": result["transits"],
+    }
+
+
+@app.post("/upagrahas")
+def upagrahas(d: BirthDetails):
+    """
+    Kaala, Mrityu, Ardhaprahara, Yamaghantaka, Gulika and Mandi for a birth, each with its
+    rising time (local), longitude and house from the natal Lagna. Sunrise / sunset come from
+    a per-(date, location cell) cache, so repeated births in one city and day are cheap.
+    """
+    try:
+        result = upagraha_engine.calculate(
+            d.year, d.month, d.day, d.hour, d.minute, d.latitude, d.longitude, d.timezone, d.ayanamsa
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    chart = astro_engine.calculate_chart(
+        d.year, d.month, d.day, d.hour, d.minute, d.latitude, d.longitude, d.timezone, d.ayanamsa
+    )
+    for upagraha in result["upagrahas"].values():
+        upagraha["house"] = (upagraha["sign_id"] - chart.ascendant.sign_id) % 12 + 1
+    return result
+
+
+@app.post("/panchang")
+def panchang(r: PanchangRequest, format: str = Query("ndjson", pattern="^(ndjson|parquet)$")):
+    """
+    Bulk Panchang: every date of the year for each location (tithi, nakshatra, yoga and karana
+    with end times, sunrise / sunset, Rahu Kaal, 24 horas). NDJSON streams one line per city-day
+    (a city where the Sun does not rise or set gets one {"city", "error"} line); Parquet is
+    one table of city-days and needs pyarrow, with such cities listed in the X-Panchang-Errors
+    header (and the file's "errors" metadata) instead.
+    """
+    records = panchang_engine.stream(r.year, [loc.model_dump() for loc in r.locations], r.ayanamsa)
+    if format == "ndjson":
+        return StreamingResponse(ndjson_chunks(records), media_type="application/x-ndjson")
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise HTTPException(status_code=503, detail="Parquet output needs pyarrow (pip install pyarrow)")
+    sink = io.BytesIO()
+    errors = to_parquet(records, sink)
+    headers = {"X-Panchang-Errors": json.dumps(errors)} if errors else None
+    return Response(sink.getvalue(), media_type="application/vnd.apache.parquet", headers=headers)
+
+
+# Timeline events per NDJSON chunk handed to the response stream
+TIMELINE_BATCH = 500
+
+
+def ndjson_chunks(records, batch=TIMELINE_BATCH):
+    """
+    dicts -> NDJSON text, `batch` lines per chunk (datetimes as ISO 8601).
+    """
+    lines = []
+    for record in records:
+        lines.append(json.dumps(record, default=lambda o: o.isoformat()) + "\n")
+        if len(lines) >= batch:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+
+@app.post("/timeline")
+def life_timeline(
+    d: BirthDetails,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    sources: str = "",
+    system: str = "vimshottari",
+    depth: int = Query(3, ge=1, le=4),
+    limit: Optional[int] = Query(None, ge=1),
+):
+    """
+    One chronological NDJSON stream of dasha period starts (down to `depth` levels) and, with
+    the event catalog, slow-graha ingresses into natal houses and stations. start / end: local
+    time at the birth timezone, offset-aware values converted to it (default: birth to the end
+    of the dashas); sources: comma-separated subset of dasha, ingress, station. Nothing is
+    materialized: to page, pass the last event's time as the next start (events at exactly
+    that time are repeated).
+    """
+    wanted = [TIMELINE_SOURCES[i] for i in parse_name_list(sources, TIMELINE_SOURCES, "source")]
+    catalog = require_event_catalog() if wanted != ["dasha"] else event_catalog
+    timeline = dasha_system_timeline(d, system)
+    natal = None
+    if catalog is not None:
+        # Transit houses in the catalog's zodiac (same chart when the ayanamsas agree)
+        chart = astro_engine.calculate_chart(
+            d.year, d.month, d.day, d.hour, d.minute, d.latitude, d.longitude, d.timezone, catalog.ayanamsa
+        )
+        natal = {"lagna": chart.ascendant.sign_id, "moon": chart[Planet.MOON].sign_id}
+
+    # Before streaming starts: errors inside the generator would come after a 200 header
+    start, end = birth_local(start, d.timezone), birth_local(end, d.timezone)
+    events = LifeTimeline(timeline, natal, catalog, d.timezone).events(start, end, wanted, depth)
+    return StreamingResponse(ndjson_chunks(islice(events, limit)), media_type="application/x-ndjson")
+
+
+@app.post("/rectify", response_model=RectificationResponse)
+def rectify(r: RectificationRequest):
+    """
+    Birth-time rectification: the exact sub-intervals of birth time +/- window_minutes
+    with an unchanged lagna, navamsa lagna and Moon nakshatra/pada.
+    """
+    try:
+        return rectification_engine.sweep(
+            r.year,
+            r.month,
+            r.day,
+            r.hour,
+            r.minute,
+            r.latitude,
+            r.longitude,
+            r.timezone,
+            window_minutes=r.window_minutes,
+            ayanamsa_mode=r.ayanamsa,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 class MatchRequest(BaseModel):
     p1: BirthDetails
     p2: BirthDetails
@@ -304,7 +828,7 @@ def match_charts(r: MatchRequest):
         r.p2.timezone,
     )
     analysis = match_engine.calculate_compatibility(c1, c2)
-    prompt = f"Analyze compatibility. P1 Ascendant: {c1['Ascendant']['sign_id']}, P2 Ascendant: {c2['Ascendant']['sign_id']}. Analysis: {analysis}"
+    prompt = f"Analyze compatibility. P1 Ascendant: {c1.ascendant.sign_id}, P2 Ascendant: {c2.ascendant.sign_id}. Analysis: {analysis}"
     verdict = chat_with_astrologer(prompt, "Relationship Context")
     return {"analysis": analysis, "ai_verdict": verdict}
 
@@ -322,30 +846,25 @@ def chat_endpoint(r: ChatRequest):
 @app.post("/chart-image")
 def get_chart_image(style: str, d: BirthDetails):
     """
-    Generates a D1 or D9 chart image.
-    Query param: style ('d1' or 'd9')
+    Generates a divisional chart image.
+    Query param: style ('d1', 'd9', ... any Shodashavarga 'd2'-'d60')
     Body: BirthDetails
     """
+    style = style.lower()
+    division = int(style[1:]) if style[:1] == "d" and style[1:].isdigit() else 0
+    if division not in VARGA_NAMES:
+        raise HTTPException(status_code=400, detail=f"Unknown chart style '{style}'")
+
     # Calculate Chart
     chart = astro_engine.calculate_chart(
         d.year, d.month, d.day, d.hour, d.minute, d.latitude, d.longitude, d.timezone
     )
 
-    if style.lower() == "d9":
-        # Prepare data for D9 (Navamsa)
-        d9_planets = {}
-        asc_id = chart["Ascendant"]["d9_sign_id"]
-        for p, info in chart.items():
-            # For D9, we use the D9 sign ID as the 'sign_id' for plotting
-            d9_planets[p] = {
-                "sign_id": info["d9_sign_id"],
-                "is_retrograde": info.get("is_retrograde", False),
-            }
-        buf = draw_north_indian_chart(d9_planets, asc_id, "D9 Navamsa")
-    else:
-        # Prepare data for D1 (Rashi)
-        asc_id = chart["Ascendant"]["sign_id"]
-        buf = draw_north_indian_chart(chart, asc_id, "D1 Rashi")
+    # For a varga, its sign IDs replace the D1 sign IDs for plotting
+    if division != 1:
+        chart = astro_engine.varga_chart(chart, division)
+    asc_id = chart.ascendant.sign_id
+    buf = chart_renderer.get()(chart, asc_id, f"D{division} {VARGA_NAMES[division]}")
 
     return StreamingResponse(buf, media_type="image/png")
 
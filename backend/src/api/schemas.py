@@ -1,3 +1,4 @@
+from datetime import datetime
 from pydantic import BaseModel, Field
 from typing import Dict, Any, Optional, List, Union
 
@@ -18,6 +19,10 @@ class BirthDetails(BaseModel):
     ayanamsa: str = Field("LAHIRI")
 
 
+class BatchBirthDetails(BaseModel):
+    births: List[BirthDetails] = Field(..., min_length=1, max_length=1000)
+
+
 class PlanetData(BaseModel):
     id: Optional[int] = None
     absolute_longitude: float
@@ -28,13 +33,111 @@ class PlanetData(BaseModel):
     d9_sign_id: Optional[int] = None
     house_number: Optional[int] = None
     speed: Optional[float] = None
+    nakshatra_id: Optional[int] = None
+    pada: Optional[int] = None
+    house_from_moon: Optional[int] = None
+    dignity: Optional[str] = None
 
 
 class ChartResponse(BaseModel):
     meta: Dict[str, Any]
     planets: Dict[str, PlanetData]
     jaimini_karakas: Dict[str, Any]
+    jaimini: Optional[Dict[str, Any]] = None
     predictions: List[Dict[str, Any]]
     ai_reading: Optional[Union[Dict[str, str], str]] = None
     dasha: Optional[Dict[str, Any]] = None
     yogas: Optional[List[Dict[str, Any]]] = None
+
+
+class BatchAscendantData(BaseModel):
+    absolute_longitude: List[float]
+    sign_id: List[int]
+    degree: List[float]
+    d9_sign_id: List[int]
+
+
+class BatchChartResponse(BaseModel):
+    """
+    Columnar batch result: row i of every 2D column is births[i],
+    column j is planets[j].
+    """
+
+    count: int
+    planets: List[str]
+    absolute_longitude: List[List[float]]
+    sign_id: List[List[int]]
+    degree: List[List[float]]
+    d9_sign_id: List[List[int]]
+    is_retrograde: List[List[bool]]
+    house_number: List[List[int]]
+    ascendant: BatchAscendantData
+
+
+class RectificationRequest(BirthDetails):
+    window_minutes: int = Field(
+        30, ge=1, le=720, description="Sweep birth time +/- this many minutes"
+    )
+
+
+class RectificationInterval(BaseModel):
+    start: datetime
+    end: datetime
+    lagna_sign_id: int
+    navamsa_lagna_sign_id: int
+    moon_nakshatra_id: int
+    moon_pada: int
+    birth_dasha_lord: str
+
+
+class RectificationResponse(BaseModel):
+    """
+    Local-time sub-intervals of the window over which lagna, navamsa lagna and
+    Moon nakshatra/pada do not change.
+    """
+
+    window_start: datetime
+    window_end: datetime
+    intervals: List[RectificationInterval]
+    evaluations: Dict[str, int]
+
+
+class DashaQueryRequest(BirthDetails):
+    """
+    Either an explicit list of dates, or start + end (exclusive) + step_days.
+    Dates are local time, like the birth details; offset-aware dates are converted to it.
+    """
+
+    dates: Optional[List[datetime]] = None
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    step_days: float = Field(1.0, gt=0)
+    system: str = Field("vimshottari", description="vimshottari, yogini, ashtottari or chara")
+
+
+class DashaQueryResponse(BaseModel):
+    dates: List[datetime]
+    mahadasha: List[Optional[str]]
+    antardasha: List[Optional[str]]
+    pratyantardasha: List[Optional[str]]
+    sookshmadasha: Optional[List[Optional[str]]] = None  # not in Chara dasha
+
+
+class DashaSystemsRequest(BirthDetails):
+    systems: Optional[List[str]] = Field(None, description="Default: every system")
+    date: Optional[datetime] = Field(
+        None, description="Reference date for 'current', local time like the birth (default: now)"
+    )
+
+
+class PanchangLocation(BaseModel):
+    name: Optional[str] = Field(None, example="Delhi")
+    latitude: float = Field(..., ge=-90, le=90, example=28.61)
+    longitude: float = Field(..., ge=-180, le=180, example=77.20)
+    timezone: float = Field(..., example=5.5)
+
+
+class PanchangRequest(BaseModel):
+    year: int = Field(..., ge=1900, le=2100, example=2025)
+    locations: List[PanchangLocation] = Field(..., min_length=1, max_length=100)
+    ayanamsa: str = Field("LAHIRI")
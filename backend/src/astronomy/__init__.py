@@ -1,5 +1,5 @@
 from .engine import VedicAstroEngine
-from .vargas import calculate_d9_navamsa
+from .vargas import calculate_d9_navamsa, calculate_vargas
 from .jaimini import get_chara_karakas
 from .ayanamsa import AyanamsaSystem
 
@@ -7,6 +7,7 @@ from .ayanamsa import AyanamsaSystem
 __all__ = [
     "VedicAstroEngine",
     "calculate_d9_navamsa",
+    "calculate_vargas",
     "get_chara_karakas",
     "AyanamsaSystem"
 ]
\ No newline at end of file
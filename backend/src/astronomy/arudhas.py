@@ -1,58 +1,94 @@
 # src/astronomy/arudhas.py
+from .chart import Planet, as_chart
+from .tables import KETU, MARS, RAHU, SATURN, SIGN_LORD, SIGN_NAMES
 
-def calculate_arudha_padas(chart_data, house_structure):
+SCORPIO, AQUARIUS = 7, 10
+
+# Dual lordship (Jaimini): Scorpio and Aquarius are also ruled by Ketu and Rahu
+SIGN_CO_LORDS = {SCORPIO: (MARS, KETU), AQUARIUS: (SATURN, RAHU)}
+
+# ARUDHA[sign][lord sign] -> pada sign: count from the sign to its lord, the same count again
+# from the lord. Exceptions (Jaimini): a pada falling in the sign itself or in its 7th moves
+# to the 10th from there (sign + 9 or sign + 3).
+ARUDHA = [[(2 * lord - sign) % 12 for lord in range(12)] for sign in range(12)]
+for _sign in range(12):
+    for _lord in range(12):
+        _pada = ARUDHA[_sign][_lord]
+        if _pada == _sign or _pada == (_sign + 6) % 12:
+            ARUDHA[_sign][_lord] = (_pada + 9) % 12
+
+# Sign modality as strength (dual > fixed > movable), for the co-lord tie-break
+SIGN_STRENGTH = [s % 3 for s in range(12)]  # 0 movable, 1 fixed, 2 dual
+
+
+def sign_lords(positions):
+    """
+    Lord of each sign for Jaimini counts (12 Planets). For Scorpio / Aquarius the stronger of the
+    two lords: the one outside the sign if the other occupies it; else the one with more
+    grahas; else the one in the stronger sign (dual > fixed > movable); else the one further
+    advanced in its sign (Rahu / Ketu move backwards: 30 - degree).
+    """
+    lords = list(SIGN_LORD)
+    occupants = [0] * 12
+    for pos in positions[:Planet.ASCENDANT]:
+        if pos is not None:
+            occupants[pos.sign_id] += 1
+
+    for sign, pair in SIGN_CO_LORDS.items():
+        keys = []
+        for lord in pair:
+            pos = positions[lord]
+            if pos is None:
+                keys.append(None)
+                continue
+            advanced = 30.0 - pos.degree if lord in (RAHU, KETU) else pos.degree
+            keys.append((pos.sign_id != sign, occupants[pos.sign_id], SIGN_STRENGTH[pos.sign_id], advanced))
+        if keys[0] is None or (keys[1] is not None and keys[1] > keys[0]):
+            lords[sign] = pair[1]
+        else:
+            lords[sign] = pair[0]
+    return lords
+
+
+def arudha_signs(chart_data, lords=None):
+    """
+    Pada sign of houses 1-12 (index 0 = A1 ... 11 = A12 / Upapada) via the ARUDHA table,
+    None where the house lord is missing. lords: sign_lords() if already computed.
+    """
+    chart = as_chart(chart_data)
+    positions = chart.positions
+    asc = chart.ascendant
+    if asc is None:
+        return [None] * 12
+    if lords is None:
+        lords = sign_lords(positions)
+
+    padas = []
+    for h in range(12):
+        sign = (asc.sign_id + h) % 12
+        lord = positions[lords[sign]]
+        padas.append(None if lord is None else ARUDHA[sign][lord.sign_id])
+    return padas
+
+
+def calculate_arudha_padas(chart_data, house_structure=None):
     """
     Calculates Jaimini Arudha Padas (A1 to A12).
     A7 (Darapada) = Arudha of 7th House.
     A12 (Upapada) = Arudha of 12th House (often used for marriage longevity).
+    house_structure is unused (the lordship comes from the chart).
     """
     padas = {}
-    
-    # We need to find the Lord of every house first
-    # (You already have a RULER_MAP in main.py, best to move it to a shared utility)
-    SIGN_RULERS = {
-        "Aries": "Mars", "Taurus": "Venus", "Gemini": "Mercury", "Cancer": "Moon",
-        "Leo": "Sun", "Virgo": "Mercury", "Libra": "Venus", "Scorpio": "Mars", # classic lordship
-        "Sagittarius": "Jupiter", "Capricorn": "Saturn", "Aquarius": "Saturn", "Pisces": "Jupiter"
-    }
-
-    asc_sign_id = chart_data["Ascendant"]["sign_id"]
-
-    for h in range(1, 13):
-        # 1. Determine Sign in House H
-        sign_in_house_id = (asc_sign_id + h - 1) % 12
-        
-        # Helper to get sign name by ID (Needs your sign list)
-        signs = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo", 
-                 "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
-        sign_name = signs[sign_in_house_id]
-        
-        # 2. Find the Lord of that Sign
-        lord_name = SIGN_RULERS[sign_name]
-        if lord_name not in chart_data: continue # Skip if data missing
-        
-        lord_sign_id = chart_data[lord_name]["sign_id"]
-        
-        # 3. Count distance from House to Lord
-        # Logic: If House 1 is Aries, and Mars is in Gemini.
-        # Aries (0) -> Gemini (2). Distance = 3 signs (1, 2, 3 inclusive)
-        dist = (lord_sign_id - sign_in_house_id) % 12
-        if dist < 0: dist += 12
-        
-        # 4. Count same distance again to find Arudha
-        arudha_sign_id = (lord_sign_id + dist) % 12
-        
-        # 5. Jaimini Exceptions (Swasthe Daraha - 4th/10th rule)
-        # If Arudha falls in same sign or 7th from it, shifts occur. 
-        # (Simplified logic here for brevity, you should implement full Jaimini Sutra rules)
-        
+    for h, sign in enumerate(arudha_signs(chart_data), start=1):
+        if sign is None: continue # Skip if data missing
+
         arudha_name = f"A{h}"
         if h == 12: arudha_name = "UL (Upapada)"
         if h == 7: arudha_name = "A7 (Darapada)"
-        
+
         padas[arudha_name] = {
-            "sign": signs[arudha_sign_id],
-            "sign_id": arudha_sign_id
+            "sign": SIGN_NAMES[sign],
+            "sign_id": sign
         }
-        
-    return padas
\ No newline at end of file
+
+    return padas
@@ -1,44 +1,121 @@
 # src/astronomy/aspects.py
+import numpy as np
+from .chart import CHART_KEYS, Planet, as_chart
+from .tables import JUPITER, MARS, RAHU, SATURN
+
+# Standard Parashari Aspect Rules (houses counted from the graha itself = 1st).
+# Every graha aspects the 7th; Mars 4, 7, 8; Jupiter 5, 7, 9; Saturn 3, 7, 10.
+# Rahu is taken like Jupiter (as in some traditions); Ketu casts none.
+ASPECT_RULES = [[7], [7], [4, 7, 8], [7], [5, 7, 9], [7], [3, 7, 10], [5, 7, 9], []]
+
+# SIGN_ASPECT[graha][(target sign - graha sign) % 12]: the rules as a sign-offset mask
+SIGN_ASPECT = np.zeros((9, 12), dtype=bool)
+for _graha, _houses in enumerate(ASPECT_RULES):
+    SIGN_ASPECT[_graha, [h - 1 for h in _houses]] = True
+CASTS_DRISHTI = SIGN_ASPECT.any(axis=1)
+
+# Degree-based Drishti (BPHS), in virupas (60 = full): piecewise linear in the angular
+# distance d = target - graha (0-360), peaking at 60 for the 7th (d = 180)
+VIRUPA_DISTANCE = [0, 30, 60, 90, 120, 150, 180, 300, 360]
+VIRUPA_STRENGTH = [0, 0, 15, 45, 30, 0, 60, 0, 0]
+
+# Special aspects: VIRUPA_BONUS[graha][d // 30] is added (capped at 60), which makes Mars' 4th/8th,
+# Jupiter's 5th/9th and Saturn's 3rd/10th full where the common curve gives 45 / 30 / 15
+VIRUPA_BONUS = np.zeros((9, 12))
+VIRUPA_BONUS[MARS, [3, 7]] = 15
+VIRUPA_BONUS[JUPITER, [4, 8]] = 30
+VIRUPA_BONUS[SATURN, [2, 9]] = 45
+VIRUPA_BONUS[RAHU] = VIRUPA_BONUS[JUPITER]
+FULL_VIRUPAS = 60.0
+
+# The capped curve is linear within each 30-degree segment, so it is tabulated per graha and
+# segment: virupas = VIRUPA_START[i] + VIRUPA_SLOPE[i] * (d - 30 * segment), i = 13 * graha +
+# segment. Segment 12 (d rounding up to 360) repeats segment 0.
+_bounds = np.interp(30.0 * np.arange(13), VIRUPA_DISTANCE, VIRUPA_STRENGTH)
+_start = np.minimum(_bounds[:-1] + VIRUPA_BONUS, FULL_VIRUPAS) * CASTS_DRISHTI[:, None]
+_end = np.minimum(_bounds[1:] + VIRUPA_BONUS, FULL_VIRUPAS) * CASTS_DRISHTI[:, None]
+VIRUPA_START = np.concatenate([_start, _start[:, :1]], axis=1).ravel()
+VIRUPA_SLOPE = np.concatenate([(_end - _start) / 30.0, np.zeros((9, 1))], axis=1).ravel()
+# SIGN_ASPECT twice over, so a sign difference -11..11 indexes it as 24 * graha + 12 + difference
+SIGN_ASPECT_FLAT = np.tile(SIGN_ASPECT, 2).ravel()
+
+GRAHA_ROWS = np.arange(9)[:, None]
+HOUSE_MIDDLES = 30.0 * np.arange(12)
+
+
+def aspect_matrices(longitudes, asc_longitudes):
+    """
+    Aspect matrices for a batch of charts at once (e.g. calculate_charts_batch's
+    absolute_longitude and ascendant absolute_longitude).
+    longitudes: (n, 9) sidereal graha longitudes (NaN = missing graha); asc_longitudes: (n,)
+    Returns arrays indexed [chart, aspecting graha, target]:
+        planet_aspects (n, 9, 9)  sign aspects on grahas (bool)
+        planet_virupas (n, 9, 9)  degree-based Drishti on grahas, 0-60 virupas
+        house_aspects  (n, 9, 12) sign aspects on houses 1-12 (whole signs from the lagna)
+        house_virupas  (n, 9, 12) Drishti on each house's middle (ascendant degree + 30 per house)
+    """
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    asc_longitudes = np.asarray(asc_longitudes, dtype=np.float64)
+    # Targets: the 9 grahas, then the 12 house middles; a NaN (missing graha or ascendant)
+    # never aspects or is aspected
+    targets = np.concatenate([longitudes, asc_longitudes[:, None] + HOUSE_MIDDLES], axis=1) % 360.0
+    present = ~np.isnan(targets)
+    targets = np.where(present, targets, 0.0)
+    sources = targets[:, :9]
+    signs = (targets // 30).astype(np.intp)
+
+    # 1. Sign aspects: one lookup in the precomputed sign-offset mask
+    aspects = SIGN_ASPECT_FLAT[(24 * GRAHA_ROWS + 12 - signs[:, :9, None]) + signs[:, None, :]]
+
+    # 2. Virupas: one lookup of the graha's linear piece for the 30-degree segment
+    # (the elementwise work stays in adds / multiplies: no float modulo on the n x 9 x 21 arrays)
+    distance = targets[:, None, :] - sources[:, :, None]
+    distance += 360.0 * (distance < 0)
+    segment = (distance * (1 / 30.0)).astype(np.intp)
+    piece = 13 * GRAHA_ROWS + segment
+    virupas = VIRUPA_START[piece] + VIRUPA_SLOPE[piece] * (distance - 30.0 * segment)
+
+    if not present.all():
+        known = present[:, :9, None] & present[:, None, :]
+        aspects &= known
+        virupas *= known
+
+    return {
+        "planet_aspects": aspects[:, :, :9],
+        "planet_virupas": virupas[:, :, :9],
+        "house_aspects": aspects[:, :, 9:],
+        "house_virupas": virupas[:, :, 9:],
+    }
+
+
+def chart_aspects(chart_data):
+    """
+    aspect_matrices for one chart (Chart or legacy dict): the same keys, without the
+    leading chart axis.
+    """
+    chart = as_chart(chart_data)
+    positions = chart.positions
+    longitudes = [[np.nan if pos is None else pos.absolute_longitude for pos in positions[:Planet.ASCENDANT]]]
+    asc = chart.ascendant
+    matrices = aspect_matrices(longitudes, [np.nan if asc is None else asc.absolute_longitude])
+    return {name: matrix[0] for name, matrix in matrices.items()}
+
 
 def get_planet_aspects(chart_data):
     """
     Calculates Parashari Aspects (Drishti).
-    Returns a list of strings describing interactions.
+    Returns a list of strings describing interactions - a rendering of chart_aspects'
+    planet_aspects for display; use the matrices for anything computed on them.
     """
+    chart = as_chart(chart_data)
+    aspects = chart_aspects(chart)["planet_aspects"]
+    signs = [None if pos is None else pos.absolute_longitude // 30 for pos in chart.positions[:Planet.ASCENDANT]]
+
     aspects_log = []
-    
-    # Standard Parashari Aspect Rules (Offsets from planet position)
-    # Every planet aspects the 7th house from itself.
-    # Mars: 4, 7, 8
-    # Jupiter: 5, 7, 9
-    # Saturn: 3, 7, 10
-    
-    ASPECT_RULES = {
-        "Mars": [4, 7, 8],
-        "Jupiter": [5, 7, 9],
-        "Saturn": [3, 7, 10],
-        "Rahu": [5, 7, 9], # Often considered similar to Jupiter in some traditions
-        "Ketu": [],
-        "Sun": [7], "Moon": [7], "Mercury": [7], "Venus": [7]
-    }
-    
-    for looker_name, looker_data in chart_data.items():
-        if looker_name == "Ascendant" or looker_name == "Ketu": continue
-        
-        looker_sign = looker_data["sign_id"]
-        rules = ASPECT_RULES.get(looker_name, [7])
-        
-        for offset in rules:
-            # Calculate the target sign index (0-11)
-            # -1 because counting starts from the planet itself
-            target_sign_id = (looker_sign + offset - 1) % 12
-            
-            # Check if any planet is in that target sign
-            for target_name, target_data in chart_data.items():
-                if target_name == "Ascendant" or target_name == looker_name: continue
-                
-                if target_data["sign_id"] == target_sign_id:
-                    # Logic: Saturn in Aries (0) aspects Libra (6) -> 7th aspect
-                    aspects_log.append(f"{looker_name} casts {offset}th aspect on {target_name}")
-                    
-    return aspects_log
\ No newline at end of file
+    for looker, target in sorted(
+        zip(*np.nonzero(aspects)), key=lambda lt: (lt[0], (signs[lt[1]] - signs[lt[0]]) % 12, lt[1])
+    ):
+        # Logic: Saturn in Aries (0) aspects Libra (6) -> 7th aspect
+        offset = int((signs[target] - signs[looker]) % 12) + 1
+        aspects_log.append(f"{CHART_KEYS[looker]} casts {offset}th aspect on {CHART_KEYS[target]}")
+    return aspects_log
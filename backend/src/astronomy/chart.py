@@ -0,0 +1,232 @@
+from collections.abc import Mapping
+from enum import IntEnum
+
+from .tables import HOUSE_LORDS, PADA_SPAN, dignity
+
+
+class Planet(IntEnum):
+    """
+    Fixed chart layout. The first 9 match engine.PLANET_NAMES (batch column order).
+    """
+
+    SUN = 0
+    MOON = 1
+    MARS = 2
+    MERCURY = 3
+    JUPITER = 4
+    VENUS = 5
+    SATURN = 6
+    RAHU = 7
+    KETU = 8
+    ASCENDANT = 9
+
+    @property
+    def label(self):
+        return CHART_KEYS[self]
+
+
+CHART_KEYS = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu", "Ascendant"]
+GRAHAS = tuple(Planet)[:9]
+KEY_INDEX = {name: Planet(i) for i, name in enumerate(CHART_KEYS)}
+
+
+class PlanetPosition(Mapping):
+    """
+    One row of a Chart. Fields are __slots__ attributes (pos.sign_id); the Mapping interface
+    (pos["sign_id"], pos.get(...), dict(pos)) exposes the legacy planet-dict shape without copying.
+    derive_chart() freezes the position (see FrozenPlanetPosition): charts are shared through the
+    engine's cache.
+    """
+
+    __slots__ = (
+        "planet", "sign_id", "degree", "absolute_longitude", "speed",
+        "is_retrograde", "d9_sign_id", "house_number",
+        # Derived once per chart by derive_chart()
+        "nakshatra_id", "pada", "house_from_moon", "dignity",
+    )
+
+    # Keys exposed through the dict interface
+    GRAHA_KEYS = (
+        "sign_id", "degree", "is_retrograde", "absolute_longitude", "speed", "d9_sign_id", "house_number",
+        "nakshatra_id", "pada", "house_from_moon", "dignity",
+    )
+    ASCENDANT_KEYS = ("sign_id", "degree", "absolute_longitude", "d9_sign_id", "nakshatra_id", "pada")
+
+    def __init__(self, planet, sign_id, degree, absolute_longitude, speed=0.0,
+                 is_retrograde=False, d9_sign_id=None, house_number=None):
+        self.planet = planet
+        self.sign_id = sign_id
+        self.degree = degree
+        self.absolute_longitude = absolute_longitude
+        self.speed = speed
+        self.is_retrograde = is_retrograde
+        self.d9_sign_id = d9_sign_id
+        self.house_number = house_number
+        self.nakshatra_id = None
+        self.pada = None
+        self.house_from_moon = None
+        self.dignity = None
+
+    def freeze(self):
+        # Same slots, so the instance can switch class in place
+        self.__class__ = FrozenPlanetPosition
+
+    @property
+    def name(self):
+        return CHART_KEYS[self.planet]
+
+    def _keys(self):
+        return self.ASCENDANT_KEYS if self.planet == Planet.ASCENDANT else self.GRAHA_KEYS
+
+    def __getitem__(self, key):
+        try:
+            value = getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key)
+        if key in self._keys():
+            return value
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self):
+        return len(self._keys())
+
+    def __repr__(self):
+        return f"PlanetPosition({self.name}, sign_id={self.sign_id}, degree={self.degree:.4f})"
+
+
+class FrozenPlanetPosition(PlanetPosition):
+    """
+    A PlanetPosition after derive_chart(): attribute writes raise AttributeError. Use
+    chart.to_dict() for a private, modifiable copy.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{self.name} position is read-only: use chart.to_dict() for a modifiable copy")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"{self.name} position is read-only")
+
+    def __setstate__(self, state):
+        # pickle / copy: restore the slots without going through __setattr__
+        for key, value in state[1].items():
+            object.__setattr__(self, key, value)
+
+    def freeze(self):
+        pass
+
+
+class Chart(Mapping):
+    """
+    Compact chart: a tuple of PlanetPosition indexed by Planet.
+    Engines use chart.positions[Planet.MOON] / chart.ascendant; legacy callers keep using
+    chart["Moon"]["sign_id"] through the read-only Mapping interface. Read-only once built.
+    """
+
+    __slots__ = ("positions", "house_lords")
+
+    def __init__(self, positions, house_lords=None):
+        object.__setattr__(self, "positions", tuple(positions))
+        # house_lords[h - 1] -> Planet ruling house h (set by derive_chart)
+        object.__setattr__(self, "house_lords", tuple(house_lords) if house_lords is not None else None)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Chart is read-only: use chart.to_dict() for a modifiable copy")
+
+    def __delattr__(self, key):
+        raise AttributeError("Chart is read-only")
+
+    def __setstate__(self, state):
+        for key, value in state[1].items():
+            object.__setattr__(self, key, value)
+
+    @property
+    def ascendant(self):
+        return self.positions[Planet.ASCENDANT]
+
+    def __getitem__(self, key):
+        pos = self.positions[KEY_INDEX[key] if key.__class__ is str else key]
+        if pos is None:
+            raise KeyError(key)
+        return pos
+
+    def __iter__(self):
+        return (CHART_KEYS[i] for i, pos in enumerate(self.positions) if pos is not None)
+
+    def __len__(self):
+        return sum(1 for pos in self.positions if pos is not None)
+
+    def to_dict(self):
+        """
+        Independent dict-of-dicts copy (for callers that need to modify it).
+        """
+        return {CHART_KEYS[i]: dict(pos) for i, pos in enumerate(self.positions) if pos is not None}
+
+    @classmethod
+    def from_dict(cls, chart_data):
+        """
+        Builds a Chart from the legacy dict-of-dicts shape. Missing planets stay absent;
+        derived attributes are recomputed.
+        """
+        positions = [None] * len(CHART_KEYS)
+        for name, data in chart_data.items():
+            planet = KEY_INDEX.get(name)
+            if planet is None:
+                continue
+            positions[planet] = PlanetPosition(
+                planet,
+                data.get("sign_id"),
+                data.get("degree", 0.0),
+                data.get("absolute_longitude", 0.0),
+                data.get("speed", 0.0),
+                data.get("is_retrograde", False),
+                data.get("d9_sign_id"),
+                data.get("house_number"),
+            )
+        return derive_chart(positions)
+
+
+def derive_chart(positions):
+    """
+    Single pass over a chart's positions that fills every derived attribute from the shared
+    tables: house from lagna and Moon, nakshatra + pada, dignity, and the house lordship map.
+    Returns the Chart, with its positions frozen.
+    """
+    positions = list(positions)
+    ascendant = positions[Planet.ASCENDANT]
+    moon = positions[Planet.MOON]
+    asc_sign = ascendant.sign_id if ascendant is not None else None
+    moon_sign = moon.sign_id if moon is not None else None
+
+    for pos in positions:
+        if pos is None:
+            continue
+        # 108 padas around the zodiac: nakshatra = pada // 4
+        pada_index = int(pos.absolute_longitude / PADA_SPAN) % 108
+        pos.nakshatra_id = pada_index >> 2
+        pos.pada = (pada_index & 3) + 1
+        if pos.planet == Planet.ASCENDANT:
+            pos.house_number = 1
+        else:
+            if asc_sign is not None:
+                pos.house_number = (pos.sign_id - asc_sign) % 12 + 1
+            if moon_sign is not None:
+                pos.house_from_moon = (pos.sign_id - moon_sign) % 12 + 1
+            pos.dignity = dignity(pos.planet, pos.sign_id, pos.degree)
+        pos.freeze()
+
+    house_lords = [Planet(p) for p in HOUSE_LORDS[asc_sign]] if asc_sign is not None else None
+    return Chart(positions, house_lords)
+
+
+def as_chart(chart_data):
+    """
+    Engines accept either a Chart or a legacy dict-of-dicts; this normalizes to Chart.
+    """
+    if isinstance(chart_data, Chart):
+        return chart_data
+    return Chart.from_dict(chart_data)
@@ -0,0 +1,50 @@
+import threading
+from collections import OrderedDict
+
+
+class ChartCache:
+    """
+    Thread-safe, size-bounded LRU cache for calculated charts.
+    Keys are canonical tuples built by VedicAstroEngine.chart_cache_key; values are
+    read-only Chart objects shared between callers. Also used for other read-only
+    per-key results (e.g. upagrahas.SunriseTable).
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            chart = self._entries.get(key)
+            if chart is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return chart
+
+    def put(self, key, chart):
+        with self._lock:
+            self._entries[key] = chart
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
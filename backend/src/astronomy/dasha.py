@@ -1,152 +1,513 @@
+import heapq
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
+import numpy as np
+from .chart import CHART_KEYS, Planet
+from .tables import (
+    DEBILITATION_SIGN, EXALTATION_SIGN, KETU, MARS, NAKSHATRA_LORD, NAKSHATRA_SPAN,
+    RAHU, SATURN, SIGN_LORD, SIGN_NAMES,
+)
+
+# Vimshottari sequence and durations (years); index = lord code in the template arrays
+DASHA_ORDER = ["Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury"]
+DASHA_YEARS = [7, 20, 6, 10, 7, 18, 16, 19, 17]
+# Vimshottari lord code (index into DASHA_ORDER) of each nakshatra
+NAKSHATRA_LORD_CODES = [DASHA_ORDER.index(CHART_KEYS[p]) for p in NAKSHATRA_LORD]
+LEVEL_TYPES = ["Mahadasha", "Antardasha", "Pratyantardasha", "Sookshmadasha"]
+DAYS_PER_YEAR = 365.2425  # 1 Astro Year = Gregorian average
+LIFESPAN_YEARS = 120  # every timeline runs at least this long past its first Mahadasha
+
+# Yogini: 36-year cycle of 8 yoginis (Moon, Sun, Jupiter, Mars, Mercury, Saturn, Venus, Rahu)
+YOGINI_ORDER = ["Mangala", "Pingala", "Dhanya", "Bhramari", "Bhadrika", "Ulka", "Siddha", "Sankata"]
+YOGINI_YEARS = [1, 2, 3, 4, 5, 6, 7, 8]
+# Ashtottari: 108-year cycle; each lord rules 4 or 3 consecutive nakshatras from Ardra
+ASHTOTTARI_ORDER = ["Sun", "Moon", "Mars", "Mercury", "Saturn", "Jupiter", "Rahu", "Venus"]
+ASHTOTTARI_YEARS = [6, 15, 8, 17, 10, 19, 12, 21]
+
+# Nakshatra (udu) dashas as data: lords in order, their years, how many consecutive nakshatras
+# each lord rules, and the lord of first_nakshatra. Sub-periods always start with the period's
+# own lord and last parent * years / cycle total.
+NAKSHATRA_DASHAS = {
+    "vimshottari": {
+        "lords": DASHA_ORDER, "years": DASHA_YEARS, "nakshatras": [1] * 9,
+        "first_nakshatra": 0, "first_lord": 0,  # Ashwini -> Ketu
+    },
+    "yogini": {
+        "lords": YOGINI_ORDER, "years": YOGINI_YEARS, "nakshatras": [1] * 8,
+        "first_nakshatra": 0, "first_lord": 3,  # Ashwini -> Bhramari
+    },
+    "ashtottari": {
+        "lords": ASHTOTTARI_ORDER, "years": ASHTOTTARI_YEARS, "nakshatras": [4, 3, 4, 3, 3, 3, 4, 3],
+        "first_nakshatra": 5, "first_lord": 0,  # Ardra -> Sun
+    },
+}
+
+# Chara dasha: Aries-Gemini and Libra-Sagittarius are savya (counted zodiacally), the rest reverse
+SAVYA_SIGNS = {0, 1, 2, 6, 7, 8}
+CO_LORDS = {7: (MARS, KETU), 10: (SATURN, RAHU)}  # Scorpio, Aquarius
+
+
+class PeriodTemplate:
+    """
+    Relative timeline of one dasha sequence, every level at once; times are years from the start
+    of the first Mahadasha. Rows are grouped by level, in time order within a level, so the
+    `branching` children of row j of level k are rows branching*j onwards of level k+1.
+    Arrays are read-only: templates are cached and shared between natives.
+    """
+
+    __slots__ = ("start", "end", "lord", "level", "offsets", "branching", "_lists")
+
+    def __init__(self, md_lords, md_years, child_lords, child_weights, depth=len(LEVEL_TYPES)):
+        """
+        md_lords / md_years: the Mahadasha sequence. child_lords[p]: the sub-period lords, in order,
+        of any period ruled by p; child_weights[p]: their relative lengths.
+        """
+        child_lords = np.asarray(child_lords)
+        child_weights = np.asarray(child_weights, dtype=np.float64)
+        totals = child_weights.sum(axis=1)[:, None]
+
+        lords = np.asarray(md_lords)
+        durations = np.asarray(md_years, dtype=np.float64)
+        starts = np.concatenate([[0.0], np.cumsum(durations)[:-1]])
+        level_lords, level_starts, level_durations = [lords], [starts], [durations]
+
+        for _ in range(1, depth):
+            # Children split the parent by weight, back to back from its start
+            sub_lords = child_lords[lords]
+            sub_durations = durations[:, None] * child_weights[lords] / totals[lords]
+            sub_starts = starts[:, None] + np.cumsum(sub_durations, axis=1) - sub_durations
+            lords, starts, durations = sub_lords.ravel(), sub_starts.ravel(), sub_durations.ravel()
+            level_lords.append(lords)
+            level_starts.append(starts)
+            level_durations.append(durations)
+
+        sizes = [len(l) for l in level_lords]
+        self.offsets = [0] + np.cumsum(sizes).tolist()
+        self.branching = child_lords.shape[1]
+        self.start = np.concatenate(level_starts)
+        self.end = self.start + np.concatenate(level_durations)
+        self.lord = np.concatenate(level_lords).astype(np.int8)
+        self.level = np.repeat(np.arange(depth, dtype=np.int8), sizes)
+        for arr in (self.start, self.end, self.lord, self.level):
+            arr.flags.writeable = False
+        self._lists = None
+
+    @property
+    def depth(self):
+        return len(self.offsets) - 1
+
+    def lists(self):
+        # Plain-list copy for scalar lookups (bisect on a list beats NumPy on tiny slices)
+        if self._lists is None:
+            self._lists = (self.start.tolist(), self.end.tolist(), self.lord.tolist())
+        return self._lists
+
+    def first_child(self, level, row):
+        return self.offsets[level + 1] + self.branching * (row - self.offsets[level])
+
+
+@lru_cache(maxsize=None)
+def cyclic_template(years, start_lord):
+    """
+    Template of a nakshatra dasha for a native born at the very start of start_lord's Mahadasha.
+    The lords cycle until LIFESPAN_YEARS are covered, plus start_lord once more for the balance
+    (Vimshottari: 10 Mahadashas). years: tuple of years per lord. Built once per lord.
+    """
+    n = len(years)
+    cycles = -(-LIFESPAN_YEARS // sum(years))
+    years = np.array(years, dtype=np.float64)
+    md_lords = (start_lord + np.arange(n * cycles + 1)) % n
+    child_lords = (np.arange(n)[:, None] + np.arange(n)) % n
+    return PeriodTemplate(md_lords, years[md_lords], child_lords, years[child_lords])
+
+
+@lru_cache(maxsize=256)
+def chara_template(first_sign, direction, sign_years):
+    """
+    Chara dasha template: two cycles of the 12 signs from first_sign (direction +1/-1), the second
+    giving each sign 12 minus its first-cycle years. Antardashas and Pratyantardashas are the 12
+    signs in the same direction from the one after the parent sign, a twelfth each.
+    """
+    signs = (first_sign + direction * np.arange(12)) % 12
+    first = np.array(sign_years, dtype=np.float64)[signs]
+    child_lords = (np.arange(12)[:, None] + direction * np.arange(1, 13)) % 12
+    return PeriodTemplate(
+        np.concatenate([signs, signs]), np.concatenate([first, 12.0 - first]),
+        child_lords, np.ones((12, 12)), depth=3,
+    )
+
+
+PATH_KEYS = ["md", "ad", "pd"]  # expandable levels in a dasha path, e.g. "md=3/ad=5"
+
+
+def parse_dasha_path(path):
+    """
+    "md=3/ad=5" -> (3, 5). Keys must appear in Maha -> Antar -> Pratyantar order.
+    """
+    indices = []
+    for depth, part in enumerate(p for p in (path or "").split("/") if p):
+        key, _, value = part.partition("=")
+        if depth >= len(PATH_KEYS) or key.strip() != PATH_KEYS[depth] or not value.strip().isdigit():
+            raise ValueError(f"Invalid dasha path segment '{part}' (expected {'/'.join(k + '=<n>' for k in PATH_KEYS)})")
+        indices.append(int(value))
+    return tuple(indices)
+
+
+class DashaTimeline:
+    """
+    A native's timeline in one dasha system: a shared PeriodTemplate shifted so that birth falls
+    elapsed_years into the first Mahadasha. Building one is O(1); rows ending before birth (the
+    elapsed part of the balance Mahadasha) and empty periods are skipped on output.
+    names: lord code -> name. balance: label the first Mahadasha "Mahadasha (Balance)".
+    """
+
+    __slots__ = ("birth_date", "template", "names", "balance", "shift", "start", "end", "lord", "level")
+
+    def __init__(self, birth_date, template, elapsed_years, names=DASHA_ORDER, balance=True):
+        self.birth_date = birth_date
+        self.template = template
+        self.names = names
+        self.balance = balance
+        # Template time 0 is the start of the first Mahadasha, elapsed_years before birth
+        self.shift = -elapsed_years
+        self.start, self.end, self.lord, self.level = template.start, template.end, template.lord, template.level
+
+    @property
+    def level_types(self):
+        return LEVEL_TYPES[:self.template.depth]
+
+    def years_since_birth(self, target_date):
+        return (target_date - self.birth_date).total_seconds() / 86400.0 / DAYS_PER_YEAR
+
+    def to_date(self, years):
+        return self.birth_date + timedelta(days=years * DAYS_PER_YEAR)
+
+    def _node(self, lord, level, start, end):
+        return {
+            "lord": self.names[lord],
+            "start": self.to_date(start),
+            "end": self.to_date(end),
+            "duration": end - start,
+            "type": "Mahadasha (Balance)" if level == 0 and start == 0.0 and self.balance else LEVEL_TYPES[level],
+        }
+
+    def current(self, target_date=None):
+        """
+        Running period at every level for a date: {"mahadasha": node, "antardasha": node, ...}.
+        None before birth or after the last Mahadasha. Walks parent -> children per level.
+        """
+        if target_date is None: target_date = datetime.now()
+        template = self.template
+        starts, ends, lords = template.lists()
+
+        # Work in template time (0 = start of the first Mahadasha)
+        birth = -self.shift
+        t = birth + self.years_since_birth(target_date)
+        if t < birth or t >= ends[template.offsets[1] - 1]:
+            return None
+
+        result = {}
+        first, count = 0, template.offsets[1]
+        for level, level_type in enumerate(self.level_types):
+            row = max(bisect_right(starts, t, first, first + count) - 1, first)
+            result[level_type.lower()] = self._node(lords[row], level, max(starts[row], birth) - birth, ends[row] - birth)
+            first, count = template.first_child(level, row), template.branching
+        return result
+
+    def expand(self, path=()):
+        """
+        Lazy one-level expansion: the periods directly below the node at `path`
+        (0-based indices into each level's list as returned by expand / to_tree;
+        () lists the Mahadashas). Periods that ended before birth are skipped.
+        """
+        template = self.template
+        if len(path) >= template.depth:
+            raise ValueError(f"{LEVEL_TYPES[template.depth - 1]} is the deepest level")
+        starts, ends, lords = template.lists()
+        birth = -self.shift
+        visible = lambda r: ends[r] > birth and ends[r] > starts[r]
+
+        first, count = 0, template.offsets[1]
+        for level, index in enumerate(path):
+            rows = [r for r in range(first, first + count) if visible(r)]
+            if not 0 <= index < len(rows):
+                raise ValueError(f"No {LEVEL_TYPES[level]} #{index}")
+            first, count = template.first_child(level, rows[index]), template.branching
+
+        level = len(path)
+        return [
+            self._node(lords[r], level, max(starts[r], birth) - birth, ends[r] - birth)
+            for r in range(first, first + count) if visible(r)
+        ]
+
+    def dasha_at(self, target_dates):
+        """
+        Vectorized current(): running lord at every level for an array of dates (datetime64
+        or datetimes, local time like birth_date). No tree is built: each level is one
+        searchsorted over the template, clamped to the children of the level above.
+        Returns {"mahadasha": codes, "antardasha": codes, ...} as int8 arrays of lord codes
+        (indices into names), -1 where a date is before birth or past the timeline.
+        """
+        offsets, branching = self.template.offsets, self.template.branching
+        birth = np.datetime64(self.birth_date, "us")
+        elapsed = (np.asarray(target_dates, dtype="datetime64[us]") - birth) / np.timedelta64(1, "us")
+        t = elapsed / (DAYS_PER_YEAR * 86400e6) - self.shift
+        valid = (t >= -self.shift) & (t < self.end[offsets[1] - 1])
+
+        result = {}
+        index = None  # row index within the current level
+        for level, level_type in enumerate(self.level_types):
+            lo, hi = offsets[level], offsets[level + 1]
+            found = np.searchsorted(self.start[lo:hi], t, side="right") - 1
+            if index is None:
+                index = np.clip(found, 0, hi - lo - 1)
+            else:
+                index = np.clip(found, branching * index, branching * index + branching - 1)
+            result[level_type.lower()] = np.where(valid, self.lord[lo + index], -1).astype(np.int8)
+        return result
+
+    def lords_at(self, target_dates):
+        """
+        dasha_at() with lord names: {"mahadasha": [name or None, ...], ...}.
+        """
+        names = np.array(list(self.names) + [None], dtype=object)  # code -1 -> None
+        return {level: names[codes].tolist() for level, codes in self.dasha_at(target_dates).items()}
+
+    def changes(self, start_date=None, end_date=None, depth=None):
+        """
+        Lazy chronological stream of period starts at every level down to depth, for starts in
+        [start_date, end_date): (date, event) pairs, event = {"event": "antardasha", "lord",
+        "lords" (Mahadasha ... this level), "end"}. One generator per level walks its rows in
+        time order and heapq.merge interleaves them (a parent before its first child), so only
+        one pending period per level is held. The period running at birth starts at birth.
+        """
+        depth = self.template.depth if depth is None else min(depth, self.template.depth)
+        return heapq.merge(
+            *[self._level_changes(level, start_date, end_date) for level in range(depth)],
+            key=itemgetter(0),
+        )
+
+    def _level_changes(self, level, start_date, end_date):
+        template = self.template
+        starts, ends, lords = template.lists()
+        lo, hi = template.offsets[level], template.offsets[level + 1]
+        birth = -self.shift
+        t0 = birth if start_date is None else max(birth, birth + self.years_since_birth(start_date))
+        t1 = float("inf") if end_date is None else birth + self.years_since_birth(end_date)
+
+        # First row still running at birth, then the first one starting at or after t0
+        row = bisect_right(ends, birth, lo, hi)
+        if t0 > birth:
+            row = max(row, bisect_left(starts, t0, lo, hi))
+        event_type = LEVEL_TYPES[level].lower()
+        for row in range(row, hi):
+            if max(starts[row], birth) >= t1:
+                return
+            if ends[row] <= starts[row]:
+                continue
+            # Lords from the Mahadasha down: the parent of local index j is j // branching.
+            # A first child can start a rounding error before its parent; it is clamped so
+            # the merged stream always lists the parent first.
+            path, j, start = [], row - lo, birth
+            for parent_level in reversed(range(level + 1)):
+                ancestor = template.offsets[parent_level] + j
+                path.append(self.names[lords[ancestor]])
+                start = max(start, starts[ancestor])
+                j //= template.branching
+            if start >= t1:
+                return
+            yield self.to_date(start - birth), {
+                "event": event_type,
+                "lord": path[0],
+                "lords": path[::-1],
+                "end": self.to_date(ends[row] - birth),
+            }
+
+    def to_tree(self, depth=None):
+        """
+        Legacy nested form: list of Mahadasha dicts with "sub_periods" down to `depth` levels.
+        Periods that ended before birth are dropped; the one running at birth starts at birth.
+        """
+        template = self.template
+        depth = template.depth if depth is None else min(depth, template.depth)
+        offsets, branching = template.offsets, template.branching
+        starts = np.maximum(self.start[:offsets[depth]] + self.shift, 0.0)
+        ends = self.end[:offsets[depth]] + self.shift
+
+        # Vectorized year -> datetime conversion for every row at once
+        birth = np.datetime64(self.birth_date, "us")
+        to_dates = lambda years: (birth + (years * DAYS_PER_YEAR * 86400e6).astype("timedelta64[us]")).tolist()
+        start_dates, end_dates = to_dates(starts), to_dates(ends)
+        starts, ends = starts.tolist(), ends.tolist()
+        lords, levels = self.lord.tolist(), self.level.tolist()
+
+        children = None
+        for level in reversed(range(depth)):
+            nodes = []
+            for j, row in enumerate(range(offsets[level], offsets[level + 1])):
+                if ends[row] <= starts[row]:
+                    nodes.append(None)
+                    continue
+                node = {
+                    "lord": self.names[lords[row]],
+                    "start": start_dates[row],
+                    "end": end_dates[row],
+                    "duration": ends[row] - starts[row],
+                    "type": "Mahadasha (Balance)" if level == 0 and starts[row] == 0.0 and self.balance else LEVEL_TYPES[levels[row]],
+                }
+                if children is not None:
+                    node["sub_periods"] = [c for c in children[branching * j:branching * (j + 1)] if c is not None]
+                nodes.append(node)
+            children = nodes
+        return [n for n in children if n is not None]
+
+
+class NakshatraDasha:
+    """
+    Table-driven nakshatra dasha (see NAKSHATRA_DASHAS). The Moon's nakshatra picks the first
+    Mahadasha lord; the share of that lord's nakshatras already traversed is the elapsed part.
+    """
+
+    def __init__(self, name):
+        spec = NAKSHATRA_DASHAS[name]
+        self.name = name
+        self.LORDS = list(spec["lords"])
+        self.YEARS = tuple(spec["years"])
+
+        # Per nakshatra: ruling lord, first nakshatra of that lord's group, group size
+        self.NAKSHATRA_LORDS, self.GROUP_START, self.GROUP_SIZE = [0] * 27, [0] * 27, [0] * 27
+        nakshatra, lord, assigned = spec["first_nakshatra"], spec["first_lord"], 0
+        while assigned < 27:
+            size = spec["nakshatras"][lord]
+            for k in range(size):
+                n = (nakshatra + k) % 27
+                self.NAKSHATRA_LORDS[n], self.GROUP_START[n], self.GROUP_SIZE[n] = lord, nakshatra, size
+            nakshatra, lord, assigned = (nakshatra + size) % 27, (lord + 1) % len(self.LORDS), assigned + size
+
+    def calculate_timeline(self, moon_long, birth_date, nakshatra_id=None):
+        """
+        Columnar timeline (DashaTimeline): the precomputed template for the birth lord,
+        shifted to this birth. No per-period work.
+        nakshatra_id: the Moon's nakshatra from the chart (derived from moon_long if omitted).
+        """
+        # 1. FIND STARTING POINT
+        nakshatra_idx = int(moon_long / NAKSHATRA_SPAN) % 27 if nakshatra_id is None else nakshatra_id
+        start_lord = self.NAKSHATRA_LORDS[nakshatra_idx]
+
+        # 2. Share of the lord's nakshatras traversed (Ashtottari lords rule 3-4 in a row)
+        offset = (nakshatra_idx - self.GROUP_START[nakshatra_idx]) % 27
+        degree_in_group = moon_long - nakshatra_idx * NAKSHATRA_SPAN + offset * NAKSHATRA_SPAN
+        percent_passed = min(max(degree_in_group / (self.GROUP_SIZE[nakshatra_idx] * NAKSHATRA_SPAN), 0.0), 1.0)
+
+        # 3. The birth lord's Mahadasha started percent_passed of its length before birth
+        template = cyclic_template(self.YEARS, start_lord)
+        return DashaTimeline(birth_date, template, self.YEARS[start_lord] * percent_passed, self.LORDS)
+
+    def timeline(self, chart, birth_date):
+        moon = chart.positions[Planet.MOON]
+        return self.calculate_timeline(moon.absolute_longitude, birth_date, nakshatra_id=moon.nakshatra_id)
+
+
+class CharaDasha:
+    """
+    Jaimini Chara (sign) dasha, K.N. Rao's method. Mahadashas run from the lagna sign, forward
+    if the 9th sign is savya and backward otherwise, with no balance at birth. A sign gets
+    (distance to its lord - 1) years, counted forward for savya signs and backward for the rest:
+    12 with the lord in the sign, +1 if the lord is exalted, -1 if debilitated (1-12).
+    """
 
-class VimshottariDasha:
     def __init__(self):
+        self.name = "chara"
+        self.LORDS = list(SIGN_NAMES)
+
+    def sign_lord(self, sign, signs, degrees):
+        """
+        Scorpio/Aquarius: a co-lord in the sign defers to the other one; otherwise the co-lord
+        with more grahas in its sign, then the one further advanced in its sign, is stronger.
+        """
+        if sign not in CO_LORDS:
+            return SIGN_LORD[sign]
+        a, b = CO_LORDS[sign]
+        if signs[a] == sign or signs[b] == sign:
+            return b if signs[a] == sign and signs[b] != sign else a
+        company = lambda p: sum(1 for q in range(len(signs)) if q != p and signs[q] == signs[p])
+        return max((a, b), key=lambda p: (company(p), degrees[p]))
+
+    def sign_years(self, signs, degrees):
+        """
+        First-cycle Mahadasha years of each sign. signs / degrees: sign and degree of the 9 grahas.
+        """
+        years = []
+        for sign in range(12):
+            lord = self.sign_lord(sign, signs, degrees)
+            lord_sign = signs[lord]
+            if lord_sign == sign:
+                n = 12
+            elif sign in SAVYA_SIGNS:
+                n = (lord_sign - sign) % 12
+            else:
+                n = (sign - lord_sign) % 12
+            if EXALTATION_SIGN.get(lord) == lord_sign:
+                n += 1
+            elif DEBILITATION_SIGN.get(lord) == lord_sign:
+                n -= 1
+            years.append(min(max(n, 1), 12))
+        return years
+
+    def timeline(self, chart, birth_date):
+        grahas = chart.positions[:Planet.ASCENDANT]
+        signs, degrees = [p.sign_id for p in grahas], [p.degree for p in grahas]
+        lagna = chart.positions[Planet.ASCENDANT].sign_id
+        direction = 1 if (lagna + 8) % 12 in SAVYA_SIGNS else -1
+        template = chara_template(lagna, direction, tuple(self.sign_years(signs, degrees)))
+        return DashaTimeline(birth_date, template, 0.0, self.LORDS, balance=False)
+
+
+class VimshottariDasha(NakshatraDasha):
+    def __init__(self):
+        super().__init__("vimshottari")
+
         # 1. Standard Dasha Durations (Years)
-        self.DASHA_YEARS = {
-            "Ketu": 7, "Venus": 20, "Sun": 6, "Moon": 10, "Mars": 7,
-            "Rahu": 18, "Jupiter": 16, "Saturn": 19, "Mercury": 17
-        }
+        self.DASHA_YEARS = dict(zip(DASHA_ORDER, DASHA_YEARS))
         
         # 2. Fixed Zodiac Sequence
-        self.DASHA_ORDER = ["Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury"]
+        self.DASHA_ORDER = list(DASHA_ORDER)
         
         # 3. Nakshatra Mapping (1 to 27)
-        self.NAKSHATRA_RULERS = [
-            "Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury", # 1-9
-            "Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury", # 10-18
-            "Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury"  # 19-27
-        ]
+        self.NAKSHATRA_RULERS = [CHART_KEYS[p] for p in NAKSHATRA_LORD]
 
     def add_time(self, start_date, years):
         """
         Precise date addition converting astrological years to calendar time.
         1 Astro Year = 365.2425 Days (Gregorian Average)
         """
-        total_days = years * 365.2425
+        total_days = years * DAYS_PER_YEAR
         return start_date + timedelta(days=total_days)
 
-    def generate_sub_periods(self, start_date, parent_lord, parent_duration_years, level_depth):
+    def dasha_at(self, moon_long, birth_date, target_dates, nakshatra_id=None):
         """
-        Recursive function to generate nested Dasha tree.
-        level_depth: 1=Antar, 2=Pratyantar, 3=Sookshma
+        Running Maha/Antar/Pratyantar/Sookshma lords for many dates at once (see DashaTimeline.dasha_at).
+        Returns {"mahadasha": [lord name or None, ...], ...}.
         """
-        # STOP CONDITION: We only want up to Sookshma (Level 3)
-        # Level 0 = Mahadasha (Handled in main loop)
-        # Level 1 = Antar
-        # Level 2 = Pratyantar
-        # Level 3 = Sookshma
-        if level_depth > 3:
-            return None
+        return self.calculate_timeline(moon_long, birth_date, nakshatra_id).lords_at(target_dates)
 
-        sub_periods = []
-        current_date = start_date
-        
-        # Sub-periods always start with the Lord of the Parent Period
-        start_idx = self.DASHA_ORDER.index(parent_lord)
-        
-        for i in range(9):
-            idx = (start_idx + i) % 9
-            planet_name = self.DASHA_ORDER[idx]
-            planet_years = self.DASHA_YEARS[planet_name]
-            
-            # KEY FORMULA: (ParentDuration * PlanetYears) / 120
-            # Example: In Sun Mahadasha (6 yrs), Sun Antar = (6 * 6) / 120 = 0.3 years
-            duration_in_this_level = (parent_duration_years * planet_years) / 120.0
-            
-            end_date = self.add_time(current_date, duration_in_this_level)
-            
-            node = {
-                "lord": planet_name,
-                "start": current_date,
-                "end": end_date,
-                "duration": duration_in_this_level,
-                "type": ["Mahadasha", "Antardasha", "Pratyantardasha", "Sookshmadasha"][level_depth]
-            }
-            
-            # RECURSIVE CALL: Generate children for this node
-            # (e.g., inside this Antardasha, generate Pratyantars)
-            children = self.generate_sub_periods(current_date, planet_name, duration_in_this_level, level_depth + 1)
-            if children:
-                node["sub_periods"] = children
-                
-            sub_periods.append(node)
-            current_date = end_date
-            
-        return sub_periods
-
-    def calculate_dashas(self, moon_long, birth_date):
-        """
-        Generates the full life timeline tree.
+    def calculate_dashas(self, moon_long, birth_date, nakshatra_id=None):
         """
-        # 1. FIND STARTING POINT
-        nakshatra_span = 360.0 / 27.0
-        nakshatra_idx = int(moon_long / nakshatra_span)
-        degree_in_nak = moon_long % nakshatra_span
-        
-        percent_passed = degree_in_nak / nakshatra_span
-        percent_remaining = 1.0 - percent_passed
-        
-        start_lord = self.NAKSHATRA_RULERS[nakshatra_idx]
-        full_years = self.DASHA_YEARS[start_lord]
-        balance_years = full_years * percent_remaining
-        
-        timeline = []
-        current_date = birth_date
-        
-        # 2. FIRST MAHADASHA (The Balance Period)
-        # Note: Calculating accurate sub-periods for the balance period is mathematically complex 
-        # because we are starting in the *middle* of a cycle. 
-        # For V1.0 Simplicity: We calculate the end date, but we don't generate the 
-        # retrospective sub-periods for the past. We generate sub-periods moving forward if possible.
-        
-        end_date = self.add_time(current_date, balance_years)
-        
-        # We skip recursion for the balance dasha in V1 to avoid "negative time" logic complexity
-        # or we treat it as a partial block. Let's add it as a flat block for safety.
-        timeline.append({
-            "lord": start_lord,
-            "start": current_date,
-            "end": end_date,
-            "duration": balance_years,
-            "type": "Mahadasha (Balance)",
-            "sub_periods": [] # Empty for balance to prevent errors
-        })
-        current_date = end_date
-        
-        # 3. GENERATE FULL CYCLES FOR REMAINING PLANETS
-        start_idx = self.DASHA_ORDER.index(start_lord)
-        
-        # Generate next 9 Mahadashas (covering 120 years of life)
-        for i in range(1, 10):
-            idx = (start_idx + i) % 9
-            lord = self.DASHA_ORDER[idx]
-            duration = self.DASHA_YEARS[lord]
-            
-            md_end = self.add_time(current_date, duration)
-            
-            md_node = {
-                "lord": lord,
-                "start": current_date,
-                "end": md_end,
-                "duration": duration,
-                "type": "Mahadasha"
-            }
-            
-            # GENERATE TREE (Antar -> Pratyantar -> Sookshma)
-            # Level 1 call (Antardasha)
-            md_node["sub_periods"] = self.generate_sub_periods(current_date, lord, duration, 1)
-            
-            timeline.append(md_node)
-            current_date = md_end
-            
-        return timeline
+        Generates the full life timeline tree (legacy nested dicts, 4 levels).
+        The first Mahadasha is the balance at birth, with its remaining sub-periods filled in.
+        """
+        return self.calculate_timeline(moon_long, birth_date, nakshatra_id).to_tree()
 
     def get_current_dasha_details(self, timeline, target_date=None):
         """
         Navigates the tree to find exactly where we are NOW.
+        Accepts a DashaTimeline (fast path) or the legacy nested list.
         """
         if target_date is None: target_date = datetime.now()
+        if isinstance(timeline, DashaTimeline):
+            return timeline.current(target_date)
         
         result = {}
         
@@ -181,4 +542,24 @@ class VimshottariDasha:
                                 break
                     break
                     
-        return result
\ No newline at end of file
+        return result
+
+
+# Every system by API name; all are queried from a Chart via .timeline(chart, birth_date)
+DASHA_SYSTEMS = {
+    "vimshottari": VimshottariDasha(),
+    "yogini": NakshatraDasha("yogini"),
+    "ashtottari": NakshatraDasha("ashtottari"),
+    "chara": CharaDasha(),
+}
+
+
+def dasha_timelines(chart, birth_date, systems=None):
+    """
+    Timelines of one chart in several systems (all by default): {name: DashaTimeline}.
+    """
+    names = list(DASHA_SYSTEMS) if systems is None else list(systems)
+    unknown = [n for n in names if n not in DASHA_SYSTEMS]
+    if unknown:
+        raise ValueError(f"Unknown dasha system(s): {', '.join(unknown)} (available: {', '.join(DASHA_SYSTEMS)})")
+    return {name: DASHA_SYSTEMS[name].timeline(chart, birth_date) for name in names}
@@ -1,14 +1,34 @@
 import swisseph as swe
+import numpy as np
 import os
 from datetime import datetime
+from .ayanamsa import AyanamsaSystem
+from .chart import Planet, PlanetPosition, GRAHAS, as_chart, derive_chart
+from .chart_cache import ChartCache
+from .vargas import VARGA_TABLES, SHODASHAVARGA, calculate_vargas
+
+# Fixed graha layout shared by the single-chart and batch paths.
+# Ketu is derived from Rahu, so only the first 8 are computed by swisseph.
+PLANET_NAMES = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu"]
+SWE_BODIES = [
+    swe.SUN, swe.MOON, swe.MARS, swe.MERCURY, swe.JUPITER,
+    swe.VENUS, swe.SATURN, swe.MEAN_NODE  # Mean Node is standard in most Vedic software
+]
 
 class VedicAstroEngine:
-    def __init__(self):
+    def __init__(self, ephemeris_table=None, cache_size=1024):
         # Point to ephemeris files if they exist locally, else let swe use defaults
         # Usually located in 'ephe' folder relative to project root
         ephe_path = os.path.join(os.path.dirname(__file__), "../../ephe")
         if os.path.exists(ephe_path):
             swe.set_ephe_path(ephe_path)
+
+        # Optional precomputed Chebyshev table (see ephemeris_table.py).
+        # Instants outside its range still go through swisseph.
+        self.ephemeris_table = ephemeris_table
+
+        # LRU memoization of calculate_chart (cache_size=0 disables it)
+        self.cache = ChartCache(cache_size) if cache_size else None
             
     def get_julian_day(self, year, month, day, hour, minute, tz):
         """
@@ -18,76 +38,141 @@ class VedicAstroEngine:
         decimal_hour = hour + (minute / 60.0) - tz
         return swe.julday(year, month, day, decimal_hour)
 
+    def get_julian_days(self, years, months, days, hours, minutes, tzs):
+        """
+        Vectorized get_julian_day for arrays of local birth times (Gregorian calendar).
+        Same result as swe.julday, without a Python-level call per birth.
+        """
+        years = np.asarray(years, dtype=np.int64)
+        months = np.asarray(months, dtype=np.int64)
+        days = np.asarray(days, dtype=np.int64)
+        decimal_hours = np.asarray(hours, dtype=np.float64) + np.asarray(minutes, dtype=np.float64) / 60.0 - np.asarray(tzs, dtype=np.float64)
+
+        # Julian Day Number at noon (Fliegel & Van Flandern), then shift to midnight + hours
+        a = (14 - months) // 12
+        y = years + 4800 - a
+        m = months + 12 * a - 3
+        jdn = days + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
+        return jdn - 0.5 + decimal_hours / 24.0
+
+    def get_tropical_positions(self, jd):
+        """
+        Tropical longitude and daily speed of the 8 computed grahas (Sun..Rahu) at a Julian Day.
+        Returns two lists ordered like SWE_BODIES.
+        """
+        if self.ephemeris_table is not None and self.ephemeris_table.covers(jd):
+            return self.ephemeris_table.positions(jd)
+
+        longitudes = []
+        speeds = []
+        for p_code in SWE_BODIES:
+            # flags: swe.FLG_SWIEPH (use ephemeris), swe.FLG_SPEED (calc speed)
+            res = swe.calc_ut(jd, p_code, swe.FLG_SWIEPH | swe.FLG_SPEED)
+            longitudes.append(res[0][0])
+            speeds.append(res[0][3])
+        return longitudes, speeds
+
     def calculate_varga(self, planet_deg, sign_id, division=9):
         """
         Calculates the sign ID for a planet in a divisional chart (Varga).
-        Default is D9 (Navamsa), the most critical divisional chart in Vedic Astrology.
+        Any Shodashavarga division (D1-D60); default is D9 (Navamsa).
         """
-        if division != 9:
-            return sign_id # Only D9 implemented for now
+        table = VARGA_TABLES[division]
+        n_parts = table.shape[1]
+        part = min(int(planet_deg * n_parts / 30.0), n_parts - 1)
+        return int(table[sign_id, part])
 
-        # 1. Determine Pada (Part 0-8)
-        # Each Navamsa is 3° 20' = 3.333333 degrees
-        part_size = 30.0 / 9.0
-        pada_index = int(planet_deg / part_size) 
-        
-        # 2. Determine Start Sign based on Element (Tattwa)
-        # Fire Signs (Aries 0, Leo 4, Sag 8) -> Start Counting from Aries (0)
-        # Earth Signs (Taurus 1, Virgo 5, Cap 9) -> Start Counting from Capricorn (9)
-        # Air Signs (Gemini 2, Libra 6, Aqua 10) -> Start Counting from Libra (6)
-        # Water Signs (Cancer 3, Scorpio 7, Pisces 11) -> Start Counting from Cancer (3)
-        
-        element_group = sign_id % 4
-        
-        if element_group == 0:   # Fire
-            start_sign = 0 
-        elif element_group == 1: # Earth
-            start_sign = 9
-        elif element_group == 2: # Air
-            start_sign = 6
-        else:                    # Water
-            start_sign = 3
-            
-        # 3. Final Calculation
-        varga_sign_id = (start_sign + pada_index) % 12
-        return varga_sign_id
+    def calculate_varga_batch(self, sign_ids, degrees, division=9):
+        """
+        Vectorized calculate_varga for arrays of sign ids and degrees-in-sign (any shape).
+        """
+        table = VARGA_TABLES[division]
+        n_parts = table.shape[1]
+        parts = np.minimum((np.asarray(degrees) * (n_parts / 30.0)).astype(np.int64), n_parts - 1)
+        return table[np.asarray(sign_ids), parts].astype(np.int64)
+
+    def calculate_chart_vargas(self, chart, divisions=SHODASHAVARGA):
+        """
+        All requested vargas for every graha + Ascendant of a chart in one lookup.
+        Returns {"D2": {"Sun": sign_id, ...}, ...}.
+        """
+        chart = as_chart(chart)
+        present = [pos for pos in chart.positions if pos is not None]
+        signs = calculate_vargas([pos.absolute_longitude for pos in present], divisions)
+        return {
+            f"D{division}": {pos.name: int(signs[row, col]) for row, pos in enumerate(present)}
+            for col, division in enumerate(divisions)
+        }
+
+    def varga_chart(self, chart, division):
+        """
+        The chart as seen in one divisional chart: each sign_id replaced by its varga sign
+        (house numbers counted from the varga Lagna).
+        """
+        chart = as_chart(chart)
+        vargas = self.calculate_chart_vargas(chart, (division,))[f"D{division}"]
+        positions = [
+            PlanetPosition(
+                pos.planet, vargas[pos.name], pos.degree, pos.absolute_longitude, pos.speed, pos.is_retrograde
+            ) if pos is not None else None
+            for pos in chart.positions
+        ]
+        return derive_chart(positions)
+
+    def get_ayanamsa(self, jd, ayanamsa_mode="LAHIRI"):
+        """
+        Ayanamsa (degrees) for a Julian Day or array of Julian Days.
+        Uses an explicit per-mode model instead of swe.set_sid_mode, so it is thread-safe.
+        """
+        return AyanamsaSystem.get_model(ayanamsa_mode).value(jd)
+
+    def chart_cache_key(self, jd, lat, lon, ayanamsa_mode):
+        """
+        Canonical cache key: Julian Day to the second, lat/lon to 1e-4 degree (~11 m,
+        far below what moves the Ascendant), and the normalized ayanamsa name.
+        """
+        return (
+            int(round(jd * 86400)),
+            round(lat, 4),
+            round(lon, 4),
+            AyanamsaSystem.normalize(ayanamsa_mode),
+        )
+
+    def cache_info(self):
+        return self.cache.info() if self.cache is not None else None
 
     def calculate_chart(self, year, month, day, hour, minute, lat, lon, tz, ayanamsa_mode="LAHIRI"):
         """
         Main function to calculate planetary positions.
-        Returns Dictionary with Planet Data including D1 (Rashi) and D9 (Navamsa).
+        Returns a Chart (D1 Rashi + D9 Navamsa + derived attributes per graha). A Chart is read-only and may be
+        shared through the cache: use chart.to_dict() for a private, modifiable copy.
         """
         jd = self.get_julian_day(year, month, day, hour, minute, tz)
+        if self.cache is None:
+            return self._calculate_chart(jd, lat, lon, ayanamsa_mode)
+
+        key = self.chart_cache_key(jd, lat, lon, ayanamsa_mode)
+        chart = self.cache.get(key)
+        if chart is None:
+            chart = self._calculate_chart(jd, lat, lon, ayanamsa_mode)
+            self.cache.put(key, chart)
+        return chart
+
+    def calculate_grahas(self, jd, ayanamsa_mode="LAHIRI"):
+        """
+        Sidereal positions of the 9 grahas (Sun..Ketu) at a Julian Day (UT): the part of a chart
+        that does not depend on the observer's location. Returns a list of PlanetPosition.
+        """
+        # 1. Calculate Tropical Positions of 7 Major Planets + Rahu
+        tropical_lons, speeds = self.get_tropical_positions(jd)
         
-        # 1. Set Ayanamsa (Sidereal Offset)
-        if ayanamsa_mode == "RAMAN":
-            swe.set_sid_mode(swe.SIDM_RAMAN)
-        elif ayanamsa_mode == "KP":
-            swe.set_sid_mode(swe.SIDM_KRISHNAMURTI)
-        else:
-            swe.set_sid_mode(swe.SIDM_LAHIRI) # Default to Lahiri (Standard Vedic)
-            
-        ayanamsa_val = swe.get_ayanamsa_ut(jd)
-        
-        # 2. Define Planets to Calculate
-        planets = {
-            "Sun": swe.SUN, "Moon": swe.MOON, "Mars": swe.MARS,
-            "Mercury": swe.MERCURY, "Jupiter": swe.JUPITER,
-            "Venus": swe.VENUS, "Saturn": swe.SATURN,
-            "Rahu": swe.MEAN_NODE # Mean Node is standard in most Vedic software
-        }
+        # 2. Ayanamsa (Sidereal Offset) for this call only - no global swisseph state
+        ayanamsa_val = self.get_ayanamsa(jd, ayanamsa_mode)
         
-        chart_data = {}
+        positions = []
         
-        # 3. Calculate 7 Major Planets + Rahu
-        for p_name, p_code in planets.items():
-            # Calculate Tropical Position
-            # flags: swe.FLG_SWIEPH (use ephemeris), swe.FLG_SPEED (calc speed)
-            res = swe.calc_ut(jd, p_code, swe.FLG_SWIEPH | swe.FLG_SPEED)
-            
-            tropical_lon = res[0][0]
-            speed = res[0][3]
-            
+        # 3. Convert each to Sidereal + derive Sign/D9
+        for planet, tropical_lon, speed in zip(GRAHAS, tropical_lons, speeds):
             # Convert to Sidereal (Nirayana)
             sidereal_lon = (tropical_lon - ayanamsa_val) % 360
             
@@ -98,33 +183,31 @@ class VedicAstroEngine:
             # --- NEW: CALCULATE D9 (NAVAMSA) ---
             d9_sign = self.calculate_varga(degree_in_sign, sign_id, division=9)
             
-            chart_data[p_name] = {
-                "sign_id": sign_id,
-                "degree": degree_in_sign,
-                "is_retrograde": is_retrograde,
-                "absolute_longitude": sidereal_lon,
-                "speed": speed,
-                "d9_sign_id": d9_sign
-            }
+            positions.append(PlanetPosition(
+                planet, sign_id, degree_in_sign, sidereal_lon, speed, is_retrograde, d9_sign
+            ))
             
         # 4. Calculate Ketu (Always exactly 180 degrees from Rahu)
-        rahu = chart_data["Rahu"]
-        ketu_lon = (rahu["absolute_longitude"] + 180) % 360
+        rahu = positions[Planet.RAHU]
+        ketu_lon = (rahu.absolute_longitude + 180) % 360
         ketu_sign = int(ketu_lon / 30)
         ketu_deg = ketu_lon % 30
         
         # Ketu's D9
         ketu_d9 = self.calculate_varga(ketu_deg, ketu_sign, division=9)
         
-        chart_data["Ketu"] = {
-            "sign_id": ketu_sign,
-            "degree": ketu_deg,
-            "is_retrograde": rahu["is_retrograde"], # Always same motion as Rahu
-            "absolute_longitude": ketu_lon,
-            "speed": rahu["speed"],
-            "d9_sign_id": ketu_d9
-        }
-        
+        # Always same motion as Rahu
+        positions.append(PlanetPosition(
+            Planet.KETU, ketu_sign, ketu_deg, ketu_lon, rahu.speed, rahu.is_retrograde, ketu_d9
+        ))
+
+        return positions
+
+    def _calculate_chart(self, jd, lat, lon, ayanamsa_mode="LAHIRI"):
+        # 1-4. The 9 grahas (location-independent)
+        positions = self.calculate_grahas(jd, ayanamsa_mode)
+        ayanamsa_val = self.get_ayanamsa(jd, ayanamsa_mode)
+
         # 5. Calculate Ascendant (Lagna)
         # swe.houses_ex returns (cusps, ascmc). ascmc[0] is the Ascendant.
         # We use 'A' (Equal) or 'P' (Placidus) - Ascendant degree is same regardless of house system.
@@ -139,11 +222,86 @@ class VedicAstroEngine:
         # Ascendant D9
         asc_d9 = self.calculate_varga(asc_deg, asc_sign, division=9)
         
-        chart_data["Ascendant"] = {
-            "sign_id": asc_sign,
-            "degree": asc_deg,
-            "absolute_longitude": asc_sidereal,
-            "d9_sign_id": asc_d9
-        }
+        positions.append(PlanetPosition(
+            Planet.ASCENDANT, asc_sign, asc_deg, asc_sidereal, d9_sign_id=asc_d9
+        ))
         
-        return chart_data
\ No newline at end of file
+        # 6. Derived attributes in one pass: houses from Lagna/Moon, nakshatra, pada, dignity, lords
+        return derive_chart(positions)
+
+    def calculate_charts_batch(self, years, months, days, hours, minutes, lats, lons, tzs, ayanamsa_modes="LAHIRI",
+                               divisions=None):
+        """
+        Calculates many charts at once.
+        Inputs are equal-length arrays of birth details; ayanamsa_modes is one name or one per birth.
+        Returns a columnar dict of NumPy arrays instead of a dict-of-dicts per chart:
+            planets                 -> list of 9 graha names (column order)
+            absolute_longitude etc. -> shape (n, 9)
+            ascendant               -> dict of shape (n,) arrays
+        With divisions (e.g. SHODASHAVARGA), also "vargas" of shape (n, 9, len(divisions))
+        and ascendant["vargas"] of shape (n, len(divisions)).
+        """
+        jds = self.get_julian_days(years, months, days, hours, minutes, tzs)
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        n = len(jds)
+
+        # 1. Raw tropical positions: one vectorized table lookup when available,
+        #    swisseph per birth otherwise (the only per-birth Python work)
+        tropical = np.empty((n, len(SWE_BODIES)))
+        speeds = np.empty((n, len(SWE_BODIES)))
+        in_table = np.zeros(n, dtype=bool)
+        if self.ephemeris_table is not None:
+            in_table = (jds >= self.ephemeris_table.start_jd) & (jds < self.ephemeris_table.end_jd)
+            if in_table.any():
+                tropical[in_table], speeds[in_table] = self.ephemeris_table.positions_batch(jds[in_table])
+
+        asc_tropical = np.empty(n)
+        for i in range(n):
+            if not in_table[i]:
+                tropical[i], speeds[i] = self.get_tropical_positions(jds[i])
+            asc_tropical[i] = swe.houses_ex(jds[i], lats[i], lons[i], b'A')[1][0]
+
+        # 2. Ayanamsa per birth (grouped by mode)
+        modes = np.broadcast_to(np.asarray(ayanamsa_modes, dtype=object), (n,))
+        ayanamsa_vals = np.empty(n)
+        for mode in set(modes):
+            rows = np.nonzero(modes == mode)[0]
+            ayanamsa_vals[rows] = self.get_ayanamsa(jds[rows], mode)
+
+        # 3. Sidereal longitudes, Ketu = Rahu + 180
+        sidereal = np.empty((n, len(PLANET_NAMES)))
+        sidereal[:, :-1] = (tropical - ayanamsa_vals[:, None]) % 360
+        sidereal[:, -1] = (sidereal[:, -2] + 180) % 360
+        speed = np.concatenate([speeds, speeds[:, -1:]], axis=1)
+
+        sign_id = (sidereal // 30).astype(np.int64)
+        degree = sidereal % 30
+
+        asc_sidereal = (asc_tropical - ayanamsa_vals) % 360
+        asc_sign = (asc_sidereal // 30).astype(np.int64)
+        asc_deg = asc_sidereal % 30
+
+        result = {
+            "planets": list(PLANET_NAMES),
+            "julian_day": jds,
+            "absolute_longitude": sidereal,
+            "sign_id": sign_id,
+            "degree": degree,
+            "d9_sign_id": self.calculate_varga_batch(sign_id, degree, 9),
+            "is_retrograde": speed < 0,
+            "speed": speed,
+            "house_number": (sign_id - asc_sign[:, None]) % 12 + 1,
+            "ascendant": {
+                "absolute_longitude": asc_sidereal,
+                "sign_id": asc_sign,
+                "degree": asc_deg,
+                "d9_sign_id": self.calculate_varga_batch(asc_sign, asc_deg, 9),
+            },
+        }
+
+        if divisions:
+            result["divisions"] = list(divisions)
+            result["vargas"] = calculate_vargas(sidereal, divisions)
+            result["ascendant"]["vargas"] = calculate_vargas(asc_sidereal, divisions)
+        return result
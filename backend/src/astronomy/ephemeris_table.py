@@ -0,0 +1,163 @@
+import json
+import math
+import os
+import numpy as np
+import swisseph as swe
+from .engine import SWE_BODIES
+
+DEFAULT_TABLE_PATH = os.path.join(
+    os.path.dirname(__file__), "../../data/ephemeris/graha_table.npy"
+)
+
+
+class EphemerisTable:
+    """
+    Precomputed Chebyshev ephemeris for the 8 computed grahas (Sun..Rahu, SWE_BODIES order).
+
+    Each body's tropical longitude is split into fixed-length segments; every segment stores
+    NCOEF Chebyshev coefficients fitted to swisseph at the Chebyshev nodes.
+    The coefficient matrix is a plain .npy file opened with mmap, so every worker process
+    shares the same page-cache pages. A small JSON sidecar holds the segment layout.
+
+    Accuracy against swisseph over the whole range (see tests/benchmark_ephemeris.py):
+    99th percentile < 0.05 arcsec, worst case < 5 arcsec (at the few spots where
+    swisseph's own series have small joins), speed within 0.004 deg/day.
+    """
+
+    START_JD = 2414989.5  # 1899-12-01 (covers 1900-01-01 births in any timezone)
+    END_JD = 2488465.5  # 2101-02-01
+    NCOEF = 14
+
+    # Segment length in days per body, SWE_BODIES order:
+    # Sun, Moon, Mars, Mercury, Jupiter, Venus, Saturn, Mean Node
+    SEGMENT_DAYS = [32.0, 8.0, 16.0, 8.0, 16.0, 16.0, 16.0, 32.0]
+
+    def __init__(self, coefficients, meta):
+        # Plain ndarray view of the mmap (np.memmap indexing is slow for tiny lookups)
+        self.coefficients = np.asarray(coefficients)
+        self.start_jd = meta["start_jd"]
+        self.end_jd = meta["end_jd"]
+        self.segment_days = np.array([b["segment_days"] for b in meta["bodies"]])
+        self.offsets = np.array([b["offset"] for b in meta["bodies"]], dtype=np.int64)
+        self.counts = np.array([b["count"] for b in meta["bodies"]], dtype=np.int64)
+
+        self._layout = list(zip(self.offsets.tolist(), self.counts.tolist(), self.segment_days.tolist()))
+
+        # Derivative weights: d/dx sum(c_k T_k) = sum(k c_k U_{k-1})
+        self._deriv_weights = np.arange(1, coefficients.shape[1], dtype=np.float64)
+
+    @staticmethod
+    def meta_path(path):
+        return os.path.splitext(path)[0] + ".json"
+
+    @classmethod
+    def build(cls, path=DEFAULT_TABLE_PATH, start_jd=None, end_jd=None):
+        """
+        Samples swisseph over [start_jd, end_jd) and writes the coefficient table + sidecar.
+        One-time build step (under a minute; ~600k swisseph samples).
+        """
+        start_jd = cls.START_JD if start_jd is None else start_jd
+        end_jd = cls.END_JD if end_jd is None else end_jd
+
+        n = cls.NCOEF
+        nodes = np.cos(np.pi * (np.arange(n) + 0.5) / n)
+        vander = np.polynomial.chebyshev.chebvander(nodes, n - 1)
+
+        blocks = []
+        bodies = []
+        offset = 0
+        for p_code, seg in zip(SWE_BODIES, cls.SEGMENT_DAYS):
+            count = int(math.ceil((end_jd - start_jd) / seg))
+            seg_starts = start_jd + np.arange(count) * seg
+            sample_jds = seg_starts[:, None] + (nodes + 1.0) / 2.0 * seg
+
+            lon = np.empty(sample_jds.shape)
+            for i, jd in np.ndenumerate(sample_jds):
+                lon[i] = swe.calc_ut(jd, p_code, swe.FLG_SWIEPH)[0][0]
+
+            # Unwrap each segment so the fitted curve is continuous across 0/360
+            lon = np.degrees(np.unwrap(np.radians(lon), axis=1))
+            blocks.append(np.linalg.solve(vander, lon.T).T)
+
+            bodies.append({"code": p_code, "segment_days": seg, "offset": offset, "count": count})
+            offset += count
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        np.save(path, np.concatenate(blocks).astype(np.float64))
+        with open(cls.meta_path(path), "w") as f:
+            json.dump({"start_jd": start_jd, "end_jd": end_jd, "n_coef": n, "bodies": bodies}, f)
+
+        return cls.load(path)
+
+    @classmethod
+    def load(cls, path=DEFAULT_TABLE_PATH):
+        """
+        Opens a built table memory-mapped (read-only).
+        """
+        with open(cls.meta_path(path), "r") as f:
+            meta = json.load(f)
+        return cls(np.load(path, mmap_mode="r"), meta)
+
+    @classmethod
+    def load_if_available(cls, path=DEFAULT_TABLE_PATH):
+        """
+        Returns the table, or None if it has not been built (callers then use swisseph).
+        """
+        if os.path.exists(path) and os.path.exists(cls.meta_path(path)):
+            return cls.load(path)
+        return None
+
+    def covers(self, jd):
+        return self.start_jd <= jd < self.end_jd
+
+    def positions_batch(self, jds):
+        """
+        Tropical longitudes and speeds (deg/day) for an array of Julian Days (UT).
+        Returns two arrays of shape (len(jds), 8). All jds must be inside the table range.
+        """
+        jds = np.asarray(jds, dtype=np.float64)[:, None]
+
+        # 1. Locate the segment of every (jd, body) pair
+        seg_index = np.minimum(((jds - self.start_jd) // self.segment_days).astype(np.int64), self.counts - 1)
+        seg_start = self.start_jd + seg_index * self.segment_days
+        x = 2.0 * (jds - seg_start) / self.segment_days - 1.0
+        c = self.coefficients[self.offsets + seg_index]
+
+        # 2. Clenshaw recurrence: value (T series) and derivative (U series) together
+        two_x = 2.0 * x
+        b1 = b2 = 0.0
+        d1 = d2 = 0.0
+        for k in range(c.shape[-1] - 1, 0, -1):
+            b1, b2 = two_x * b1 - b2 + c[..., k], b1
+            d1, d2 = two_x * d1 - d2 + self._deriv_weights[k - 1] * c[..., k], d1
+        longitude = x * b1 - b2 + c[..., 0]
+        speed = d1 * 2.0 / self.segment_days
+
+        return longitude % 360, speed
+
+    def positions(self, jd):
+        """
+        Single-instant lookup. Returns (longitudes, speeds) as lists in SWE_BODIES order.
+        Plain-float Clenshaw: for 8 bodies this beats NumPy's per-call overhead by ~10x.
+        """
+        longitudes = []
+        speeds = []
+        for offset, count, seg in self._layout:
+            seg_index = min(int((jd - self.start_jd) // seg), count - 1)
+            x = 2.0 * (jd - self.start_jd - seg_index * seg) / seg - 1.0
+            c = self.coefficients[offset + seg_index].tolist()
+
+            two_x = 2.0 * x
+            b1 = b2 = d1 = d2 = 0.0
+            for k in range(len(c) - 1, 0, -1):
+                b1, b2 = two_x * b1 - b2 + c[k], b1
+                d1, d2 = two_x * d1 - d2 + k * c[k], d1
+            longitudes.append((x * b1 - b2 + c[0]) % 360)
+            speeds.append(d1 * 2.0 / seg)
+        return longitudes, speeds
+
+
+if __name__ == "__main__":
+    print(f"Building ephemeris table at {os.path.abspath(DEFAULT_TABLE_PATH)} ...")
+    table = EphemerisTable.build()
+    print(f"  {table.coefficients.shape[0]} segments, {table.coefficients.nbytes / 1e6:.1f} MB")
@@ -0,0 +1,360 @@
+import json
+import os
+import numpy as np
+import swisseph as swe
+from .ayanamsa import AyanamsaSystem
+from .engine import PLANET_NAMES, SWE_BODIES
+from .tables import NAKSHATRA_NAMES, PADA_SPAN, SIGN_NAMES
+
+DEFAULT_CATALOG_PATH = os.path.join(
+    os.path.dirname(__file__), "../../data/ephemeris/event_catalog.npy"
+)
+
+# Event kinds; "index" is the sign / nakshatra / pada entered (stations: the pada they occur in)
+EVENT_KINDS = ["sign", "nakshatra", "pada", "retrograde", "direct"]
+SIGN, NAKSHATRA, PADA, RETROGRADE, DIRECT = range(len(EVENT_KINDS))
+PADAS = 108
+KETU = len(SWE_BODIES)  # Ketu's events are Rahu's, 54 padas (180 deg) further on
+STATION_BODIES = [2, 3, 4, 5, 6]  # Mars, Mercury, Jupiter, Venus, Saturn (SWE_BODIES order)
+
+EVENT_DTYPE = np.dtype([
+    ("jd", "f8"),          # Julian Day (UT)
+    ("body", "i1"),        # PLANET_NAMES index
+    ("kind", "i1"),        # EVENT_KINDS index
+    ("index", "i2"),
+    ("retrograde", "?"),   # moving backwards at an ingress / turning retrograde at a station
+    ("longitude", "f4"),   # sidereal longitude at the event
+])
+
+UNIX_EPOCH_JD = 2440587.5
+BLOCK_DAYS = 5 * 365.25  # iter_between read size
+
+
+def jd_to_datetime64(jds):
+    return np.datetime64("1970-01-01T00:00:00", "ms") + np.round(
+        (np.asarray(jds, dtype=np.float64) - UNIX_EPOCH_JD) * 86400e3
+    ).astype("timedelta64[ms]")
+
+
+def datetime64_to_jd(dates):
+    ms = (np.asarray(dates, dtype="datetime64[ms]") - np.datetime64("1970-01-01T00:00:00", "ms")) / np.timedelta64(1, "ms")
+    return UNIX_EPOCH_JD + ms / 86400e3
+
+
+class EventCatalog:
+    """
+    Precomputed sidereal events of the 9 grahas: sign, nakshatra and pada ingresses and
+    retrograde/direct stations. Every time is a root of swisseph's longitude (Newton with its
+    speed, bracketed by a daily grid) or speed (regula falsi), to TOLERANCE_DAYS.
+
+    Rows are sorted by (body, kind, jd); a small offsets table locates each (body, kind) block,
+    so a time-range query is two binary searches per block. Stored like EphemerisTable: a plain
+    .npy (opened with mmap) plus a JSON sidecar with the layout and ayanamsa.
+    """
+
+    START_JD = 2415020.5  # 1900-01-01
+    END_JD = 2488069.5  # 2101-01-01
+    STEP_DAYS = 1.0  # grid step: stations are weeks apart, so motion is monotonic between them
+    TOLERANCE_DAYS = 1e-6  # ~0.1 s
+    MAX_ITERATIONS = 60
+
+    def __init__(self, events, meta):
+        self.events = np.asarray(events)
+        self.jd = self.events["jd"]
+        self.start_jd = meta["start_jd"]
+        self.end_jd = meta["end_jd"]
+        self.ayanamsa = meta["ayanamsa"]
+        self.offsets = meta["offsets"]  # block (body * len(EVENT_KINDS) + kind) -> first row
+
+    @staticmethod
+    def meta_path(path):
+        return os.path.splitext(path)[0] + ".json"
+
+    # --- BUILD ---
+
+    @staticmethod
+    def _sample(code, jds, flags=swe.FLG_SWIEPH | swe.FLG_SPEED):
+        """
+        Tropical longitude and speed from swisseph for an array of Julian Days.
+        """
+        lon = np.empty(len(jds))
+        speed = np.empty(len(jds))
+        for i, jd in enumerate(jds.tolist()):
+            xx = swe.calc_ut(jd, code, flags)[0]
+            lon[i], speed[i] = xx[0], xx[3]
+        return lon, speed
+
+    @classmethod
+    def _find_stations(cls, code, lo, hi, speed_lo):
+        """
+        Illinois regula falsi on swisseph's speed, one bracket per station (vectorized over brackets).
+        """
+        f_lo, f_hi = speed_lo, cls._sample(code, hi)[1]
+        t = lo.copy()
+        for _ in range(cls.MAX_ITERATIONS):
+            t = (lo * f_hi - hi * f_lo) / (f_hi - f_lo)
+            f = cls._sample(code, t)[1]
+            left = np.sign(f) == np.sign(f_lo)
+            # Illinois: halve the stale end's value so the bracket keeps shrinking from both sides
+            f_hi = np.where(left, f_hi * 0.5, f)
+            f_lo = np.where(left, f, f_lo * 0.5)
+            lo, hi = np.where(left, t, lo), np.where(left, hi, t)
+            if np.all(hi - lo < cls.TOLERANCE_DAYS):
+                break
+        return t
+
+    @classmethod
+    def _find_crossings(cls, code, lo, hi, t, target, direction, ayanamsa):
+        """
+        Safeguarded Newton on the sidereal longitude: t -= (lon - target) / speed, falling back to
+        bisection whenever a step leaves [lo, hi]. Iterates only the crossings not yet converged.
+        """
+        pending = np.arange(len(t))
+        for _ in range(cls.MAX_ITERATIONS):
+            if len(pending) == 0:
+                break
+            tp = t[pending]
+            lon, speed = cls._sample(code, tp)
+            # Sidereal: subtract the ayanamsa and its (tiny) rate
+            lon = lon - ayanamsa.value(tp)
+            speed = speed - (ayanamsa.value(tp + 0.5) - ayanamsa.value(tp - 0.5))
+            f = (lon - target[pending] + 180.0) % 360.0 - 180.0
+
+            d = direction[pending]
+            before = f * d < 0  # root is later than tp
+            lo[pending] = np.where(before, tp, lo[pending])
+            hi[pending] = np.where(before, hi[pending], tp)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                step = np.where(speed * d > 0, f / speed, np.inf)
+            newton = tp - step
+            inside = (newton > lo[pending]) & (newton < hi[pending])
+            t[pending] = np.where(inside, newton, 0.5 * (lo[pending] + hi[pending]))
+
+            done = inside & (np.abs(step) < cls.TOLERANCE_DAYS) | (hi[pending] - lo[pending] < cls.TOLERANCE_DAYS)
+            pending = pending[~done]
+        return t
+
+    @classmethod
+    def _body_events(cls, body, grid, lon, speed, ayanamsa, start_jd, end_jd):
+        """
+        Stations and pada crossings of one swisseph body, from its tropical longitude / speed on
+        the daily grid. Returns (station rows, crossing times, pada boundaries, directions).
+        """
+        code = SWE_BODIES[body]
+        rows = []
+
+        # 1. Stations: sign changes of the speed, refined on swisseph
+        knots, knot_lon = grid, lon
+        if body in STATION_BODIES:
+            i = np.nonzero(np.sign(speed[:-1]) != np.sign(speed[1:]))[0]
+            stations = cls._find_stations(code, grid[i], grid[i + 1], speed[i])
+            station_lon = cls._sample(code, stations)[0]
+            sidereal = (station_lon - ayanamsa.value(stations)) % 360.0
+            station = np.zeros(len(stations), dtype=EVENT_DTYPE)
+            station["jd"], station["body"] = stations, body
+            station["kind"] = np.where(speed[i] > 0, RETROGRADE, DIRECT)
+            station["index"] = (sidereal // PADA_SPAN).astype(np.int16) % PADAS
+            station["retrograde"] = speed[i] > 0
+            station["longitude"] = sidereal
+            rows.append(station)
+
+            # Station instants split the grid into intervals of monotonic motion
+            order = np.argsort(np.concatenate([grid, stations]), kind="stable")
+            knots = np.concatenate([grid, stations])[order]
+            knot_lon = np.concatenate([lon, station_lon])[order]
+
+        # 2. Pada boundaries crossed in every interval (unwrapped sidereal longitude)
+        u = np.degrees(np.unwrap(np.radians((knot_lon - ayanamsa.value(knots)) % 360.0)))
+        k = np.floor(u / PADA_SPAN).astype(np.int64)
+        count = np.abs(np.diff(k))
+        interval = np.repeat(np.arange(len(count)), count)
+        direction = np.sign(np.diff(k))[interval]
+        # n-th boundary of an interval: k_a + n (forward) or k_a - n + 1 (backward)
+        nth = np.arange(len(interval)) - np.repeat(np.cumsum(count) - count, count)
+        boundary = np.where(direction > 0, k[interval] + 1 + nth, k[interval] - nth)
+
+        # 3. Newton from the linear interpolation inside each interval
+        lo, hi = knots[interval], knots[interval + 1]
+        u_lo, u_hi = u[interval], u[interval + 1]
+        t0 = lo + (boundary * PADA_SPAN - u_lo) / (u_hi - u_lo) * (hi - lo)
+        times = cls._find_crossings(
+            code, lo.copy(), hi.copy(), t0, (boundary * PADA_SPAN) % 360.0, direction, ayanamsa
+        )
+        keep = (times >= start_jd) & (times < end_jd)
+        return rows, times[keep], boundary[keep] % PADAS, direction[keep]
+
+    @staticmethod
+    def _ingress_rows(body, times, boundary, direction):
+        """
+        Pada crossings -> pada rows, plus nakshatra rows (every 4th boundary) and sign rows (every 9th).
+        """
+        entered = np.where(direction > 0, boundary, boundary - 1) % PADAS
+        rows = []
+        for kind, per, mask in (
+            (PADA, 1, np.ones(len(times), dtype=bool)),
+            (NAKSHATRA, 4, boundary % 4 == 0),
+            (SIGN, 9, boundary % 9 == 0),
+        ):
+            block = np.zeros(int(mask.sum()), dtype=EVENT_DTYPE)
+            block["jd"], block["body"], block["kind"] = times[mask], body, kind
+            block["index"] = entered[mask] // per
+            block["retrograde"] = direction[mask] < 0
+            block["longitude"] = (boundary[mask] * PADA_SPAN) % 360.0
+            rows.append(block)
+        return rows
+
+    @classmethod
+    def build(cls, path=DEFAULT_CATALOG_PATH, ayanamsa_mode="LAHIRI", table=None, start_jd=None, end_jd=None):
+        """
+        Root-finds every event in [start_jd, end_jd) and writes the catalog + sidecar.
+        One-time build step (about a minute: ~0.8M swisseph calls, fewer with an EphemerisTable
+        for the daily grid).
+        """
+        start_jd = cls.START_JD if start_jd is None else start_jd
+        end_jd = cls.END_JD if end_jd is None else end_jd
+        ayanamsa_mode = AyanamsaSystem.normalize(ayanamsa_mode)
+        ayanamsa = AyanamsaSystem.get_model(ayanamsa_mode)
+
+        # 1. Daily grid: the precomputed table when available, swisseph otherwise
+        grid = np.arange(start_jd, end_jd + cls.STEP_DAYS, cls.STEP_DAYS)
+        if table is not None and table.start_jd <= grid[0] and grid[-1] < table.end_jd:
+            grid_lon, grid_speed = table.positions_batch(grid)
+        else:
+            sampled = [cls._sample(code, grid) for code in SWE_BODIES]
+            grid_lon = np.stack([lon for lon, _ in sampled], axis=1)
+            grid_speed = np.stack([speed for _, speed in sampled], axis=1)
+
+        # 2. Stations and crossings per body, classified into pada / nakshatra / sign rows
+        rows = []
+        for body in range(len(SWE_BODIES)):
+            stations, times, boundary, direction = cls._body_events(
+                body, grid, grid_lon[:, body], grid_speed[:, body], ayanamsa, start_jd, end_jd
+            )
+            rows += stations + cls._ingress_rows(body, times, boundary, direction)
+            if body == 7:  # Rahu -> Ketu
+                rows += cls._ingress_rows(KETU, times, (boundary + PADAS // 2) % PADAS, direction)
+
+        events = np.concatenate(rows)
+        events = events[np.lexsort((events["jd"], events["kind"], events["body"]))]
+        blocks = events["body"].astype(np.int64) * len(EVENT_KINDS) + events["kind"]
+        offsets = np.searchsorted(blocks, np.arange(len(PLANET_NAMES) * len(EVENT_KINDS) + 1)).tolist()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        np.save(path, events)
+        meta = {"start_jd": start_jd, "end_jd": end_jd, "ayanamsa": ayanamsa_mode, "offsets": offsets}
+        with open(cls.meta_path(path), "w") as f:
+            json.dump(meta, f)
+
+        return cls.load(path)
+
+    @classmethod
+    def load(cls, path=DEFAULT_CATALOG_PATH):
+        """
+        Opens a built catalog memory-mapped (read-only).
+        """
+        with open(cls.meta_path(path), "r") as f:
+            meta = json.load(f)
+        return cls(np.load(path, mmap_mode="r"), meta)
+
+    @classmethod
+    def load_if_available(cls, path=DEFAULT_CATALOG_PATH):
+        """
+        Returns the catalog, or None if it has not been built.
+        """
+        if os.path.exists(path) and os.path.exists(cls.meta_path(path)):
+            return cls.load(path)
+        return None
+
+    # --- QUERIES ---
+
+    def _block(self, body, kind):
+        block = body * len(EVENT_KINDS) + kind
+        return self.offsets[block], self.offsets[block + 1]
+
+    def between(self, start_jd, end_jd, bodies=None, kinds=None):
+        """
+        Events with start_jd <= jd < end_jd for the given body / kind indices (default: all),
+        as an EVENT_DTYPE array in time order. O(log n) per (body, kind) plus the output size.
+        """
+        bodies = range(len(PLANET_NAMES)) if bodies is None else bodies
+        kinds = range(len(EVENT_KINDS)) if kinds is None else kinds
+        parts = []
+        for body in bodies:
+            for kind in kinds:
+                lo, hi = self._block(body, kind)
+                first, last = np.searchsorted(self.jd[lo:hi], [start_jd, end_jd])
+                parts.append(self.events[lo + first:lo + last])
+        if not parts:
+            return np.zeros(0, dtype=EVENT_DTYPE)
+        events = np.concatenate(parts)
+        return events[np.argsort(events["jd"], kind="stable")]
+
+    def iter_between(self, start_jd, end_jd, bodies=None, kinds=None, block_days=BLOCK_DAYS):
+        """
+        between() as a lazy row stream, read block_days at a time, for long ranges that should
+        not be materialized at once.
+        """
+        block_start = start_jd
+        while block_start < end_jd:
+            block_end = min(block_start + block_days, end_jd)
+            yield from self.between(block_start, block_end, bodies, kinds)
+            block_start = block_end
+
+    def next_event(self, body, kind, jd, index=None):
+        """
+        First event of a kind at or after jd, optionally entering a given index
+        (e.g. body=6, kind=SIGN, index=11: Saturn's next ingress into Pisces). None if none is left.
+        """
+        lo, hi = self._block(body, kind)
+        row = lo + int(np.searchsorted(self.jd[lo:hi], jd))
+        if index is not None:
+            matches = np.nonzero(self.events["index"][row:hi] == index)[0]
+            if len(matches) == 0:
+                return None
+            row += int(matches[0])
+        return self.events[row] if row < hi else None
+
+    def state_at(self, body, kind, jd):
+        """
+        Last event of a kind before jd (the sign / nakshatra / pada occupied then), or None.
+        """
+        lo, hi = self._block(body, kind)
+        row = lo + int(np.searchsorted(self.jd[lo:hi], jd)) - 1
+        return self.events[row] if row >= lo else None
+
+    @staticmethod
+    def describe(events, tz=0.0):
+        """
+        EVENT_DTYPE rows -> JSON-ready dicts. tz: hours added to UT for the "time" field.
+        """
+        events = np.atleast_1d(events)
+        times = jd_to_datetime64(events["jd"] + tz / 24.0).tolist()
+        records = []
+        for row, time in zip(events.tolist(), times):
+            jd, body, kind, index, retrograde, longitude = row
+            if kind == SIGN:
+                name = SIGN_NAMES[index]
+            elif kind == NAKSHATRA:
+                name = NAKSHATRA_NAMES[index]
+            else:  # pada ingress or station: nakshatra and pada
+                name = f"{NAKSHATRA_NAMES[index // 4]} {index % 4 + 1}"
+            records.append({
+                "time": time,
+                "jd": jd,
+                "planet": PLANET_NAMES[body],
+                "event": EVENT_KINDS[kind],
+                "index": index,
+                "name": name,
+                "retrograde": retrograde,
+                "longitude": round(longitude, 4),
+            })
+        return records
+
+
+if __name__ == "__main__":
+    from .ephemeris_table import EphemerisTable
+
+    print(f"Building event catalog at {os.path.abspath(DEFAULT_CATALOG_PATH)} ...")
+    catalog = EventCatalog.build(table=EphemerisTable.load_if_available())
+    print(f"  {len(catalog.events)} events, {catalog.events.nbytes / 1e6:.1f} MB")
@@ -0,0 +1,202 @@
+import json
+import math
+import sys
+from datetime import datetime
+import numpy as np
+from .chart import Planet
+from .engine import PLANET_NAMES
+from .tables import SIGN_NAMES
+
+# Subscribers per vectorized step: bounds memory for arbitrarily long inputs
+CHUNK_SIZE = 10000
+
+# Birth fields of a subscriber line and their ranges (the calendar date is checked as well)
+BIRTH_FIELDS = ["year", "month", "day", "hour", "minute", "latitude", "longitude", "timezone"]
+INTEGER_FIELDS = {"year", "month", "day", "hour", "minute"}
+BIRTH_RANGES = {
+    "year": (1900, 2100), "month": (1, 12), "day": (1, 31), "hour": (0, 23), "minute": (0, 59),
+    "latitude": (-90, 90), "longitude": (-180, 180), "timezone": (-14, 14),
+}
+
+
+def _number(value, integral):
+    """
+    JSON number (or numeric string) -> int if integral else float. None for bools, NaN and
+    infinities, and for non-integral values where an integer is expected (int() would truncate
+    them). TypeError / ValueError if non-numeric.
+    """
+    if isinstance(value, bool):
+        return None
+    number = float(value)
+    if not math.isfinite(number):
+        return None
+    if not integral:
+        return number
+    return int(number) if number.is_integer() else None
+
+
+def parse_subscriber(line):
+    """
+    One NDJSON line -> dict. Either stored signs ({"id", "ascendant_sign_id", "moon_sign_id"})
+    or birth details ({"id", "year", ..., "timezone", "ayanamsa"}). Bad lines become
+    {"id", "error"} instead of failing the whole run.
+    """
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return {"id": None, "error": "Invalid JSON"}
+    if not isinstance(record, dict):
+        return {"id": None, "error": "Expected a JSON object"}
+
+    sub = {"id": record.get("id")}
+    try:
+        if all(f in record for f in BIRTH_FIELDS):
+            for f in BIRTH_FIELDS:
+                integral = f in INTEGER_FIELDS
+                sub[f] = _number(record[f], integral)
+                if sub[f] is None:
+                    return {"id": sub["id"], "error": f"{f} must be {'an integer' if integral else 'a finite number'}"}
+                low, high = BIRTH_RANGES[f]
+                if not low <= sub[f] <= high:
+                    return {"id": sub["id"], "error": f"{f} must be in {low}..{high}"}
+            try:
+                datetime(sub["year"], sub["month"], sub["day"])
+            except ValueError:
+                return {"id": sub["id"], "error": f"Invalid date {sub['year']}-{sub['month']:02d}-{sub['day']:02d}"}
+            sub["ayanamsa"] = str(record.get("ayanamsa") or "LAHIRI")
+        elif "ascendant_sign_id" in record:
+            # Only the Moon sign may be unknown (null or absent)
+            if record["ascendant_sign_id"] is None:
+                return {"id": sub["id"], "error": "ascendant_sign_id is required"}
+            for f in ["ascendant_sign_id", "moon_sign_id"]:
+                value = record.get(f)
+                if value is None:
+                    sub[f] = -1
+                    continue
+                sub[f] = _number(value, True)
+                if sub[f] is None or not 0 <= sub[f] < 12:
+                    return {"id": sub["id"], "error": f"{f} must be an integer in 0..11"}
+        else:
+            return {"id": sub["id"], "error": "Need birth details or ascendant_sign_id"}
+    except (TypeError, ValueError):
+        return {"id": sub["id"], "error": "Non-numeric birth details or sign ids"}
+    return sub
+
+
+class BatchForecaster:
+    """
+    Daily transit digest for many subscribers against ONE sky snapshot (TransitEngine.sky).
+    Births in a chunk go through one calculate_charts_batch call; transit houses for the whole
+    chunk are a single broadcast (sky_sign - birth_sign) % 12 + 1 over an (n, 9) array.
+    Output is NDJSON: a sky header line, then one line per subscriber, in input order.
+    """
+
+    def __init__(self, transit_engine, predictions=False):
+        self.engine = transit_engine
+        self.predictions = predictions
+        # PREDICTION_TEXT[planet][house - 1], resolved once instead of per subscriber
+        self.PREDICTION_TEXT = [
+            [transit_engine.get_transit_prediction(name, h) for h in range(1, 13)]
+            for name in PLANET_NAMES
+        ]
+
+    def sky_line(self, sky):
+        grahas = []
+        for i, p in enumerate(sky.grahas):
+            graha = {"planet": p.name, "sign": SIGN_NAMES[p.sign_id], "sign_id": p.sign_id,
+                     "is_retrograde": p.is_retrograde}
+            if sky.next_sign_change is not None and sky.next_sign_change[i] is not None:
+                utc_time, sign = sky.next_sign_change[i]
+                graha["next_sign_change"] = {"time": utc_time.isoformat(), "sign": sign}
+            grahas.append(graha)
+        return json.dumps({"sky": {"minute": sky.minute.isoformat(), "grahas": grahas}}) + "\n"
+
+    def forecast_chunk(self, subscribers, sky):
+        """
+        Parsed subscribers -> list of result dicts against the given sky.
+        """
+        n = len(subscribers)
+        asc = np.full(n, -1, dtype=np.int64)
+        moon = np.full(n, -1, dtype=np.int64)
+
+        # 1. Stored signs are used as-is; births are charted together
+        births = []
+        for i, sub in enumerate(subscribers):
+            if "year" in sub:
+                births.append(i)
+            elif "ascendant_sign_id" in sub:
+                asc[i] = sub["ascendant_sign_id"]
+                moon[i] = sub["moon_sign_id"]
+        if births:
+            rows = [subscribers[i] for i in births]
+            cols = self.engine.calculate_charts_batch(
+                *[[r[f] for r in rows] for f in BIRTH_FIELDS], [r["ayanamsa"] for r in rows]
+            )
+            asc[births] = cols["ascendant"]["sign_id"]
+            moon[births] = cols["sign_id"][:, Planet.MOON]
+
+        # 2. Transit houses from the Ascendant and from the Moon, all subscribers at once
+        sky_signs = np.array([p.sign_id for p in sky.grahas], dtype=np.int64)
+        houses = ((sky_signs[None, :] - asc[:, None]) % 12 + 1).tolist()
+        moon_houses = ((sky_signs[None, :] - moon[:, None]) % 12 + 1).tolist()
+
+        results = []
+        for i, sub in enumerate(subscribers):
+            if "error" in sub:
+                results.append(sub)
+                continue
+            has_moon = moon[i] >= 0
+            result = {
+                "id": sub["id"],
+                "ascendant_sign_id": int(asc[i]),
+                "moon_sign_id": int(moon[i]) if has_moon else None,
+                "houses": houses[i],
+                "moon_houses": moon_houses[i] if has_moon else None,
+            }
+            if self.predictions:
+                result["predictions"] = [self.PREDICTION_TEXT[p][h - 1] for p, h in enumerate(houses[i])]
+            results.append(result)
+        return results
+
+    def render_chunk(self, lines, sky):
+        """
+        Raw NDJSON lines -> NDJSON text of their forecasts.
+        """
+        results = self.forecast_chunk([parse_subscriber(line) for line in lines], sky)
+        return "".join(json.dumps(r) + "\n" for r in results)
+
+    def stream(self, lines, chunk_size=CHUNK_SIZE, sky=None):
+        """
+        Lazily forecasts an iterable of NDJSON lines; memory stays at one chunk however long
+        the input is. The sky is read once, so a long run is consistent with its header.
+        """
+        sky = sky or self.engine.sky.get()
+        yield self.sky_line(sky)
+        chunk = []
+        for line in lines:
+            if not line.strip():
+                continue
+            chunk.append(line)
+            if len(chunk) >= chunk_size:
+                yield self.render_chunk(chunk, sky)
+                chunk = []
+        if chunk:
+            yield self.render_chunk(chunk, sky)
+
+
+if __name__ == "__main__":
+    # python -m src.astronomy.forecast [subscribers.ndjson] [--predictions] > forecasts.ndjson
+    from .events import EventCatalog
+    from .ephemeris_table import EphemerisTable
+    from .transits import TransitEngine
+
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    engine = TransitEngine(
+        ephemeris_table=EphemerisTable.load_if_available(),
+        event_catalog=EventCatalog.load_if_available(),
+    )
+    forecaster = BatchForecaster(engine, predictions="--predictions" in sys.argv)
+    source = open(args[0]) if args else sys.stdin
+    with source:
+        for block in forecaster.stream(source):
+            sys.stdout.write(block)
@@ -1,49 +1,64 @@
+from .arudhas import SIGN_CO_LORDS, arudha_signs, sign_lords
+from .chart import CHART_KEYS, Planet, as_chart
+from .tables import SIGN_NAMES
+
+# Standard 7-Karaka Scheme, highest degree first
+KARAKA_ROLES = [
+    "Atmakaraka (AK)",      # Self
+    "Amatyakaraka (AmK)",   # Career
+    "Bhatrikaraka (BK)",    # Siblings
+    "Matrikaraka (MK)",     # Mother
+    "Putrakaraka (PK)",     # Children
+    "Gnatikaraka (GK)",     # Relations/Rivals
+    "Darakaraka (DK)"       # Spouse
+]
+
+
 def get_chara_karakas(chart_data, include_rahu=False):
     """
     Calculates Jaimini Chara Karakas (AK, AmK, etc.) based on planetary degrees.
     """
-    
+
     # 1. Select candidates (usually 7 planets: Sun through Saturn)
-    valid_planets = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
-    if include_rahu:
-        valid_planets.append("Rahu")
-        
-    candidates = []
-    
-    for p_name in valid_planets:
-        if p_name not in chart_data:
-            continue
-            
-        p_data = chart_data[p_name]
-        
-        # Jaimini comparisons are based on degree within the sign (0-30), 
-        # ignoring the sign itself.
-        candidates.append({
-            "name": p_name,
-            "degree": p_data["degree"],
-            "sign": p_data["sign_id"]
-        })
-    
+    chart = as_chart(chart_data)
+    valid_planets = chart.positions[:Planet.RAHU + 1] if include_rahu else chart.positions[:Planet.RAHU]
+
     # 2. Sort Descending by Degree
+    # Jaimini comparisons are based on degree within the sign (0-30), ignoring the sign itself.
     # Logic: Highest degree = Atmakaraka (AK)
-    sorted_planets = sorted(candidates, key=lambda x: x["degree"], reverse=True)
-    
-    # 3. Assign Roles (Standard 7-Karaka Scheme)
-    roles = [
-        "Atmakaraka (AK)",      # Self
-        "Amatyakaraka (AmK)",   # Career
-        "Bhatrikaraka (BK)",    # Siblings
-        "Matrikaraka (MK)",     # Mother
-        "Putrakaraka (PK)",     # Children
-        "Gnatikaraka (GK)",     # Relations/Rivals
-        "Darakaraka (DK)"       # Spouse
-    ]
-    
-    results = {}
-    
-    # Assign available planets to roles
-    count = min(len(sorted_planets), len(roles))
-    for i in range(count):
-        results[roles[i]] = sorted_planets[i]
-        
-    return results
\ No newline at end of file
+    sorted_planets = sorted(
+        (p for p in valid_planets if p is not None), key=lambda p: p.degree, reverse=True
+    )
+
+    # 3. Assign available planets to roles
+    return {
+        role: {"name": p.name, "degree": p.degree, "sign": p.sign_id}
+        for role, p in zip(KARAKA_ROLES, sorted_planets)
+    }
+
+
+def jaimini_analysis(chart_data):
+    """
+    One Jaimini pass over a chart: chara karakas, the sign lords used for counting (with the
+    stronger co-lord of Scorpio / Aquarius), Arudha Padas A1-A12 with the 1st / 7th
+    exceptions, and the Upapada (A12). Padas carry their house from the lagna.
+    """
+    chart = as_chart(chart_data)
+    asc = chart.ascendant
+    lords = sign_lords(chart.positions)
+
+    arudhas = {}
+    for h, sign in enumerate(arudha_signs(chart, lords), start=1):
+        if sign is None: continue
+        arudhas[f"A{h}"] = {
+            "sign": SIGN_NAMES[sign],
+            "sign_id": sign,
+            "house": (sign - asc.sign_id) % 12 + 1,
+        }
+
+    return {
+        "karakas": get_chara_karakas(chart),
+        "arudhas": arudhas,
+        "upapada": arudhas.get("A12"),
+        "co_lords": {SIGN_NAMES[sign]: CHART_KEYS[lords[sign]] for sign in SIGN_CO_LORDS},
+    }
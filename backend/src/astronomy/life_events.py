@@ -0,0 +1,77 @@
+import heapq
+from operator import itemgetter
+import numpy as np
+from .engine import PLANET_NAMES
+from .events import DIRECT, EVENT_KINDS, RETROGRADE, SIGN, STATION_BODIES, datetime64_to_jd, jd_to_datetime64
+from .tables import JUPITER, KETU, RAHU, SATURN, SIGN_NAMES
+
+# Event sources of a life timeline: dasha period starts (every level), slow-graha sign
+# ingresses into natal houses, retrograde / direct stations
+TIMELINE_SOURCES = ["dasha", "ingress", "station"]
+SLOW_BODIES = [JUPITER, SATURN, RAHU, KETU]
+
+
+class LifeTimeline:
+    """
+    One chronological stream of a native's dasha changes and major transits. Each source is a
+    generator already in time order (DashaTimeline.changes, EventCatalog.iter_between), and
+    heapq.merge interleaves them, so a 120-year timeline is produced one event at a time and
+    a date range costs only the events inside it.
+    natal_signs: {"lagna", "moon"} sign ids for the houses of transit events (in the catalog's
+    ayanamsa). tz: hours from UT of the native's local time, used for every "time".
+    """
+
+    def __init__(self, dasha_timeline, natal_signs, catalog=None, tz=0.0):
+        self.dasha_timeline = dasha_timeline
+        self.natal_signs = natal_signs
+        self.catalog = catalog
+        self.tz = tz
+
+    def _to_jd(self, local_time):
+        return float(datetime64_to_jd(np.datetime64(local_time))) - self.tz / 24.0
+
+    def _catalog_changes(self, bodies, kinds, start, end):
+        catalog = self.catalog
+        start_jd = max(self._to_jd(start), catalog.start_jd)
+        end_jd = min(self._to_jd(end), catalog.end_jd)
+        lagna, moon = self.natal_signs["lagna"], self.natal_signs["moon"]
+        for row in catalog.iter_between(start_jd, end_jd, bodies, kinds):
+            jd, body, kind, index, retrograde, longitude = row.tolist()
+            # Ingresses carry the sign entered; stations the pada they occur in
+            sign = index if kind == SIGN else int(longitude // 30) % 12
+            yield jd_to_datetime64(jd + self.tz / 24.0).item(), {
+                "event": "ingress" if kind == SIGN else EVENT_KINDS[kind],
+                "planet": PLANET_NAMES[body],
+                "sign": SIGN_NAMES[sign],
+                "house": (sign - lagna) % 12 + 1,
+                "house_from_moon": (sign - moon) % 12 + 1,
+                "retrograde": retrograde,
+            }
+
+    def events(self, start=None, end=None, sources=TIMELINE_SOURCES, depth=None):
+        """
+        Events with start <= time < end (local datetimes; default: birth to the end of the
+        dasha timeline) from the given sources, in time order. Dasha levels stop at depth.
+        Ingress and station sources need the catalog and are clipped to its range.
+        """
+        timeline = self.dasha_timeline
+        start = timeline.birth_date if start is None else max(start, timeline.birth_date)
+        if end is None:
+            end = timeline.to_date(timeline.end[timeline.template.offsets[1] - 1] + timeline.shift)
+
+        streams = []
+        if "dasha" in sources:
+            streams.append(tagged(timeline.changes(start, end, depth), "dasha"))
+        if self.catalog is not None:
+            if "ingress" in sources:
+                streams.append(tagged(self._catalog_changes(SLOW_BODIES, [SIGN], start, end), "transit"))
+            if "station" in sources:
+                streams.append(tagged(self._catalog_changes(STATION_BODIES, [RETROGRADE, DIRECT], start, end), "transit"))
+
+        for time, source, event in heapq.merge(*streams, key=itemgetter(0)):
+            yield {"time": time, "source": source, **event}
+
+
+def tagged(stream, source):
+    for time, event in stream:
+        yield time, source, event
@@ -1,3 +1,6 @@
+from .chart import Planet, as_chart
+
+
 class MatchMaker:
     def __init__(self):
         # Friendship Table for Moon Signs (Simplified Vedic Logic)
@@ -12,20 +15,19 @@ class MatchMaker:
         Mars in 1, 4, 7, 8, 12 from Ascendant or Moon is considered Manglik.
         """
         mars_houses = []
+        chart = as_chart(chart)
+        mars = chart.positions[Planet.MARS]
+        moon = chart.positions[Planet.MOON]
 
         # 1. Check from Ascendant
-        if "Mars" in chart and "Ascendant" in chart:
-            asc_id = chart["Ascendant"]["sign_id"]
-            mars_id = chart["Mars"]["sign_id"]
-            h_asc = (mars_id - asc_id) % 12 + 1
+        if mars is not None and chart.ascendant is not None:
+            h_asc = (mars.sign_id - chart.ascendant.sign_id) % 12 + 1
             if h_asc in [1, 4, 7, 8, 12]:
                 mars_houses.append(f"Ascendant (House {h_asc})")
 
         # 2. Check from Moon
-        if "Mars" in chart and "Moon" in chart:
-            moon_id = chart["Moon"]["sign_id"]
-            mars_id = chart["Mars"]["sign_id"]
-            h_moon = (mars_id - moon_id) % 12 + 1
+        if mars is not None and moon is not None:
+            h_moon = (mars.sign_id - moon.sign_id) % 12 + 1
             if h_moon in [1, 4, 7, 8, 12]:
                 mars_houses.append(f"Moon (House {h_moon})")
 
@@ -37,6 +39,8 @@ class MatchMaker:
         Compares Person A vs Person B using Ashta Koota (36 Points)
         """
         report = {}
+        chart_a = as_chart(chart_a)
+        chart_b = as_chart(chart_b)
 
         # 1. MANGLIK CHECK
         a_manglik, a_reasons = self.check_manglik(chart_a)
@@ -70,11 +74,13 @@ class MatchMaker:
             "Nadi": 8,
         }
 
-        if "Moon" in chart_a and "Moon" in chart_b:
-            m1 = chart_a["Moon"]["sign_id"]
-            m2 = chart_b["Moon"]["sign_id"]
-            nak1 = chart_a["Moon"].get("nakshatra_id", 0)
-            nak2 = chart_b["Moon"].get("nakshatra_id", 0)
+        moon_a = chart_a.positions[Planet.MOON]
+        moon_b = chart_b.positions[Planet.MOON]
+        if moon_a is not None and moon_b is not None:
+            m1 = moon_a.sign_id
+            m2 = moon_b.sign_id
+            nak1 = moon_a.nakshatra_id
+            nak2 = moon_b.nakshatra_id
 
             # A. VARNA (1 pt)
             e1 = m1 % 4
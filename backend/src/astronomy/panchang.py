@@ -0,0 +1,286 @@
+import json
+import sys
+import numpy as np
+import swisseph as swe
+from .ayanamsa import AyanamsaSystem
+from .events import datetime64_to_jd, jd_to_datetime64
+from .tables import JUPITER, MARS, MERCURY, MOON, NAKSHATRA_NAMES, NAKSHATRA_SPAN, SATURN, SUN, VENUS
+from .upagrahas import WEEKDAY_NAMES, SunriseTable
+
+_TITHIS = [
+    "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami", "Shashthi", "Saptami", "Ashtami",
+    "Navami", "Dashami", "Ekadashi", "Dwadashi", "Trayodashi", "Chaturdashi",
+]
+TITHI_NAMES = [f"Shukla {t}" for t in _TITHIS] + ["Purnima"] + [f"Krishna {t}" for t in _TITHIS] + ["Amavasya"]
+
+YOGA_NAMES = [
+    "Vishkambha", "Priti", "Ayushman", "Saubhagya", "Shobhana", "Atiganda", "Sukarma", "Dhriti",
+    "Shula", "Ganda", "Vriddhi", "Dhruva", "Vyaghata", "Harshana", "Vajra", "Siddhi", "Vyatipata",
+    "Variyan", "Parigha", "Shiva", "Siddha", "Sadhya", "Shubha", "Shukla", "Brahma", "Indra", "Vaidhriti",
+]
+
+# 60 half-tithis: fixed Kimstughna first, the 7 movable karanas 8 times, then 3 fixed ones
+_MOVABLE_KARANAS = ["Bava", "Balava", "Kaulava", "Taitila", "Garaja", "Vanija", "Vishti"]
+KARANA_NAMES = ["Kimstughna"] + _MOVABLE_KARANAS * 8 + ["Shakuni", "Chatushpada", "Naga"]
+
+# Limbs whose end times are root-found, as linear combinations of the Sun's and Moon's tropical
+# longitudes and the ayanamsa: (limb, Sun, Moon, ayanamsa coefficient, span in degrees, names).
+# Tithis are every second karana boundary (12 degrees of elongation).
+LIMBS = [
+    ("karana", -1.0, 1.0, 0.0, 6.0, KARANA_NAMES),
+    ("nakshatra", 0.0, 1.0, -1.0, NAKSHATRA_SPAN, NAKSHATRA_NAMES),
+    ("yoga", 1.0, 1.0, -2.0, NAKSHATRA_SPAN, YOGA_NAMES),
+]
+LIMB_COEFFICIENTS = np.array([limb[1:4] for limb in LIMBS])
+LIMB_SPANS = np.array([limb[4] for limb in LIMBS])
+
+# Rahu Kaal: which of the 8 day portions (1-based), Sunday first
+RAHU_KAAL_PORTION = [8, 2, 7, 5, 6, 4, 3]
+# Hora lords follow the Chaldean order from the weekday lord; 12 day + 12 night horas
+CHALDEAN_ORDER = [SATURN, JUPITER, MARS, SUN, VENUS, MERCURY, MOON]
+GRAHA_NAMES = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
+HORA_LORDS = [
+    [GRAHA_NAMES[CHALDEAN_ORDER[(CHALDEAN_ORDER.index(weekday) + h) % 7]] for h in range(24)]
+    for weekday in range(7)
+]
+
+
+class PanchangEngine:
+    """
+    Panchang (tithi, nakshatra, yoga, karana, vara, Rahu Kaal, horas) for runs of days at a place.
+    Limb end times are roots of monotonic functions of the Sun and Moon (elongation, sidereal
+    Moon, their sum): bracketed on a daily grid and refined by one vectorized Newton pass over
+    every boundary of the run, not found by minute sampling. Sunrises come from a SunriseTable,
+    so the days are those of the city's sunrise (local dates in local mean time).
+    """
+
+    STEP_DAYS = 1.0  # grid step: the fastest limb (karana) moves at most ~3 spans a day
+    MARGIN_DAYS = 2.0  # grid extension, so the last day's limbs end inside it
+    TOLERANCE_DAYS = 1e-6  # ~0.1 s
+    MAX_ITERATIONS = 20
+
+    def __init__(self, ephemeris_table=None, sunrise_cache_size=65536):
+        self.ephemeris_table = ephemeris_table
+        self.sunrises = SunriseTable(sunrise_cache_size)
+
+    def sun_moon(self, jds):
+        """
+        Tropical longitudes and speeds of the Sun and Moon, two arrays of shape (len(jds), 2).
+        """
+        table = self.ephemeris_table
+        if table is not None and len(jds) and table.start_jd <= jds.min() and jds.max() < table.end_jd:
+            lon, speed = table.positions_batch(jds)
+            return lon[:, :2], speed[:, :2]
+        lon = np.empty((len(jds), 2))
+        speed = np.empty((len(jds), 2))
+        for i, jd in enumerate(jds.tolist()):
+            for j, code in enumerate((swe.SUN, swe.MOON)):
+                xx = swe.calc_ut(jd, code, swe.FLG_SWIEPH | swe.FLG_SPEED)[0]
+                lon[i, j], speed[i, j] = xx[0], xx[3]
+        return lon, speed
+
+    def boundaries(self, start_jd, end_jd, ayanamsa):
+        """
+        Every limb boundary in about [start_jd, end_jd]: {limb: (times, index entered)}, in time order.
+        """
+        # 1. Daily grid: unwrapped limb values, boundary crossings per interval, linear first guesses
+        grid = np.arange(start_jd - self.MARGIN_DAYS, end_jd + self.MARGIN_DAYS, self.STEP_DAYS)
+        lon, _ = self.sun_moon(grid)
+        values = np.column_stack([lon, ayanamsa.value(grid)]) @ LIMB_COEFFICIENTS.T
+        u = np.degrees(np.unwrap(np.radians(values % 360.0), axis=0))
+        k = np.floor(u / LIMB_SPANS).astype(np.int64)
+
+        limb, boundary, lo, t = [], [], [], []
+        for i in range(len(LIMBS)):
+            count = np.diff(k[:, i])
+            interval = np.repeat(np.arange(len(count)), count)
+            nth = np.arange(len(interval)) - np.repeat(np.cumsum(count) - count, count)
+            crossed = k[interval, i] + 1 + nth
+            u_lo, u_hi = u[interval, i], u[interval + 1, i]
+            limb.append(np.full(len(interval), i))
+            boundary.append(crossed)
+            lo.append(grid[interval])
+            t.append(grid[interval] + (crossed * LIMB_SPANS[i] - u_lo) / (u_hi - u_lo) * self.STEP_DAYS)
+        limb, boundary, lo, t = (np.concatenate(a) for a in (limb, boundary, lo, t))
+        hi = lo + self.STEP_DAYS
+        coefficients = LIMB_COEFFICIENTS[limb]
+        target = (boundary * LIMB_SPANS[limb]) % 360.0
+
+        # 2. Safeguarded Newton on all boundaries at once (every limb only ever increases)
+        pending = np.arange(len(t))
+        for _ in range(self.MAX_ITERATIONS):
+            if len(pending) == 0:
+                break
+            tp = t[pending]
+            lon, speed = self.sun_moon(tp)
+            c = coefficients[pending]
+            ayanamsa_now = ayanamsa.value(tp)
+            ayanamsa_rate = ayanamsa.value(tp + 0.5) - ayanamsa.value(tp - 0.5)
+            f = c[:, 0] * lon[:, 0] + c[:, 1] * lon[:, 1] + c[:, 2] * ayanamsa_now - target[pending]
+            f = (f + 180.0) % 360.0 - 180.0
+            rate = c[:, 0] * speed[:, 0] + c[:, 1] * speed[:, 1] + c[:, 2] * ayanamsa_rate
+
+            before = f < 0  # root is later than tp
+            lo[pending] = np.where(before, tp, lo[pending])
+            hi[pending] = np.where(before, hi[pending], tp)
+            step = f / rate
+            newton = tp - step
+            inside = (newton > lo[pending]) & (newton < hi[pending])
+            t[pending] = np.where(inside, newton, 0.5 * (lo[pending] + hi[pending]))
+            done = inside & (np.abs(step) < self.TOLERANCE_DAYS) | (hi[pending] - lo[pending] < self.TOLERANCE_DAYS)
+            pending = pending[~done]
+
+        result = {}
+        for i, (name, _, _, _, _, names) in enumerate(LIMBS):
+            mine = limb == i
+            result[name] = (t[mine], boundary[mine] % len(names))
+        times, entered = result["karana"]
+        even = entered % 2 == 0
+        result["tithi"] = (times[even], entered[even] // 2)
+        return result
+
+    def days(self, first_day, count, lat, lon, tz=0.0, ayanamsa_mode="LAHIRI"):
+        """
+        Panchang records for `count` local dates from first_day (Julian Day Number), in order.
+        Each limb lists every element prevailing from sunrise to the next sunrise with its end
+        time (the last one ends after the next sunrise). Times are local at tz hours from UT.
+        ValueError where the Sun does not rise or set.
+        """
+        ayanamsa = AyanamsaSystem.get_model(ayanamsa_mode)
+        sunrise, sunset, next_sunrise = self.sunrises.days(first_day, count, self.sunrises.cell(lat, lon))
+        limbs = self.boundaries(sunrise[0], next_sunrise[-1], ayanamsa)
+        offset = tz / 24.0
+        weekdays = (np.arange(first_day, first_day + count) + 1) % 7
+
+        # 1. Every time of the run converted to local datetimes in bulk
+        dates = jd_to_datetime64(np.arange(first_day, first_day + count) - 0.5).astype("datetime64[D]").tolist()
+        portion = (sunset - sunrise) / 8.0
+        rahu_start = sunrise + (np.array(RAHU_KAAL_PORTION)[weekdays] - 1) * portion
+        horas = np.concatenate([
+            sunrise[:, None] + np.arange(12) * ((sunset - sunrise) / 12.0)[:, None],
+            sunset[:, None] + np.arange(12) * ((next_sunrise - sunset) / 12.0)[:, None],
+        ], axis=1)
+        local = {
+            name: jd_to_datetime64(jds + offset).tolist()
+            for name, jds in (
+                ("sunrise", sunrise), ("sunset", sunset), ("rahu_start", rahu_start),
+                ("rahu_end", rahu_start + portion),
+            )
+        }
+        hora_starts = jd_to_datetime64(horas + offset).tolist()
+
+        # 2. Per limb: the boundaries between each sunrise and the next one
+        spans = {}
+        for name, names in (("tithi", TITHI_NAMES), ("nakshatra", NAKSHATRA_NAMES), ("yoga", YOGA_NAMES), ("karana", KARANA_NAMES)):
+            times, entered = limbs[name]
+            first = np.searchsorted(times, sunrise, side="right").tolist()
+            last = np.searchsorted(times, next_sunrise, side="right").tolist()
+            ends = jd_to_datetime64(times + offset).tolist()
+            ended = [names[i] for i in ((entered - 1) % len(names)).tolist()]
+            spans[name] = [
+                [{"name": ended[j], "end": ends[j]} for j in range(a, b + 1)] for a, b in zip(first, last)
+            ]
+
+        records = []
+        for d, weekday in enumerate(weekdays.tolist()):
+            records.append({
+                "date": dates[d],
+                "weekday": WEEKDAY_NAMES[weekday],
+                "sunrise": local["sunrise"][d],
+                "sunset": local["sunset"][d],
+                "tithi": spans["tithi"][d],
+                "nakshatra": spans["nakshatra"][d],
+                "yoga": spans["yoga"][d],
+                "karana": spans["karana"][d],
+                "rahu_kaal": {"start": local["rahu_start"][d], "end": local["rahu_end"][d]},
+                "horas": [{"lord": lord, "start": start} for lord, start in zip(HORA_LORDS[weekday], hora_starts[d])],
+            })
+        return records
+
+    def year(self, year, lat, lon, tz=0.0, ayanamsa_mode="LAHIRI"):
+        """
+        Panchang records for every date of a calendar year at one place (bulk mode).
+        """
+        first = int(round(float(datetime64_to_jd(np.datetime64(f"{year:04d}-01-01"))) + 0.5))
+        last = int(round(float(datetime64_to_jd(np.datetime64(f"{year + 1:04d}-01-01"))) + 0.5))
+        return self.days(first, last - first, lat, lon, tz, ayanamsa_mode)
+
+    def stream(self, year, locations, ayanamsa_mode="LAHIRI"):
+        """
+        City-years one after another as records tagged with "city". locations: dicts with
+        "name", "latitude", "longitude", "timezone". A place where the Sun does not rise or set
+        yields one {"city", "error"} record instead of its year.
+        """
+        for place in locations:
+            try:
+                records = self.year(year, place["latitude"], place["longitude"], place["timezone"], ayanamsa_mode)
+            except ValueError as e:
+                yield {"city": place.get("name"), "error": str(e)}
+                continue
+            for record in records:
+                yield {"city": place.get("name"), **record}
+
+
+def to_ndjson(records):
+    """
+    Records -> NDJSON lines (dates and datetimes as ISO 8601).
+    """
+    for record in records:
+        yield json.dumps(record, default=lambda o: o.isoformat()) + "\n"
+
+
+def parquet_schema():
+    """
+    Explicit pyarrow schema of a city-day record (nested limbs / horas as list<struct> columns),
+    so the table never depends on which record comes first. Needs pyarrow.
+    """
+    import pyarrow as pa
+
+    time = pa.timestamp("us")
+    span = pa.list_(pa.struct([("name", pa.string()), ("end", time)]))
+    return pa.schema([
+        ("city", pa.string()),
+        ("date", pa.date32()),
+        ("weekday", pa.string()),
+        ("sunrise", time),
+        ("sunset", time),
+        ("tithi", span),
+        ("nakshatra", span),
+        ("yoga", span),
+        ("karana", span),
+        ("rahu_kaal", pa.struct([("start", time), ("end", time)])),
+        ("horas", pa.list_(pa.struct([("lord", pa.string()), ("start", time)]))),
+    ])
+
+
+def to_parquet(records, sink):
+    """
+    Writes the city-day records as one Parquet table with parquet_schema(). {"city", "error"}
+    records are kept out of the table: they go to the schema metadata ("errors", a JSON list)
+    and are returned. Needs pyarrow; ImportError otherwise.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rows, errors = [], []
+    for record in records:
+        (errors if "error" in record else rows).append(record)
+    schema = parquet_schema().with_metadata({"errors": json.dumps(errors)})
+    pq.write_table(pa.Table.from_pylist(rows, schema=schema), sink)
+    return errors
+
+
+if __name__ == "__main__":
+    # python -m src.astronomy.panchang YEAR LAT LON TZ [--parquet=out.parquet] > panchang.ndjson
+    from .ephemeris_table import EphemerisTable
+
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    engine = PanchangEngine(EphemerisTable.load_if_available())
+    place = {"name": None, "latitude": float(args[1]), "longitude": float(args[2]), "timezone": float(args[3])}
+    records = engine.stream(int(args[0]), [place])
+    parquet = [a.split("=", 1)[1] for a in sys.argv[1:] if a.startswith("--parquet=")]
+    if parquet:
+        for error in to_parquet(records, parquet[0]):
+            print(f"{error['city']}: {error['error']}", file=sys.stderr)
+    else:
+        sys.stdout.writelines(to_ndjson(records))
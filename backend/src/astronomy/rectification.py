@@ -0,0 +1,198 @@
+import math
+from datetime import datetime, timedelta
+import swisseph as swe
+
+from .chart import CHART_KEYS
+from .tables import NAKSHATRA_LORD
+from .vargas import varga_sign
+
+# Every lagna, navamsa-lagna, nakshatra and pada boundary is a multiple of 3°20'
+# (30° = 9 navamsas, 13°20' nakshatra = 4 padas), so one grid covers them all.
+GRID_DEG = 30.0 / 9.0
+GRID_CELLS = 108
+
+
+def _angle_diff(a, b):
+    """
+    Signed a - b in degrees, wrapped into [-180, 180).
+    """
+    return (a - b + 180.0) % 360.0 - 180.0
+
+
+class RectificationEngine:
+    """
+    Birth-time rectification sweep.
+    Splits a time window into the sub-intervals over which the chart keeps the same lagna,
+    navamsa lagna, Moon nakshatra and pada (and so the same birth dasha lord).
+
+    Instead of one chart per minute, the Ascendant and Moon are sampled coarsely and every
+    grid crossing in between is solved with Illinois regula falsi, so a +/-2 hour sweep
+    takes a few dozen ephemeris evaluations.
+
+    The sweep relies on the Ascendant always moving forward, which only holds inside the polar
+    circles (90° - obliquity): higher latitudes are rejected.
+    """
+
+    SEED_MINUTES = 30.0     # coarse sampling step
+    MAX_STEP_DEGREES = 90.0  # seed steps over which a body moves further are halved
+    MAX_LATITUDE = 66.5
+    TOLERANCE_SECONDS = 1.0
+
+    def __init__(self, astro_engine):
+        self.astro = astro_engine
+
+    # --- Sidereal longitudes (one evaluation each) ---
+
+    def _ascendant(self, jd, lat, lon, ayanamsa_mode):
+        asc_tropical = swe.houses_ex(jd, lat, lon, b'A')[1][0]
+        return (asc_tropical - self.astro.get_ayanamsa(jd, ayanamsa_mode)) % 360
+
+    def _moon(self, jd, ayanamsa_mode):
+        moon_tropical = swe.calc_ut(jd, swe.MOON, swe.FLG_SWIEPH)[0][0]
+        return (moon_tropical - self.astro.get_ayanamsa(jd, ayanamsa_mode)) % 360
+
+    # --- Root finding ---
+
+    def _solve(self, f, t0, g0, t1, g1):
+        """
+        Illinois regula falsi for g(t) = f(t) - target with g0 < 0 <= g1 (g is the signed angular
+        distance to the boundary). Returns the crossing time (JD) to TOLERANCE_SECONDS.
+        """
+        tol = self.TOLERANCE_SECONDS / 86400.0
+        side = 0
+        t = t0
+        while t1 - t0 > tol:
+            t_new = t0 - g0 * (t1 - t0) / (g1 - g0)
+            converged = abs(t_new - t) < tol
+            t = t_new
+            if converged:
+                break
+            g = f(t)
+            if g < 0:
+                t0, g0 = t, g
+                if side == -1:
+                    g1 /= 2.0
+                side = -1
+            else:
+                t1, g1 = t, g
+                if side == 1:
+                    g0 /= 2.0
+                side = 1
+        return t
+
+    def _samples(self, longitude, jds):
+        """
+        [(jd, longitude)] at the seed instants, plus midpoints wherever the body moves more than
+        MAX_STEP_DEGREES between two samples (the Ascendant near the polar circles moves very
+        unevenly), down to the root-finding tolerance.
+        """
+        min_step = self.TOLERANCE_SECONDS / 86400.0
+        samples = [(jds[0], longitude(jds[0]))]
+        for t1 in jds[1:]:
+            # Ends of the steps still to check, nearest last
+            pending = [(t1, longitude(t1))]
+            while pending:
+                t0, lon0 = samples[-1]
+                t, lon = pending[-1]
+                if (lon - lon0) % 360.0 > self.MAX_STEP_DEGREES and t - t0 > min_step:
+                    mid = (t0 + t) / 2.0
+                    pending.append((mid, longitude(mid)))
+                else:
+                    samples.append(pending.pop())
+        return samples
+
+    def _crossings(self, longitude, samples):
+        """
+        All times in [samples[0], samples[-1]] where longitude(t) crosses a GRID_DEG multiple.
+        samples are (jd, longitude) pairs from _samples.
+        Returns (grid cell at the first sample, [(jd, grid cell entered)]) in time order.
+        """
+        crossings = []
+        t0, lon0 = samples[0]
+        start_cell = int(lon0 // GRID_DEG)
+        for t1, lon1 in samples[1:]:
+            # Unwrapped end of this step; motion is forward for Ascendant and Moon
+            end = lon0 + (lon1 - lon0) % 360.0
+            k = math.floor(lon0 / GRID_DEG) + 1
+            while k * GRID_DEG <= end:
+                target = k * GRID_DEG
+
+                def g(t, target=target):
+                    return _angle_diff(longitude(t), target)
+
+                root = self._solve(g, t0, lon0 - target, t1, end - target)
+                crossings.append((root, k % GRID_CELLS))
+                # The next boundary is bracketed by this root and the end of the step
+                t0, lon0 = root, target
+                k += 1
+            t0, lon0 = t1, end
+        return start_cell, crossings
+
+    # --- Public API ---
+
+    def _state(self, asc_cell, moon_cell):
+        nakshatra_id = moon_cell // 4
+        return {
+            "lagna_sign_id": asc_cell // 9,
+            "navamsa_lagna_sign_id": varga_sign((asc_cell + 0.5) * GRID_DEG, 9),
+            "moon_nakshatra_id": nakshatra_id,
+            "moon_pada": moon_cell % 4 + 1,
+            "birth_dasha_lord": CHART_KEYS[NAKSHATRA_LORD[nakshatra_id]],
+        }
+
+    def sweep(self, year, month, day, hour, minute, lat, lon, tz, window_minutes=30, ayanamsa_mode="LAHIRI"):
+        """
+        Rectification sweep over [birth - window_minutes, birth + window_minutes] (local time).
+        Returns the invariant intervals (local datetimes) and the number of evaluations used.
+        ValueError beyond MAX_LATITUDE.
+        """
+        if abs(lat) > self.MAX_LATITUDE:
+            raise ValueError(
+                f"Rectification needs |latitude| <= {self.MAX_LATITUDE}: beyond the polar circles the Ascendant can move backwards"
+            )
+        evaluations = {"ascendant": 0, "moon": 0}
+
+        def ascendant(t):
+            evaluations["ascendant"] += 1
+            return self._ascendant(t, lat, lon, ayanamsa_mode)
+
+        def moon(t):
+            evaluations["moon"] += 1
+            return self._moon(t, ayanamsa_mode)
+
+        birth = datetime(year, month, day, hour, minute)
+        jd_birth = self.astro.get_julian_day(year, month, day, hour, minute, tz)
+        jd_start = jd_birth - window_minutes / 1440.0
+        jd_end = jd_birth + window_minutes / 1440.0
+
+        # 1. Seed instants (always including both ends)
+        steps = max(1, int(math.ceil(2 * window_minutes / self.SEED_MINUTES)))
+        seeds = [jd_start + (jd_end - jd_start) * i / steps for i in range(steps + 1)]
+
+        # 2. Solve every boundary crossing
+        asc_cell, asc_crossings = self._crossings(ascendant, self._samples(ascendant, seeds))
+        # The Moon moves ~13°/day: the two window ends are enough to bracket it
+        moon_cell, moon_crossings = self._crossings(moon, self._samples(moon, [jd_start, jd_end]))
+        boundaries = sorted(
+            [(t, "ascendant", cell) for t, cell in asc_crossings] + [(t, "moon", cell) for t, cell in moon_crossings]
+        )
+
+        # 3. Walk the boundaries, tracking which grid cell each body is in
+        # Local time, to the second (the root-finding tolerance)
+        to_local = lambda t: birth + timedelta(seconds=round((t - jd_birth) * 86400))
+        intervals = [dict(start=to_local(jd_start), **self._state(asc_cell, moon_cell))]
+        for t, body, cell in boundaries:
+            if body == "ascendant":
+                asc_cell = cell
+            else:
+                moon_cell = cell
+            intervals[-1]["end"] = to_local(t)
+            intervals.append(dict(start=to_local(t), **self._state(asc_cell, moon_cell)))
+        intervals[-1]["end"] = to_local(jd_end)
+
+        return {
+            "window_start": to_local(jd_start),
+            "window_end": to_local(jd_end),
+            "intervals": intervals,
+            "evaluations": evaluations,
+        }
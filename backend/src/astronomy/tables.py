@@ -0,0 +1,83 @@
+# Shared classical lookup tables. Graha indices follow chart.Planet (Sun=0 ... Ketu=8);
+# they are spelled out here so this module has no imports and any engine can use it.
+SUN, MOON, MARS, MERCURY, JUPITER, VENUS, SATURN, RAHU, KETU = range(9)
+
+SIGN_NAMES = [
+    "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+    "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces",
+]
+
+# 1. SIGN LORDS (0=Aries ... 11=Pisces)
+SIGN_LORD = [MARS, VENUS, MERCURY, MOON, SUN, MERCURY, VENUS, MARS, JUPITER, SATURN, SATURN, JUPITER]
+
+# HOUSE_LORDS[asc_sign][house - 1] -> graha ruling that house
+HOUSE_LORDS = [[SIGN_LORD[(asc + h) % 12] for h in range(12)] for asc in range(12)]
+
+# 2. NAKSHATRAS (27 x 13°20', 4 padas of 3°20' each)
+NAKSHATRA_SPAN = 360.0 / 27.0
+PADA_SPAN = NAKSHATRA_SPAN / 4.0
+
+NAKSHATRA_NAMES = [
+    "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra", "Punarvasu",
+    "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni", "Hasta",
+    "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha", "Mula", "Purva Ashadha",
+    "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha", "Purva Bhadrapada",
+    "Uttara Bhadrapada", "Revati",
+]
+
+# Vimshottari lord of each nakshatra (Ketu, Venus, Sun, Moon, Mars, Rahu, Jupiter, Saturn, Mercury x 3)
+NAKSHATRA_LORD = [KETU, VENUS, SUN, MOON, MARS, RAHU, JUPITER, SATURN, MERCURY] * 3
+
+# 3. DIGNITY (the 7 visible grahas; Rahu/Ketu have none)
+EXALTATION_SIGN = {SUN: 0, MOON: 1, MARS: 9, MERCURY: 5, JUPITER: 3, VENUS: 11, SATURN: 6}
+DEBILITATION_SIGN = {p: (s + 6) % 12 for p, s in EXALTATION_SIGN.items()}
+OWN_SIGNS = {p: [s for s, lord in enumerate(SIGN_LORD) if lord == p] for p in EXALTATION_SIGN}
+
+# Moolatrikona: (sign, from degree, to degree)
+MOOLATRIKONA = {
+    SUN: (4, 0, 20), MOON: (1, 3, 30), MARS: (0, 0, 12), MERCURY: (5, 15, 20),
+    JUPITER: (8, 0, 10), VENUS: (6, 0, 15), SATURN: (10, 0, 20),
+}
+
+# Naisargika (natural) friendships; anything not listed is neutral
+NATURAL_FRIENDS = {
+    SUN: [MOON, MARS, JUPITER], MOON: [SUN, MERCURY], MARS: [SUN, MOON, JUPITER],
+    MERCURY: [SUN, VENUS], JUPITER: [SUN, MOON, MARS], VENUS: [MERCURY, SATURN],
+    SATURN: [MERCURY, VENUS],
+}
+NATURAL_ENEMIES = {
+    SUN: [VENUS, SATURN], MOON: [], MARS: [MERCURY], MERCURY: [MOON],
+    JUPITER: [MERCURY, VENUS], VENUS: [SUN, MOON], SATURN: [SUN, MOON, MARS],
+}
+
+
+def _sign_dignity(planet, sign):
+    if planet not in EXALTATION_SIGN:
+        return None
+    if sign == EXALTATION_SIGN[planet]:
+        return "Exalted"
+    if sign == DEBILITATION_SIGN[planet]:
+        return "Debilitated"
+    if sign in OWN_SIGNS[planet]:
+        return "Own"
+    lord = SIGN_LORD[sign]
+    if lord in NATURAL_FRIENDS[planet]:
+        return "Friend"
+    if lord in NATURAL_ENEMIES[planet]:
+        return "Enemy"
+    return "Neutral"
+
+
+# DIGNITY[planet][sign]: sign-level dignity (Moolatrikona needs the degree, see dignity())
+DIGNITY = [[_sign_dignity(p, s) for s in range(12)] for p in range(9)]
+
+
+def dignity(planet, sign, degree):
+    """
+    Dignity of a graha at a sign/degree: Exalted, Moolatrikona, Own, Friend, Neutral,
+    Enemy, Debilitated (None for Rahu/Ketu).
+    """
+    mt = MOOLATRIKONA.get(planet)
+    if mt is not None and sign == mt[0] and mt[1] <= degree < mt[2]:
+        return "Moolatrikona"
+    return DIGNITY[planet][sign]
@@ -0,0 +1,141 @@
+import numpy as np
+from .engine import PLANET_NAMES
+from .events import SIGN, jd_to_datetime64
+from .tables import JUPITER, SATURN, SIGN_NAMES
+
+YEAR_DAYS = 365.25
+
+# (window, transiting graha, natal reference, houses counted from the reference's sign).
+# Consecutive stays in any of the houses form one window.
+WINDOW_RULES = [
+    ("sade_sati", SATURN, "moon", (12, 1, 2)),
+    ("ashtama_shani", SATURN, "moon", (8,)),
+    ("kantaka_shani", SATURN, "moon", (1, 4, 7, 10)),
+    ("saturn_over_lagna", SATURN, "lagna", (1,)),
+    ("saturn_return", SATURN, "saturn", (1,)),
+    ("jupiter_over_moon", JUPITER, "moon", (1,)),
+    ("jupiter_over_lagna", JUPITER, "lagna", (1,)),
+    ("jupiter_return", JUPITER, "jupiter", (1,)),
+]
+WINDOW_NAMES = [rule[0] for rule in WINDOW_RULES]
+# IN_WINDOW[rule][house]: the rule's house set as a lookup row (index 0 unused)
+IN_WINDOW = np.zeros((len(WINDOW_RULES), 13), dtype=np.int8)
+for _rule, (_, _, _, _houses) in enumerate(WINDOW_RULES):
+    IN_WINDOW[_rule, list(_houses)] = 1
+TRANSIT_BODIES = [SATURN, JUPITER]
+
+
+class TransitWindowFinder:
+    """
+    Lifetime Saturn / Jupiter transit windows relative to natal signs, read off the exact
+    sign ingresses in an EventCatalog: a graha's sky is a sequence of sign stays, and every
+    window is a run of consecutive stays whose house from the natal sign is in a rule's set.
+    Retrograde re-entries are simply further stays (entered moving backwards), so a Sade Sati
+    interrupted by retrograde motion shows up as two windows with exact boundaries.
+    """
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+
+    def sign_stays(self, body, start_jd, end_jd):
+        """
+        Sign stays of a graha overlapping [start_jd, end_jd) as arrays (start, end, sign,
+        retrograde = entered moving backwards). The first / last stay keeps its true ingress /
+        egress outside the range; end is NaN if the catalog ends first. A stay already under
+        way when the catalog starts is dropped (its sign is unknown).
+        """
+        catalog = self.catalog
+        events = catalog.between(start_jd, end_jd, bodies=[body], kinds=[SIGN])
+        before = catalog.state_at(body, SIGN, start_jd)
+        after = catalog.next_event(body, SIGN, end_jd)
+        if before is not None:
+            events = np.concatenate([np.atleast_1d(before), events])
+        starts = events["jd"]
+        ends = np.append(starts[1:], after["jd"] if after is not None else np.nan)
+        return starts, ends, events["index"].astype(np.int64), events["retrograde"]
+
+    def find(self, natal_signs, start_jd, years=100, tz=0.0, windows=None):
+        """
+        natal_signs: reference -> natal sign id ("moon", "lagna", and optionally "saturn",
+        "jupiter"; rules whose reference is missing are skipped). Returns every window of
+        WINDOW_RULES and each graha's stays with houses from the Moon and the Lagna over
+        `years` from start_jd (clipped to the catalog). Times are local at tz hours from UT.
+        windows: WINDOW_NAMES to look for (default: all).
+        """
+        end_jd = min(start_jd + years * YEAR_DAYS, self.catalog.end_jd)
+        stays = {}
+        for body in TRANSIT_BODIES:
+            starts, ends, signs, retrograde = self.sign_stays(body, start_jd, end_jd)
+            stays[body] = {
+                "jd": starts,
+                "start": to_local_times(starts, tz),
+                "end": to_local_times(ends, tz),
+                "sign": signs,
+                "sign_list": signs.tolist(),
+                "retrograde": retrograde.tolist(),
+            }
+
+        # 1. Named windows: runs of stays in the rule's houses, found with one diff per rule
+        wanted = WINDOW_NAMES if windows is None else windows
+        windows = []
+        for rule, (name, body, reference, _) in enumerate(WINDOW_RULES):
+            if name not in wanted or natal_signs.get(reference) is None:
+                continue
+            s = stays[body]
+            house = (s["sign"] - natal_signs[reference]) % 12 + 1
+            edges = np.diff(IN_WINDOW[rule, house], prepend=0, append=0)
+            firsts = np.nonzero(edges == 1)[0]
+            lasts = np.nonzero(edges == -1)[0] - 1
+            if reference == PLANET_NAMES[body].lower() and len(firsts) and s["jd"][firsts[0]] <= start_jd:
+                # A return needs the graha to come back: the stay at birth is not one
+                firsts, lasts = firsts[1:], lasts[1:]
+            house = house.tolist()
+            for first, last in zip(firsts.tolist(), lasts.tolist()):
+                windows.append({
+                    "window": name,
+                    "planet": PLANET_NAMES[body],
+                    "reference": reference,
+                    "start": s["start"][first],
+                    "end": s["end"][last],
+                    "phases": [
+                        {
+                            "house": house[i],
+                            "sign": SIGN_NAMES[s["sign_list"][i]],
+                            "start": s["start"][i],
+                            "end": s["end"][i],
+                            "retrograde": s["retrograde"][i],
+                        }
+                        for i in range(first, last + 1)
+                    ],
+                })
+        windows.sort(key=lambda w: w["start"])
+
+        # 2. Every stay of each graha, with its house from the Moon and from the Lagna
+        transits = {}
+        for body in TRANSIT_BODIES:
+            s = stays[body]
+            from_moon = ((s["sign"] - natal_signs["moon"]) % 12 + 1).tolist()
+            from_lagna = ((s["sign"] - natal_signs["lagna"]) % 12 + 1).tolist()
+            transits[PLANET_NAMES[body]] = [
+                {
+                    "sign": SIGN_NAMES[sign],
+                    "start": s["start"][i],
+                    "end": s["end"][i],
+                    "house_from_moon": from_moon[i],
+                    "house_from_lagna": from_lagna[i],
+                    "retrograde": s["retrograde"][i],
+                }
+                for i, sign in enumerate(s["sign_list"])
+            ]
+
+        span_start, span_end = to_local_times(np.array([start_jd, end_jd]), tz)
+        return {"start": span_start, "end": span_end, "windows": windows, "transits": transits}
+
+
+def to_local_times(jds, tz=0.0):
+    """
+    Julian Days -> list of datetimes at tz hours from UT (None for NaN).
+    """
+    known = ~np.isnan(jds)
+    times = jd_to_datetime64(np.where(known, jds, 0.0) + tz / 24.0).tolist()
+    return [t if k else None for t, k in zip(times, known.tolist())]
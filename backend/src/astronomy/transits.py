@@ -1,60 +1,78 @@
-import swisseph as swe
-from datetime import datetime
+import threading
+from collections import namedtuple
+from datetime import datetime, timedelta
 from .engine import VedicAstroEngine
+from .chart import as_chart
+from .events import SIGN
+from .tables import SIGN_NAMES
+
+# One minute of sky: UTC minute, its Julian Day, the 9 grahas (PlanetPosition) and, when an
+# event catalog is available, each graha's next sign ingress ((UTC time, sign name) or None)
+SkySnapshot = namedtuple("SkySnapshot", ["minute", "jd", "grahas", "next_sign_change"])
+
+
+class CurrentSky:
+    """
+    Process-wide snapshot of the 9 grahas for the current UTC minute. Graha positions do not
+    depend on the observer, so every request in the same minute reads the same immutable
+    snapshot; the first read in a new minute rebuilds it (one graha computation per minute
+    instead of one per request). refresh() rebuilds it ahead of time, e.g. from a scheduler.
+    """
+
+    def __init__(self, engine, ayanamsa_mode="LAHIRI", event_catalog=None, clock=datetime.utcnow):
+        self.engine = engine
+        self.ayanamsa_mode = ayanamsa_mode
+        self.event_catalog = event_catalog
+        self.clock = clock
+        self.refreshes = 0
+        self._snapshot = None
+        self._lock = threading.Lock()
+
+    def _build(self, minute):
+        jd = self.engine.get_julian_day(minute.year, minute.month, minute.day, minute.hour, minute.minute, 0.0)
+        grahas = tuple(self.engine.calculate_grahas(jd, self.ayanamsa_mode))
+        next_sign_change = None
+        catalog = self.event_catalog
+        if catalog is not None and catalog.start_jd <= jd < catalog.end_jd:
+            next_sign_change = []
+            for p in grahas:
+                event = catalog.next_event(p.planet, SIGN, jd)
+                if event is None:
+                    next_sign_change.append(None)
+                else:
+                    record = catalog.describe(event)[0]
+                    next_sign_change.append((record["time"], record["name"]))
+            next_sign_change = tuple(next_sign_change)
+        self.refreshes += 1
+        return SkySnapshot(minute, jd, grahas, next_sign_change)
+
+    def get(self):
+        minute = self.clock().replace(second=0, microsecond=0)
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.minute != minute:
+            with self._lock:
+                # Another thread may have rebuilt it while we waited
+                snapshot = self._snapshot
+                if snapshot is None or snapshot.minute != minute:
+                    snapshot = self._snapshot = self._build(minute)
+        return snapshot
+
+    def refresh(self):
+        with self._lock:
+            self._snapshot = self._build(self.clock().replace(second=0, microsecond=0))
+        return self._snapshot
+
 
 class TransitEngine(VedicAstroEngine):
-    def calculate_current_transits(self, birth_chart, location_data):
-        """
-        Compares NOW (Current Sky) vs BIRTH (User's Chart).
-        """
-        now = datetime.now()
-        
-        # 1. Calculate Current Planetary Positions (The Sky Right Now)
-        transit_chart = self.calculate_chart(
-            now.year, now.month, now.day, 
-            now.hour, now.minute, 
-            location_data['lat'], location_data['lon'], location_data['tz']
-        )
-        
-        # 2. Get User's Birth Ascendant
-        if "Ascendant" not in birth_chart:
-            return []
-            
-        asc_sign_id = birth_chart['Ascendant']['sign_id']
-        transit_report = []
-        
-        zodiac = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo", 
-                  "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
-        
-        # 3. Compare Transit Planet vs Birth Ascendant
-        for p_name, p_data in transit_chart.items():
-            if p_name == "Ascendant": continue
-            
-            # Current Sign of the Planet
-            transit_sign_id = p_data['sign_id']
-            
-            # Calculate House relative to Birth Ascendant
-            # Formula: (TransitSign - BirthAsc + 12) % 12 + 1
-            transit_house = (transit_sign_id - asc_sign_id) % 12 + 1
-            
-            # Get Prediction using your dictionary
-            prediction = self.get_transit_prediction(p_name, transit_house)
-            
-            transit_report.append({
-                "planet": p_name,
-                "current_sign": zodiac[transit_sign_id],
-                "transiting_house": transit_house,
-                "prediction": prediction,
-                "is_retrograde": p_data['is_retrograde']
-            })
-            
-        return transit_report
+    def __init__(self, ephemeris_table=None, cache_size=1024, event_catalog=None):
+        super().__init__(ephemeris_table=ephemeris_table, cache_size=cache_size)
+        # Optional precomputed ingress/station catalog (see events.py) for "next sign change"
+        self.event_catalog = event_catalog
+        # Shared sky for "now": one graha computation per minute for all users
+        self.sky = CurrentSky(self, event_catalog=event_catalog)
 
-    def get_transit_prediction(self, planet, house):
-        """
-        Comprehensive BPHS-based transit results for all 9 Grahas.
-        """
-        predictions = {
+        # Comprehensive BPHS-based transit results for all 9 Grahas
+        self.PREDICTIONS = {
             "Sun": {
                 1: "Fatigue, irritability, and difficult journeys.",
                 2: "Loss of wealth, eye strain, and family disputes.",
@@ -176,5 +194,49 @@ class TransitEngine(VedicAstroEngine):
             }
         }
 
-        planet_dict = predictions.get(planet, {})
+    def calculate_current_transits(self, birth_chart, location_data):
+        """
+        Compares NOW (Current Sky) vs BIRTH (User's Chart).
+        The sky is the shared CurrentSky snapshot; only the houses are per user.
+        """
+        # 1. Current Planetary Positions (the shared snapshot for this minute)
+        sky = self.sky.get()
+
+        # 2. Get User's Birth Ascendant
+        birth_chart = as_chart(birth_chart)
+        if birth_chart.ascendant is None:
+            return []
+
+        asc_sign_id = birth_chart.ascendant.sign_id
+        local_offset = timedelta(hours=location_data['tz'])
+        transit_report = []
+
+        # 3. Compare Transit Planet vs Birth Ascendant
+        for i, p_data in enumerate(sky.grahas):
+            # Calculate House relative to Birth Ascendant
+            # Formula: (TransitSign - BirthAsc + 12) % 12 + 1
+            transit_house = (p_data.sign_id - asc_sign_id) % 12 + 1
+
+            report = {
+                "planet": p_data.name,
+                "current_sign": SIGN_NAMES[p_data.sign_id],
+                "transiting_house": transit_house,
+                "prediction": self.get_transit_prediction(p_data.name, transit_house),
+                "is_retrograde": p_data.is_retrograde
+            }
+
+            # 4. When the planet leaves this sign (looked up once per snapshot)
+            if sky.next_sign_change is not None and sky.next_sign_change[i] is not None:
+                utc_time, sign = sky.next_sign_change[i]
+                report["next_sign_change"] = {"time": utc_time + local_offset, "sign": sign}
+
+            transit_report.append(report)
+
+        return transit_report
+
+    def get_transit_prediction(self, planet, house):
+        """
+        Comprehensive BPHS-based transit results for all 9 Grahas.
+        """
+        planet_dict = self.PREDICTIONS.get(planet, {})
         return planet_dict.get(house, planet_dict.get("default", "Mixed results according to planetary strength."))
\ No newline at end of file
@@ -0,0 +1,164 @@
+import math
+import numpy as np
+import swisseph as swe
+from .ayanamsa import AyanamsaSystem
+from .chart_cache import ChartCache
+from .events import jd_to_datetime64
+from .tables import JUPITER, MARS, MERCURY, SATURN, SIGN_NAMES, SUN
+
+# Weekday lords, Sunday first (same order as the graha indices Sun..Saturn). The day and the
+# night are each split into 8 portions (Kalavelas) ruled in this order from the weekday lord
+# (day) or from the lord of the 5th weekday (night); the 8th portion has no lord.
+WEEKDAY_NAMES = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+WEEKDAY_LORDS = list(range(7))
+NIGHT_SHIFT = 4
+PORTIONS = 8
+
+# (upagraha, graha ruling its portion, point of the portion whose rising degree it takes:
+# 0 = start, 0.5 = middle). Gulika rises at the start of Saturn's portion, Mandi at its middle.
+UPAGRAHA_RULES = [
+    ("Kaala", SUN, 0.5),
+    ("Mrityu", MARS, 0.5),
+    ("Ardhaprahara", MERCURY, 0.5),
+    ("Yamaghantaka", JUPITER, 0.5),
+    ("Gulika", SATURN, 0.0),
+    ("Mandi", SATURN, 0.5),
+]
+UPAGRAHA_NAMES = [rule[0] for rule in UPAGRAHA_RULES]
+
+# Sunrise / sunset of the Sun's disc centre without refraction (the Hindu rising)
+RISE_FLAGS = swe.BIT_HINDU_RISING
+# Location cell of the sunrise cache: 0.01 degree (~1 km, under 3 s of sunrise time)
+CELL_DEGREES = 0.01
+
+
+class SunriseTable:
+    """
+    Sunrise, sunset and next sunrise (Julian Days, UT) per (local date, location cell) from
+    swe.rise_trans at the cell's centre, kept in an LRU cache: every lookup for the same city
+    and day after the first costs a dict access instead of three rise_trans calls.
+    Local dates are in local mean time (longitude / 15 hours from UT), so no timezone is needed.
+    """
+
+    def __init__(self, cache_size=4096):
+        self.cache = ChartCache(cache_size)
+
+    def cell(self, lat, lon):
+        return int(round(lat / CELL_DEGREES)), int(round(lon / CELL_DEGREES))
+
+    def day(self, day_number, cell):
+        """
+        (sunrise, sunset, next sunrise) of a local date (Julian Day Number) in a cell.
+        ValueError if the Sun does not rise or set there that day.
+        """
+        key = (day_number, cell)
+        times = self.cache.get(key)
+        if times is None:
+            lat, lon = cell[0] * CELL_DEGREES, cell[1] * CELL_DEGREES
+            geopos = (lon, lat, 0.0)
+            midnight = day_number - 0.5 - lon / 360.0
+            sunrise = self._next(midnight, swe.CALC_RISE, geopos)
+            sunset = self._next(sunrise, swe.CALC_SET, geopos)
+            times = (sunrise, sunset, self._next(sunset, swe.CALC_RISE, geopos))
+            self.cache.put(key, times)
+        return times
+
+    def days(self, first_day, count, cell):
+        """
+        day() for `count` consecutive local dates, as three arrays (sunrise, sunset, next
+        sunrise). Uncached dates are chained - a date's next sunrise is the following date's
+        sunrise - so a run of dates costs two rise_trans calls per date instead of three.
+        """
+        geopos = (cell[1] * CELL_DEGREES, cell[0] * CELL_DEGREES, 0.0)
+        times = []
+        carried = None
+        for day_number in range(first_day, first_day + count):
+            key = (day_number, cell)
+            day = self.cache.get(key)
+            if day is None:
+                sunrise = carried
+                if sunrise is None:
+                    sunrise = self._next(day_number - 0.5 - geopos[0] / 360.0, swe.CALC_RISE, geopos)
+                sunset = self._next(sunrise, swe.CALC_SET, geopos)
+                day = (sunrise, sunset, self._next(sunset, swe.CALC_RISE, geopos))
+                self.cache.put(key, day)
+            times.append(day)
+            carried = day[2]
+        return np.array(times).T
+
+    def _next(self, jd, event, geopos):
+        res, tret = swe.rise_trans(jd, swe.SUN, event | RISE_FLAGS, geopos)
+        if res != 0:
+            raise ValueError(f"No sunrise / sunset at latitude {geopos[1]:.2f} on this date")
+        return tret[0]
+
+    def vedic_day(self, jd, lat, lon):
+        """
+        The day or night portion containing jd (UT): (is_day, start, end, weekday with Sunday = 0).
+        A Vedic day runs from sunrise to sunrise, so before sunrise it is the previous day's night.
+        """
+        cell = self.cell(lat, lon)
+        day_number = math.floor(jd + 0.5 + lon / 360.0)
+        sunrise, sunset, next_sunrise = self.day(day_number, cell)
+        if jd < sunrise:
+            day_number -= 1
+            sunrise, sunset, next_sunrise = self.day(day_number, cell)
+        weekday = (day_number + 1) % 7
+        if jd < sunset:
+            return True, sunrise, sunset, weekday
+        return False, sunset, next_sunrise, weekday
+
+    def info(self):
+        return self.cache.info()
+
+
+class UpagrahaEngine:
+    """
+    Time-based upagrahas (Kaala, Mrityu, Ardhaprahara, Yamaghantaka, Gulika, Mandi) in one pass:
+    one Vedic-day lookup in the SunriseTable, then the rising degree (swisseph Ascendant minus
+    the chart's ayanamsa) at each portion point.
+    """
+
+    def __init__(self, cache_size=4096):
+        self.sunrises = SunriseTable(cache_size)
+
+    def calculate(self, year, month, day, hour, minute, lat, lon, tz, ayanamsa_mode="LAHIRI"):
+        jd = swe.julday(year, month, day, hour + minute / 60.0 - tz)
+        return self.calculate_jd(jd, lat, lon, tz, ayanamsa_mode)
+
+    def calculate_jd(self, jd, lat, lon, tz=0.0, ayanamsa_mode="LAHIRI"):
+        """
+        Upagrahas of the day / night portion containing jd (UT) at lat / lon. Times are local
+        datetimes at tz hours from UT. ValueError where the Sun does not rise or set.
+        """
+        is_day, start, end, weekday = self.sunrises.vedic_day(jd, lat, lon)
+        ayanamsa = AyanamsaSystem.get_model(ayanamsa_mode)
+        first_lord = (weekday + (0 if is_day else NIGHT_SHIFT)) % 7
+        portion = (end - start) / PORTIONS
+
+        points = []
+        for _, graha, point in UPAGRAHA_RULES:
+            index = (WEEKDAY_LORDS.index(graha) - first_lord) % 7
+            points.append((index, start + (index + point) * portion))
+        # All local times in one conversion: [start, end, upagraha times...]
+        times = jd_to_datetime64(np.array([start, end] + [at for _, at in points]) + tz / 24.0).tolist()
+
+        upagrahas = {}
+        for name, (index, at), time in zip(UPAGRAHA_NAMES, points, times[2:]):
+            longitude = (swe.houses_ex(at, lat, lon, b'A')[1][0] - ayanamsa.value(at)) % 360
+            upagrahas[name] = {
+                "time": time,
+                "absolute_longitude": longitude,
+                "sign_id": int(longitude / 30),
+                "sign": SIGN_NAMES[int(longitude / 30)],
+                "degree": longitude % 30,
+                "portion": index + 1,
+            }
+
+        return {
+            "period": "Day" if is_day else "Night",
+            "weekday": WEEKDAY_NAMES[weekday],
+            "start": times[0],
+            "end": times[1],
+            "upagrahas": upagrahas,
+        }
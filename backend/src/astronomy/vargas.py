@@ -1,39 +1,114 @@
+import numpy as np
+
+# The 16 Parashari divisional charts (Shodashavarga)
+SHODASHAVARGA = (1, 2, 3, 4, 7, 9, 10, 12, 16, 20, 24, 27, 30, 40, 45, 60)
+
+VARGA_NAMES = {
+    1: "Rashi", 2: "Hora", 3: "Drekkana", 4: "Chaturthamsa", 7: "Saptamsa",
+    9: "Navamsa", 10: "Dasamsa", 12: "Dwadasamsa", 16: "Shodasamsa", 20: "Vimsamsa",
+    24: "Chaturvimsamsa", 27: "Bhamsa", 30: "Trimsamsa", 40: "Khavedamsa",
+    45: "Akshavedamsa", 60: "Shashtiamsa",
+}
+
+# Trimsamsa has unequal parts, so its table uses 30 one-degree parts.
+# (span in degrees, sign) for odd and even signs:
+# Odd:  Mars 5 (Aries), Saturn 5 (Aquarius), Jupiter 8 (Sag), Mercury 7 (Gemini), Venus 5 (Libra)
+# Even: Venus 5 (Taurus), Mercury 7 (Virgo), Jupiter 8 (Pisces), Saturn 5 (Capricorn), Mars 5 (Scorpio)
+TRIMSAMSA_ODD = [(5, 0), (5, 10), (8, 8), (7, 2), (5, 6)]
+TRIMSAMSA_EVEN = [(5, 1), (7, 5), (8, 11), (5, 9), (5, 7)]
+
+
+def _varga_start(division, sign):
+    """
+    Sign from which the parts of `sign` are counted in the given varga (BPHS rules).
+    Note: sign_id 0 (Aries) is an odd sign.
+    """
+    is_odd = sign % 2 == 0
+    quality = sign % 3    # 0: Movable, 1: Fixed, 2: Dual
+    element = sign % 4    # 0: Fire, 1: Earth, 2: Air, 3: Water
+
+    if division in (1, 3, 4, 12, 60):
+        return sign
+    if division == 7:
+        return sign if is_odd else (sign + 6) % 12
+    if division == 9:
+        return [0, 9, 6, 3][element]
+    if division == 10:
+        return sign if is_odd else (sign + 8) % 12
+    if division in (16, 45):
+        return [0, 4, 8][quality]
+    if division == 20:
+        return [0, 8, 4][quality]
+    if division == 24:
+        return 4 if is_odd else 3
+    if division == 27:
+        return [0, 3, 6, 9][element]
+    if division == 40:
+        return 0 if is_odd else 6
+    raise ValueError(f"Unsupported varga D{division}")
+
+
+def _build_table(division):
+    """
+    (12, n_parts) table of varga sign ids for every (sign, part).
+    """
+    if division == 2:
+        # Hora: odd signs Sun (Leo) then Moon (Cancer); even signs the reverse
+        return np.array([[4, 3] if sign % 2 == 0 else [3, 4] for sign in range(12)], dtype=np.int8)
+
+    if division == 30:
+        table = np.empty((12, 30), dtype=np.int8)
+        for sign in range(12):
+            parts = TRIMSAMSA_ODD if sign % 2 == 0 else TRIMSAMSA_EVEN
+            table[sign] = np.repeat([s for _, s in parts], [span for span, _ in parts])
+        return table
+
+    # Equal parts: step 4 signs for Drekkana, 3 for Chaturthamsa, 1 otherwise
+    step = {3: 4, 4: 3}.get(division, 1)
+    table = np.empty((12, division), dtype=np.int8)
+    for sign in range(12):
+        table[sign] = (_varga_start(division, sign) + step * np.arange(division)) % 12
+    return table
+
+
+# Precomputed (division -> (12, n_parts)) lookup tables
+VARGA_TABLES = {division: _build_table(division) for division in SHODASHAVARGA}
+
+
+def calculate_vargas(longitudes, divisions=SHODASHAVARGA):
+    """
+    Vectorized varga lookup.
+    longitudes: sidereal longitudes of any shape (one chart's grahas, or a (n, 9) batch).
+    Returns int8 sign ids of shape longitudes.shape + (len(divisions),).
+    """
+    longitudes = np.asarray(longitudes, dtype=np.float64) % 360
+    signs = (longitudes // 30).astype(np.int64)
+    degrees = longitudes - signs * 30
+
+    out = np.empty(longitudes.shape + (len(divisions),), dtype=np.int8)
+    for i, division in enumerate(divisions):
+        table = VARGA_TABLES[division]
+        n_parts = table.shape[1]
+        # min(): guards float rounding right at the end of a sign
+        parts = np.minimum((degrees * (n_parts / 30.0)).astype(np.int64), n_parts - 1)
+        out[..., i] = table[signs, parts]
+    return out
+
+
+def varga_sign(absolute_longitude, division=9):
+    """
+    Scalar lookup: sign id (0-11) of one longitude in one divisional chart.
+    """
+    table = VARGA_TABLES[division]
+    n_parts = table.shape[1]
+    absolute_longitude %= 360
+    sign = int(absolute_longitude // 30)
+    part = min(int((absolute_longitude - sign * 30) * n_parts / 30.0), n_parts - 1)
+    return int(table[sign, part])
+
+
 def calculate_d9_navamsa(absolute_longitude):
     """
     Calculates the Sign ID (0-11) of a planet in the Navamsa (D-9) chart.
-    
-    Algorithm:
-    1. A sign is 30 degrees. D-9 divides it into 9 parts of 3deg 20min (3.333 deg).
-    2. The mapping depends on the element of the Rashi sign (Fire, Earth, Air, Water).
-    """
-    
-    rashi_sign_id = int(absolute_longitude // 30)
-    degree_in_sign = absolute_longitude % 30
-    
-    # 1. Determine the 'pada' (segment 0-8)
-    # 30 degrees / 9 segments = 3.33333 degrees per segment
-    pada_length = 30.0 / 9.0
-    pada = int(degree_in_sign / pada_length)
-    
-    # 2. Determine start sign based on Element of Rashi
-    # Fire (Aries, Leo, Sag) -> Starts from Aries (0)
-    # Earth (Taurus, Virgo, Cap) -> Starts from Capricorn (9)
-    # Air (Gemini, Libra, Aq) -> Starts from Libra (6)
-    # Water (Cancer, Scorpio, Pisces) -> Starts from Cancer (3)
-    
-    element_remainder = rashi_sign_id % 4
-    start_sign = 0
-    
-    if element_remainder == 0:   # Fire
-        start_sign = 0 
-    elif element_remainder == 1: # Earth
-        start_sign = 9
-    elif element_remainder == 2: # Air
-        start_sign = 6
-    elif element_remainder == 3: # Water
-        start_sign = 3
-        
-    # 3. Calculate Final D9 Sign
-    d9_sign_id = (start_sign + pada) % 12
-    
-    return d9_sign_id
\ No newline at end of file
+    """
+    return varga_sign(absolute_longitude, 9)
@@ -0,0 +1,179 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import numpy as np
+import swisseph as swe
+
+from .engine import VedicAstroEngine
+from .chart import Planet
+from .dasha import VimshottariDasha
+from .yogas import YogaEngine
+from .yoga_rules import YOGA_RULES
+from .ephemeris_table import EphemerisTable, DEFAULT_TABLE_PATH
+from .ayanamsa import AyanamsaSystem
+
+YOGA_BYTES = -(-len(YOGA_RULES) // 8)
+
+# Canonical ayanamsa names (Lahiri first): BIRTH_DTYPE carries an index into this list
+AYANAMSA_NAMES = list(dict.fromkeys(AyanamsaSystem.normalize(mode) for mode in AyanamsaSystem.MODES))
+
+# Compact wire formats: births go in and results come back as raw structured-array bytes
+BIRTH_DTYPE = np.dtype([
+    ("year", "i2"), ("month", "i1"), ("day", "i1"), ("hour", "i1"), ("minute", "i1"),
+    ("latitude", "f8"), ("longitude", "f8"), ("timezone", "f4"),
+    ("ayanamsa", "i1"),  # index into AYANAMSA_NAMES
+])
+
+RESULT_DTYPE = np.dtype([
+    ("sign_id", "i1", (9,)),
+    ("d9_sign_id", "i1", (9,)),
+    ("house_number", "i1", (9,)),
+    ("absolute_longitude", "f8", (9,)),
+    ("is_retrograde", "?", (9,)),
+    ("asc_sign_id", "i1"),
+    ("asc_longitude", "f8"),
+    ("mahadasha", "i1"),   # index into VimshottariDasha.DASHA_ORDER, -1 if outside the timeline
+    ("antardasha", "i1"),
+    ("yoga_bits", "u1", (YOGA_BYTES,)),  # packed little-endian: bit i -> YogaEngine.YOGA_NAMES[i]
+])
+
+# Per-process engines, created once by _init_worker or shared by use_engines
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def _init_worker(ephe_path, table_path):
+    if ephe_path and os.path.exists(ephe_path):
+        swe.set_ephe_path(ephe_path)
+    table = EphemerisTable.load_if_available(table_path) if table_path else None
+    # No chart cache: bulk births are almost never repeated
+    _engines.update(
+        astro=VedicAstroEngine(ephemeris_table=table, cache_size=0), dasha=VimshottariDasha(), yoga=YogaEngine()
+    )
+
+
+def use_engines(astro, dasha, yoga):
+    """
+    Engines for in-process process_births calls, e.g. the server's already-loaded ones
+    (calculate_charts_batch does not touch the chart cache).
+    """
+    with _engines_lock:
+        _engines.update(astro=astro, dasha=dasha, yoga=yoga)
+
+
+def _get_engines():
+    # Threadpool callers may arrive together before any engine exists: build them once
+    with _engines_lock:
+        if not _engines:
+            _init_worker(None, DEFAULT_TABLE_PATH)
+        return _engines["astro"], _engines["dasha"], _engines["yoga"]
+
+
+def pack_births(years, months, days, hours, minutes, lats, lons, tzs, ayanamsa_modes="LAHIRI"):
+    """
+    BIRTH_DTYPE array of births; ayanamsa_modes is one name or one per birth.
+    """
+    births = np.empty(len(years), dtype=BIRTH_DTYPE)
+    births["year"], births["month"], births["day"] = years, months, days
+    births["hour"], births["minute"] = hours, minutes
+    births["latitude"], births["longitude"], births["timezone"] = lats, lons, tzs
+    modes = [ayanamsa_modes] if isinstance(ayanamsa_modes, str) else ayanamsa_modes
+    births["ayanamsa"] = [AYANAMSA_NAMES.index(AyanamsaSystem.normalize(mode)) for mode in modes]
+    return births
+
+
+def process_births(birth_bytes, reference_ts):
+    """
+    Worker entry point: unpacks a chunk of births, computes charts, running dasha and yogas,
+    and returns RESULT_DTYPE bytes. Also usable in-process (see use_engines; otherwise the
+    engines are created on first use).
+    """
+    astro, dasha, yoga = _get_engines()
+
+    births = np.frombuffer(birth_bytes, dtype=BIRTH_DTYPE)
+    reference = datetime.fromtimestamp(reference_ts)
+
+    # 1. Charts (vectorized)
+    cols = astro.calculate_charts_batch(
+        births["year"], births["month"], births["day"], births["hour"], births["minute"],
+        births["latitude"], births["longitude"], births["timezone"],
+        [AYANAMSA_NAMES[code] for code in births["ayanamsa"]],
+    )
+
+    out = np.zeros(len(births), dtype=RESULT_DTYPE)
+    for key in ["sign_id", "d9_sign_id", "house_number", "absolute_longitude", "is_retrograde"]:
+        out[key] = cols[key]
+    out["asc_sign_id"] = cols["ascendant"]["sign_id"]
+    out["asc_longitude"] = cols["ascendant"]["absolute_longitude"]
+
+    # 2. Yogas: every rule for every chart in one pass
+    out["yoga_bits"] = np.packbits(
+        yoga.check_yogas_batch(cols["sign_id"], cols["degree"], cols["ascendant"]["sign_id"]),
+        axis=1, bitorder="little",
+    )
+
+    # 3. Per-native dasha
+    moon_longitudes = cols["absolute_longitude"][:, Planet.MOON].tolist()
+    for i, b in enumerate(births):
+        birth_dt = datetime(int(b["year"]), int(b["month"]), int(b["day"]), int(b["hour"]), int(b["minute"]))
+        timeline = dasha.calculate_timeline(moon_longitudes[i], birth_dt)
+        current = timeline.current(reference) or {}
+        out["mahadasha"][i] = dasha.DASHA_ORDER.index(current["mahadasha"]["lord"]) if "mahadasha" in current else -1
+        out["antardasha"][i] = dasha.DASHA_ORDER.index(current["antardasha"]["lord"]) if "antardasha" in current else -1
+
+    return out.tobytes()
+
+
+class ChartWorkerPool:
+    """
+    Process pool for CPU-bound bulk chart jobs (swisseph holds the GIL, so threads don't scale).
+    Each worker sets the ephemeris path and builds its engines once; births travel to the
+    workers in chunks of BIRTH_DTYPE bytes and come back as RESULT_DTYPE bytes.
+    """
+
+    def __init__(self, workers=None, chunk_size=256, ephe_path=None, table_path=DEFAULT_TABLE_PATH):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            # spawn: never fork a process that already runs server threads
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(ephe_path, table_path),
+        )
+
+    def _chunks(self, births):
+        for start in range(0, len(births), self.chunk_size):
+            yield births[start:start + self.chunk_size].tobytes()
+
+    @staticmethod
+    def _collect(results):
+        if not results:
+            return np.zeros(0, dtype=RESULT_DTYPE)
+        return np.concatenate([np.frombuffer(r, dtype=RESULT_DTYPE) for r in results])
+
+    def map(self, births, reference=None):
+        """
+        Blocking: births is a BIRTH_DTYPE array (see pack_births). Returns a RESULT_DTYPE array.
+        """
+        reference_ts = (reference or datetime.now()).timestamp()
+        chunks = list(self._chunks(births))
+        return self._collect(list(self.executor.map(process_births, chunks, [reference_ts] * len(chunks))))
+
+    async def calculate(self, births, reference=None):
+        """
+        asyncio facade of map(): chunks run concurrently without blocking the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        reference_ts = (reference or datetime.now()).timestamp()
+        futures = [
+            loop.run_in_executor(self.executor, process_births, chunk, reference_ts)
+            for chunk in self._chunks(births)
+        ]
+        return self._collect(await asyncio.gather(*futures))
+
+    def close(self):
+        self.executor.shutdown(wait=True)
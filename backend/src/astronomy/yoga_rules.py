@@ -0,0 +1,258 @@
+from itertools import combinations, product
+import numpy as np
+from .chart import CHART_KEYS
+from .tables import DIGNITY, EXALTATION_SIGN, HOUSE_LORDS, MOOLATRIKONA, SIGN_LORD, SIGN_NAMES
+
+KENDRAS = (1, 4, 7, 10)
+DUSTHANAS = (6, 8, 12)
+MAHAPURUSHA_DIGNITIES = ("Exalted", "Moolatrikona", "Own")
+TARA_GRAHAS = ["Mars", "Mercury", "Jupiter", "Venus", "Saturn"]  # Moon yogas ignore Sun and nodes
+NATURAL_BENEFICS = ["Jupiter", "Venus", "Mercury"]
+
+# Declarative yoga rules. A rule holds when ALL its predicates hold ("all"), or when any one
+# clause of "any" (a list of predicate lists) does. Predicates:
+#   ("house", ref, houses)          ref in these houses from the Ascendant
+#   ("from", ref, base, houses)     ref in these houses counted from base's sign
+#   ("sign", ref, sign names)
+#   ("conjunct", ref, other)        same sign
+#   ("dignity", ref, dignities)     tables.dignity() names
+# ref: a graha name, "Ascendant", "lord:<house>", "dispositor:<graha>" (lord of its sign) or
+# "exalted_in:<graha>" (the graha exalted in its sign).
+YOGA_RULES = [
+    # 1. Pancha Mahapurusha: own / exalted sign in a kendra
+    *[
+        {"name": name, "category": "Mahapurusha", "desc": desc,
+         "all": [("house", p, KENDRAS), ("dignity", p, MAHAPURUSHA_DIGNITIES)]}
+        for p, name, desc in [
+            ("Mars", "Ruchaka Yoga", "Divine strength, courage, and leadership."),
+            ("Mercury", "Bhadra Yoga", "Intellect, wit, and communication skills."),
+            ("Jupiter", "Hamsa Yoga", "Wisdom, spirituality, and respect."),
+            ("Venus", "Malavya Yoga", "Luxury, beauty, and artistic success."),
+            ("Saturn", "Sasa Yoga", "Authority, discipline, and political power."),
+        ]
+    ],
+    # 2. Raja
+    {"name": "Gaja Kesari Yoga", "category": "Raja", "desc": "Fame, virtue, and lasting reputation.",
+     "all": [("from", "Jupiter", "Moon", KENDRAS)]},
+    {"name": "Dharma-Karmadhipati Yoga", "category": "Raja", "desc": "Professional success and righteous power.",
+     "all": [("conjunct", "lord:9", "lord:10")]},
+    # 3. Vipreet Raja: dusthana lords in dusthanas
+    {"name": "Harsha Yoga", "category": "Vipreet", "desc": "Invincibility against enemies and health resilience.",
+     "all": [("house", "lord:6", DUSTHANAS)]},
+    {"name": "Sarala Yoga", "category": "Vipreet", "desc": "Fearlessness, longevity, and success through risks.",
+     "all": [("house", "lord:8", DUSTHANAS)]},
+    {"name": "Vimala Yoga", "category": "Vipreet", "desc": "Independence, savings, and spiritual elevation.",
+     "all": [("house", "lord:12", DUSTHANAS)]},
+    # 4. Dhana
+    {"name": "Dhana Yoga (2-11 Link)", "category": "Wealth", "desc": "Great accumulation of financial assets.",
+     "all": [("conjunct", "lord:2", "lord:11")]},
+    # 5. Neecha Bhanga: debilitated, and the sign's lord or the graha exalted there in a kendra
+    *[
+        {"name": f"Neecha Bhanga Raja Yoga ({p})", "category": "Cancellation",
+         "desc": f"Debilitation of {p} is cancelled, converting weakness into strength.",
+         "any": [
+             [("dignity", p, ("Debilitated",)), ("house", f"dispositor:{p}", KENDRAS)],
+             [("dignity", p, ("Debilitated",)), ("house", f"exalted_in:{p}", KENDRAS)],
+         ]}
+        for p in ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
+    ],
+    # 6. Conjunctions
+    {"name": "Budha-Aditya Yoga", "category": "Conjunction", "desc": "Sharp intellect, learning, and eloquence.",
+     "all": [("conjunct", "Sun", "Mercury")]},
+    {"name": "Chandra-Mangala Yoga", "category": "Conjunction", "desc": "Enterprise and earnings through effort.",
+     "all": [("conjunct", "Moon", "Mars")]},
+    # 7. Lunar: grahas other than the Sun and nodes on either side of the Moon
+    {"name": "Sunapha Yoga", "category": "Lunar", "desc": "Self-earned wealth, intelligence, and good name.",
+     "any": [[("from", p, "Moon", (2,))] for p in TARA_GRAHAS]},
+    {"name": "Anapha Yoga", "category": "Lunar", "desc": "Good health, charm, and a contented life.",
+     "any": [[("from", p, "Moon", (12,))] for p in TARA_GRAHAS]},
+    {"name": "Durudhara Yoga", "category": "Lunar", "desc": "Wealth, vehicles, and generosity.",
+     "any": [[("from", a, "Moon", (2,)), ("from", b, "Moon", (12,))] for a, b in product(TARA_GRAHAS, TARA_GRAHAS) if a != b]},
+    {"name": "Kemadruma Yoga", "category": "Lunar", "desc": "Periods of isolation and financial struggle.",
+     "all": [("from", p, "Moon", tuple(h for h in range(1, 13) if h not in (2, 12))) for p in TARA_GRAHAS]},
+    {"name": "Amala Yoga", "category": "Raja", "desc": "Spotless reputation and lasting prosperity.",
+     "any": [[("from", p, base, (10,))] for p in NATURAL_BENEFICS for base in ["Ascendant", "Moon"]]},
+    # 8. Parivartana: lords of two houses in each other's house (Maha, Khala with the 3rd, Dainya with a dusthana)
+    *[
+        {"name": f"Parivartana Yoga ({a}-{b})",
+         "category": "Dainya" if a in DUSTHANAS or b in DUSTHANAS else "Khala" if 3 in (a, b) else "Maha Parivartana",
+         "desc": f"Exchange of the {a} and {b} house lords: each strengthens the other's significations.",
+         "all": [("house", f"lord:{a}", (b,)), ("house", f"lord:{b}", (a,))]}
+        for a, b in combinations(range(1, 13), 2)
+    ],
+]
+
+# Integer-coded chart, one int16 row per chart: the sign of each of CODE_COLUMNS columns, then
+# their dignity codes. Columns 0-8 are the grahas (chart.Planet order), then the Ascendant, a
+# fixed 0 deg Aries point ("sign" tests count from it) and a MISSING column that unresolvable
+# refs point to. MISSING_CODE (sign or dignity) marks anything absent.
+ASCENDANT, ARIES_POINT, MISSING = 9, 10, 11
+CODE_COLUMNS = 12
+MISSING_CODE = 12
+CODES = MISSING_CODE + 1  # values per code
+DIGNITIES = ["Exalted", "Moolatrikona", "Own", "Friend", "Neutral", "Enemy", "Debilitated", None]
+DIGNITY_CODE = {d: i for i, d in enumerate(DIGNITIES)}
+NO_DIGNITY = DIGNITY_CODE[None]
+
+# EXALTED_IN[sign]: graha exalted there, MISSING if none
+EXALTED_IN = [MISSING] * 12
+for _planet, _sign in EXALTATION_SIGN.items():
+    EXALTED_IN[_sign] = _planet
+
+# Sign-level dignity codes per graha (Rahu/Ketu: none) and Moolatrikona ranges for the degree test
+SIGN_DIGNITY = np.array([[DIGNITY_CODE[d] for d in row] for row in DIGNITY], dtype=np.int16)
+MT_SIGN = np.array([MOOLATRIKONA.get(p, (-1, 0, 0))[0] for p in range(9)])
+MT_FROM = np.array([MOOLATRIKONA.get(p, (-1, 0, 0))[1] for p in range(9)], dtype=np.float64)
+MT_TO = np.array([MOOLATRIKONA.get(p, (-1, 0, 0))[2] for p in range(9)], dtype=np.float64)
+
+
+def empty_codes(n):
+    codes = np.full((n, 2 * CODE_COLUMNS), MISSING_CODE, dtype=np.int16)
+    codes[:, ARIES_POINT] = 0
+    codes[:, CODE_COLUMNS + ASCENDANT] = NO_DIGNITY
+    return codes
+
+
+def chart_codes(chart):
+    """
+    Chart -> integer coding, shape (1, 2 * CODE_COLUMNS).
+    """
+    codes = empty_codes(1)
+    row = codes[0]
+    for i, p in enumerate(chart.positions):
+        if p is not None:
+            row[i] = p.sign_id
+            if i < ASCENDANT:
+                row[CODE_COLUMNS + i] = DIGNITY_CODE[p.dignity]
+    return codes
+
+
+def batch_codes(sign_id, degree, asc_sign_id):
+    """
+    Columnar charts (sign_id / degree of shape (n, 9), asc_sign_id (n,), e.g. from
+    calculate_charts_batch) -> integer coding, shape (n, 2 * CODE_COLUMNS).
+    """
+    sign_id = np.asarray(sign_id)
+    degree = np.asarray(degree, dtype=np.float64)
+    codes = empty_codes(len(sign_id))
+    codes[:, :9], codes[:, ASCENDANT] = sign_id, asc_sign_id
+    dignity = SIGN_DIGNITY[np.arange(9), sign_id]
+    dignity[(sign_id == MT_SIGN) & (degree >= MT_FROM) & (degree < MT_TO)] = DIGNITY_CODE["Moolatrikona"]
+    codes[:, CODE_COLUMNS:CODE_COLUMNS + 9] = dignity
+    return codes
+
+
+class CompiledYogaRules:
+    """
+    YOGA_RULES compiled into flat lookup tables, evaluated for every rule at once:
+    1. every distinct ref is a 13-entry row indexed by one key sign (the Ascendant for
+       "lord:", the graha's sign for "dispositor:"/"exalted_in:") giving the chart column it
+       points to; one gather resolves all refs of all charts;
+    2. every distinct predicate is an atom over two ref values (two signs, or a dignity code
+       and the Aries point's 0): the pair indexes the atom's precomputed 13 x 13 truth table,
+       which folds the mod-12 distance, the predicate's bitmask and MISSING_CODE together;
+    3. clauses AND their atoms and rules OR their clauses with ufunc.reduceat.
+    The Python work is per compile, not per chart: evaluation is a fixed number of NumPy
+    calls whose cost per chart barely moves as rules are added.
+    """
+
+    def __init__(self, rules=YOGA_RULES):
+        self.rules = list(rules)
+        self.names = [r["name"] for r in self.rules]
+        self._refs, self._atoms = {}, {}
+        clause_atoms, clause_starts, rule_starts = [], [], []
+        for rule in self.rules:
+            rule_starts.append(len(clause_starts))
+            for clause in rule["any"] if "any" in rule else [rule["all"]]:
+                clause_starts.append(len(clause_atoms))
+                clause_atoms.extend(self._atom(p) for p in clause)
+
+        # Refs: REF_TABLE[REF_BASE[r] + key sign] -> chart column, key sign = codes[:, REF_KEYS[r]]
+        refs = sorted(self._refs, key=self._refs.get)
+        self.REF_TABLE = np.array([c for ref in refs for c in self._ref_row(ref)[0]], dtype=np.intp)
+        self.REF_BASE = 13 * np.arange(len(refs))
+        self.REF_KEYS = np.array([self._ref_row(ref)[1] for ref in refs], dtype=np.intp)
+        # Atoms index the per-ref values: [0, refs) signs, [refs, 2 * refs) dignities
+        atoms = sorted(self._atoms, key=self._atoms.get)
+        self.ATOM_A = np.array([a[1] if a[1] >= 0 else len(refs) + ~a[1] for a in atoms], dtype=np.intp)
+        self.ATOM_B = np.array([a[2] for a in atoms], dtype=np.intp)
+        # ATOM_TABLE[ATOM_BASE[k] + CODES * A + B]: does atom k hold for values A, B
+        a_values, b_values = np.divmod(np.arange(CODES * CODES), CODES)
+        valid = (a_values < MISSING_CODE) & (b_values < MISSING_CODE)
+        self.ATOM_TABLE = np.concatenate([
+            valid & ((a[3] >> ((a_values - b_values) % 12)) & 1).astype(bool) for a in atoms
+        ])
+        self.ATOM_BASE = CODES * CODES * np.arange(len(atoms))
+        self.CLAUSE_ATOMS = np.array(clause_atoms, dtype=np.intp)
+        self.CLAUSE_STARTS = np.array(clause_starts, dtype=np.intp)
+        self.RULE_STARTS = np.array(rule_starts, dtype=np.intp)
+
+    @staticmethod
+    def _ref_row(ref):
+        """
+        ref -> (13 chart columns indexed by key sign, the last for a missing key; key column).
+        """
+        kind, _, arg = ref.partition(":")
+        if not arg:
+            column = {"Ascendant": ASCENDANT, "Aries": ARIES_POINT}.get(ref)
+            if column is None:
+                column = CHART_KEYS.index(ref)
+            return [column] * 13, ARIES_POINT
+        if kind == "lord":
+            return [HOUSE_LORDS[asc][int(arg) - 1] for asc in range(12)] + [MISSING], ASCENDANT
+        if kind == "dispositor":
+            return SIGN_LORD + [MISSING], CHART_KEYS.index(arg)
+        if kind == "exalted_in":
+            return EXALTED_IN + [MISSING], CHART_KEYS.index(arg)
+        raise ValueError(f"Unknown yoga reference '{ref}'")
+
+    def _ref(self, ref):
+        self._ref_row(ref)  # validate early
+        return self._refs.setdefault(ref, len(self._refs))
+
+    def _atom(self, predicate):
+        """
+        Predicate -> atom index; atoms are (kind, value A, value B, bitmask over A - B mod 12).
+        """
+        kind = predicate[0]
+        if kind == "house":
+            a, b, hits = predicate[1], "Ascendant", [h - 1 for h in predicate[2]]
+        elif kind == "from":
+            a, b, hits = predicate[1], predicate[2], [h - 1 for h in predicate[3]]
+        elif kind == "sign":
+            a, b, hits = predicate[1], "Aries", [SIGN_NAMES.index(s) for s in predicate[2]]
+        elif kind == "conjunct":
+            a, b, hits = predicate[1], predicate[2], [0]
+        elif kind == "dignity":
+            a, b, hits = predicate[1], "Aries", [DIGNITY_CODE[d] for d in predicate[2]]
+        else:
+            raise ValueError(f"Unknown yoga predicate '{kind}'")
+        a, b = self._ref(a), self._ref(b)
+        if kind == "dignity":
+            a = ~a  # the dignity half of the per-ref values; its index is fixed once refs are known
+        key = (kind, a, b, bits(hits))
+        return self._atoms.setdefault(key, len(self._atoms))
+
+    def evaluate(self, codes):
+        """
+        Integer-coded charts (see chart_codes / batch_codes) -> bool array (n, rules).
+        """
+        rows = np.arange(len(codes))[:, None]
+
+        # 1. Resolve every ref to a chart column, then read its sign and dignity
+        columns = self.REF_TABLE[self.REF_BASE + codes[:, self.REF_KEYS]]
+        values = codes[rows, np.concatenate([columns, columns + CODE_COLUMNS], axis=1)]
+
+        # 2. Atoms: one truth-table lookup per atom on its two values
+        atoms = self.ATOM_TABLE[self.ATOM_BASE + (CODES * values[:, self.ATOM_A] + values[:, self.ATOM_B])]
+
+        # 3. Clauses AND atoms, rules OR clauses
+        clauses = np.logical_and.reduceat(atoms[:, self.CLAUSE_ATOMS], self.CLAUSE_STARTS, axis=1)
+        return np.logical_or.reduceat(clauses, self.RULE_STARTS, axis=1)
+
+
+def bits(indices):
+    mask = 0
+    for i in indices:
+        mask |= 1 << i
+    return mask
@@ -61,6 +61,7 @@ if mode == "👤 Individual Destiny":
                 res = requests.post(f"{BASE}/predict", json=payload)
                 if res.status_code == 200:
                     st.session_state["data"] = res.json()
+                    st.session_state["payload"] = payload
                 else:
                     st.error("Backend Error")
 
@@ -139,9 +140,20 @@ if mode == "👤 Individual Destiny":
             )
             curr_md = full_timeline[sel_md_idx]
 
-            if "sub_periods" in curr_md and curr_md["sub_periods"]:
+            # Deeper levels are fetched one at a time; /predict only ships Mahadashas
+            def fetch_periods(node):
+                if "path" not in node:
+                    return []
+                res = requests.post(
+                    f"{BASE}/dasha/expand",
+                    params={"path": node["path"]},
+                    json=st.session_state["payload"],
+                )
+                return res.json()["periods"] if res.status_code == 200 else []
+
+            ad_list = fetch_periods(curr_md)
+            if ad_list:
                 st.markdown(f"**📂 Antardashas within {curr_md['lord']}**")
-                ad_list = curr_md["sub_periods"]
                 ad_opts = [f"{a['lord']} ({a['start']} ➝ {a['end']})" for a in ad_list]
 
                 sel_ad_idx = st.selectbox(
@@ -153,15 +165,15 @@ if mode == "👤 Individual Destiny":
 
                 st.dataframe(
                     pd.DataFrame(ad_list).drop(
-                        columns=["sub_periods", "type"], errors="ignore"
+                        columns=["path", "type"], errors="ignore"
                     ),
                     use_container_width=True,
                 )
 
-                if "sub_periods" in curr_ad and curr_ad["sub_periods"]:
+                pd_list = fetch_periods(curr_ad)
+                if pd_list:
                     st.divider()
                     st.markdown(f"**📂 Pratyantars within {curr_ad['lord']}**")
-                    pd_list = curr_ad["sub_periods"]
                     pd_opts = [
                         f"{p['lord']} ({p['start']} ➝ {p['end']})" for p in pd_list
                     ]
@@ -173,18 +185,18 @@ if mode == "👤 Individual Destiny":
                     curr_pd = pd_list[sel_pd_idx]
                     st.dataframe(
                         pd.DataFrame(pd_list).drop(
-                            columns=["sub_periods", "type"], errors="ignore"
+                            columns=["path", "type"], errors="ignore"
                         ),
                         use_container_width=True,
                     )
 
-                    if "sub_periods" in curr_pd and curr_pd["sub_periods"]:
+                    sd_list = fetch_periods(curr_pd)
+                    if sd_list:
                         st.divider()
                         st.markdown(f"**📂 Sookshmas within {curr_pd['lord']}**")
-                        sd_list = curr_pd["sub_periods"]
                         st.dataframe(
                             pd.DataFrame(sd_list).drop(
-                                columns=["sub_periods", "type"], errors="ignore"
+                                columns=["path", "type"], errors="ignore"
                             ),
                             use_container_width=True,
                         )
@@ -0,0 +1,115 @@
+import re
+import time
+
+# Planet nodes pre-seeded by schema.py. No name overlaps another, so one findall over an
+# entity finds exactly the planets whose name it contains.
+PLANET_NAMES = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu"]
+PLANET_PATTERN = re.compile("|".join(PLANET_NAMES))
+
+# ingest.py links one planet per entity: the first found in this order (no Rahu / Ketu)
+SINGLE_PLANET_RANK = {name: rank for rank, name in enumerate(
+    ["Sun", "Moon", "Jupiter", "Mars", "Saturn", "Venus", "Mercury"]
+)}
+
+# "10th House", "10 House"
+HOUSE_PATTERN = re.compile(r"(\d+)(st|nd|rd|th)?\s+House", re.IGNORECASE)
+
+# Rows per transaction
+DEFAULT_BATCH_SIZE = 1000
+
+RULE_QUERY = """
+    UNWIND $rows AS row
+    MERGE (r:Rule {id: row.id})
+    SET r += row.props
+"""
+
+PLANET_LINK_QUERY = """
+    UNWIND $rows AS row
+    MATCH (r:Rule {id: row.id})
+    MATCH (p:Planet {name: row.planet})
+    MERGE (r)-[:MENTIONS_PLANET]->(p)
+"""
+
+HOUSE_LINK_QUERY = """
+    UNWIND $rows AS row
+    MATCH (r:Rule {id: row.id})
+    MATCH (h:House {number: row.house})
+    MERGE (r)-[:APPLIES_TO_HOUSE]->(h)
+"""
+
+
+def entity_planets(entity, single=False):
+    """Planet names mentioned in an entity string; with single, only the first by SINGLE_PLANET_RANK."""
+    found = PLANET_PATTERN.findall(entity)
+    if not single:
+        return found
+    ranked = [name for name in found if name in SINGLE_PLANET_RANK]
+    return [min(ranked, key=SINGLE_PLANET_RANK.get)] if ranked else []
+
+
+def compile_rows(rules, properties, house_text, single_planet=False):
+    """
+    One normalization pass over the rules: (rule rows, planet-link rows, house-link rows).
+    properties(rule) -> the Rule node's properties, house_text(rule) -> the text searched for
+    a house number. Links are de-duplicated per rule.
+    """
+    rule_rows, planet_rows, house_rows = [], [], []
+    for rule in rules:
+        rule_id = rule["id"]
+        rule_rows.append({"id": rule_id, "props": properties(rule)})
+
+        planets = {}
+        for entity in rule.get("entities", []):
+            for name in entity_planets(entity, single_planet):
+                planets[name] = None
+        planet_rows.extend({"id": rule_id, "planet": name} for name in planets)
+
+        house_match = HOUSE_PATTERN.search(house_text(rule) or "")
+        if house_match:
+            house_rows.append({"id": rule_id, "house": int(house_match.group(1))})
+
+    return rule_rows, planet_rows, house_rows
+
+
+def _run_batch(tx, query, rows):
+    tx.run(query, rows=rows).consume()
+
+
+def write_rows(session, query, rows, batch_size=DEFAULT_BATCH_SIZE):
+    """Writes rows with one parameterized UNWIND per explicit transaction of batch_size rows. Returns the transaction count."""
+    transactions = 0
+    for start in range(0, len(rows), batch_size):
+        session.execute_write(_run_batch, query, rows[start:start + batch_size])
+        transactions += 1
+    return transactions
+
+
+def bulk_ingest(driver, rule_rows, planet_rows, house_rows, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Writes compiled rows: rules first (the links MATCH them), then planet and house links.
+    Returns row counts, transactions, seconds and rows_per_sec.
+    """
+    t0 = time.perf_counter()
+    transactions = 0
+    with driver.session() as session:
+        for query, rows in ((RULE_QUERY, rule_rows), (PLANET_LINK_QUERY, planet_rows), (HOUSE_LINK_QUERY, house_rows)):
+            transactions += write_rows(session, query, rows, batch_size)
+    seconds = time.perf_counter() - t0
+
+    total = len(rule_rows) + len(planet_rows) + len(house_rows)
+    return {
+        "rules": len(rule_rows),
+        "planet_links": len(planet_rows),
+        "house_links": len(house_rows),
+        "rows": total,
+        "transactions": transactions,
+        "seconds": seconds,
+        "rows_per_sec": total / seconds if seconds > 0 else float("inf"),
+    }
+
+
+def format_stats(stats):
+    return (
+        f"{stats['rules']} rules, {stats['planet_links']} planet links, {stats['house_links']} house links "
+        f"in {stats['transactions']} transactions, {stats['seconds']:.2f} s ({stats['rows_per_sec']:,.0f} rows/s)"
+    )
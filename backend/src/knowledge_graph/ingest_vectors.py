@@ -3,6 +3,11 @@ import os
 from neo4j import GraphDatabase
 from sentence_transformers import SentenceTransformer
 from dotenv import load_dotenv
+try:
+    from .bulk import DEFAULT_BATCH_SIZE, bulk_ingest, compile_rows, format_stats
+except ImportError:
+    # Run as a script (python src/knowledge_graph/ingest_vectors.py): bulk.py sits next to this file
+    from bulk import DEFAULT_BATCH_SIZE, bulk_ingest, compile_rows, format_stats
 
 load_dotenv()
 
@@ -15,7 +20,7 @@ USER = os.getenv("NEO4J_USER", "neo4j")
 PASSWORD = os.getenv("NEO4J_PASSWORD", "pandit_secret_password")
 
 
-def ingest_with_vectors(json_file_path):
+def ingest_with_vectors(json_file_path, batch_size=DEFAULT_BATCH_SIZE):
     driver = GraphDatabase.driver(URI, auth=(USER, PASSWORD))
 
     if not os.path.exists(json_file_path):
@@ -39,83 +44,30 @@ def ingest_with_vectors(json_file_path):
             }}
         """)
 
-    # 2. Ingest Rules
-    with driver.session() as session:
-        for rule in rules:
-            # Handle new Schema
-            main_cond = rule.get("main_condition", "")
-            mod_cond = rule.get("modifying_condition", "")
-            result = rule.get("result", "")
-
-            # Embed the full context
-            text_to_embed = (
-                f"Yoga: {main_cond}. Modification: {mod_cond}. Result: {result}"
-            )
-            vector = model.encode(text_to_embed).tolist()
-
-            # Merge Node
-            session.run(
-                """
-                MERGE (r:Rule {id: $id})
-                SET r.text = $result, 
-                    r.main_condition = $main_cond,
-                    r.modifying_condition = $mod_cond,
-                    r.source = $source,
-                    r.embedding = $vector,
-                    r.type = 'yoga'
-            """,
-                id=rule["id"],
-                result=result,
-                main_cond=main_cond,
-                mod_cond=mod_cond,
-                source=rule.get("source", "Unknown"),
-                vector=vector,
-            )
-
-            # Link Planets
-            for entity in rule.get("entities", []):
-                # Simple normalization
-                valid_planets = [
-                    "Sun",
-                    "Moon",
-                    "Mars",
-                    "Mercury",
-                    "Jupiter",
-                    "Venus",
-                    "Saturn",
-                    "Rahu",
-                    "Ketu",
-                ]
-                for vp in valid_planets:
-                    if vp in entity:
-                        session.run(
-                            """
-                            MATCH (r:Rule {id: $id})
-                            MATCH (p:Planet {name: $p_name})
-                            MERGE (r)-[:MENTIONS_PLANET]->(p)
-                        """,
-                            id=rule["id"],
-                            p_name=vp,
-                        )
-
-            # Link House (Regex for "10th House", "House 10", etc.)
-            import re
-
-            house_match = re.search(
-                r"(\d+)(st|nd|rd|th)?\s+House", main_cond, re.IGNORECASE
-            )
-            if house_match:
-                h_num = int(house_match.group(1))
-                session.run(
-                    """
-                    MATCH (r:Rule {id: $id})
-                    MATCH (h:House {number: $h_num})
-                    MERGE (r)-[:APPLIES_TO_HOUSE]->(h)
-                """,
-                    id=rule["id"],
-                    h_num=h_num,
-                )
-
+    # 2. Embed the full context of every rule in one batched encode
+    texts = [
+        f"Yoga: {rule.get('main_condition', '')}. Modification: {rule.get('modifying_condition', '')}. "
+        f"Result: {rule.get('result', '')}"
+        for rule in rules
+    ]
+    vectors = model.encode(texts)
+    embeddings = {rule["id"]: vector.tolist() for rule, vector in zip(rules, vectors)}
+
+    def properties(rule):
+        return {
+            "text": rule.get("result", ""),
+            "main_condition": rule.get("main_condition", ""),
+            "modifying_condition": rule.get("modifying_condition", ""),
+            "source": rule.get("source", "Unknown"),
+            "embedding": embeddings[rule["id"]],
+            "type": "yoga",
+        }
+
+    # 3. Rule rows, planet links and house links (from the main condition) in UNWIND batches
+    rows = compile_rows(rules, properties, lambda rule: rule.get("main_condition", ""))
+    stats = bulk_ingest(driver, *rows, batch_size=batch_size)
+
+    print(f"  {format_stats(stats)}")
     print("  Ingestion Complete.")
     driver.close()
 
@@ -0,0 +1,57 @@
+import os
+import torch
+import torch.nn as nn
+
+from src.astronomy.chart import Planet
+
+MODEL_PATH = "models/destiny_net.pth"
+
+
+class DestinyNet(nn.Module):
+    def __init__(self):
+        super(DestinyNet, self).__init__()
+        # Input: 18 features (9 Planets x 2 values: SignID, HouseID)
+        self.fc1 = nn.Linear(18, 128)
+        self.fc2 = nn.Linear(128, 64)
+        self.fc3 = nn.Linear(64, 32)
+        self.fc4 = nn.Linear(32, 1)
+        self.relu = nn.ReLU()
+        self.sigmoid = nn.Sigmoid()
+
+    def forward(self, x):
+        return self.sigmoid(
+            self.fc4(self.relu(self.fc3(self.relu(self.fc2(self.relu(self.fc1(x)))))))
+        )
+
+
+def load_destiny_model(path=MODEL_PATH):
+    """
+    Builds DestinyNet and loads the trained weights if present (untrained model otherwise).
+    """
+    model = DestinyNet()
+    if os.path.exists(path):
+        try:
+            model.load_state_dict(torch.load(path))
+            model.eval()
+            print("  DL Model Loaded")
+        except:
+            print("⚠️ DL Model Load Failed")
+    return model
+
+
+def get_dl_vector(chart):
+    vec = []
+    for pos in chart.positions[: Planet.ASCENDANT]:
+        if pos is not None:
+            vec.extend([pos.sign_id, pos.house_number or 1])
+        else:
+            vec.extend([0, 0])
+    return torch.tensor([vec], dtype=torch.float32)
+
+
+def destiny_score(model, chart):
+    """
+    DestinyNet score (0-100) of a chart.
+    """
+    with torch.no_grad():
+        return int(model(get_dl_vector(chart)).item() * 100)
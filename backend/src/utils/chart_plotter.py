@@ -1,6 +1,7 @@
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_agg import FigureCanvasAgg
 import io
+from src.astronomy.chart import Planet, as_chart
 
 
 def draw_north_indian_chart(planet_data, asc_sign_id, title="D1 Rashi Chart"):
@@ -84,12 +85,15 @@ def draw_north_indian_chart(planet_data, asc_sign_id, title="D1 Rashi Chart"):
     house_planets = {i: [] for i in range(1, 13)}
     asc_sign = asc_sign_id
 
-    for p_name, data in planet_data.items():
-        if p_name == "Ascendant":
+    for data in as_chart(planet_data).positions:
+        if data is None:
+            continue
+        p_name = data.name
+        if data.planet == Planet.ASCENDANT:
             house_planets[1].append(("Asc", PLANET_COLORS["As"]))
             continue
 
-        p_sign = data["sign_id"]
+        p_sign = data.sign_id
         house_num = (p_sign - asc_sign) + 1
         if house_num <= 0:
             house_num += 12
@@ -98,7 +102,7 @@ def draw_north_indian_chart(planet_data, asc_sign_id, title="D1 Rashi Chart"):
         if p_name == "Mars":
             raw_label = "Ma"
 
-        is_retro = data.get("is_retrograde", False)
+        is_retro = data.is_retrograde
         label_str = f"{raw_label}®" if is_retro else raw_label
         color = PLANET_COLORS.get(raw_label, "black")
 
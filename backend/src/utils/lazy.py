@@ -0,0 +1,61 @@
+import threading
+import time
+
+
+class LazyResource:
+    """
+    Heavy subsystem (torch model, matplotlib renderer, JSON rule DB) loaded on first get()
+    or ahead of time by a background warm-up. Thread-safe: concurrent callers wait for the
+    single load instead of loading twice.
+    """
+
+    def __init__(self, name, loader):
+        self.name = name
+        self._loader = loader
+        self._value = None
+        self._lock = threading.Lock()
+        self.state = "pending"  # pending -> loading -> ready | failed
+        self.load_seconds = None
+        self.error = None
+
+    def get(self):
+        if self.state == "ready":
+            return self._value
+        with self._lock:
+            if self.state != "ready":
+                self.state = "loading"
+                start = time.perf_counter()
+                try:
+                    self._value = self._loader()
+                except Exception as e:
+                    self.state = "failed"
+                    self.error = str(e)
+                    raise
+                self.load_seconds = time.perf_counter() - start
+                self.state = "ready"
+        return self._value
+
+    def status(self):
+        info = {"state": self.state}
+        if self.load_seconds is not None:
+            info["load_seconds"] = round(self.load_seconds, 3)
+        if self.error:
+            info["error"] = self.error
+        return info
+
+
+def warm_up(resources):
+    """
+    Loads every resource in order, swallowing failures (they are reported by status()).
+    """
+    for resource in resources:
+        try:
+            resource.get()
+        except Exception:
+            pass
+
+
+def start_warm_up(resources):
+    thread = threading.Thread(target=warm_up, args=(list(resources),), name="warm-up", daemon=True)
+    thread.start()
+    return thread
@@ -11,6 +11,7 @@ from reportlab.platypus import (
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.units import inch
+from src.astronomy.chart import Planet, as_chart
 
 
 class PDFReportGenerator:
@@ -109,14 +110,14 @@ class PDFReportGenerator:
             "Pisces",
         ]
 
-        for p_name, p_data in data["planets"].items():
-            if p_name == "Ascendant":
+        for p_data in as_chart(data["planets"]).positions[: Planet.ASCENDANT]:
+            if p_data is None:
                 continue
-            sign = zodiac[p_data["sign_id"]]
-            deg = f"{int(p_data['degree'])}° {int((p_data['degree'] % 1) * 60)}'"
-            house = p_data.get("house_number", "-")
-            retro = "Yes" if p_data.get("is_retrograde") else "-"
-            table_data.append([p_name, sign, house, deg, retro])
+            sign = zodiac[p_data.sign_id]
+            deg = f"{int(p_data.degree)}° {int((p_data.degree % 1) * 60)}'"
+            house = p_data.house_number if p_data.house_number is not None else "-"
+            retro = "Yes" if p_data.is_retrograde else "-"
+            table_data.append([p_data.name, sign, house, deg, retro])
 
         t_planets = Table(table_data, colWidths=[80, 80, 60, 80, 60])
         t_planets.setStyle(
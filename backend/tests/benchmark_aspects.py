@@ -0,0 +1,47 @@
+import os
+import sys
+import time
+import statistics
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.astronomy.aspects import aspect_matrices, chart_aspects, get_planet_aspects
+from src.astronomy.engine import VedicAstroEngine
+
+# Configuration
+RUNS = 2000
+BATCH = 10000
+
+
+def time_call(fn, runs):
+    latencies = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(latencies)
+
+
+def run_benchmark():
+    engine = VedicAstroEngine(cache_size=0)
+    chart = engine.calculate_chart(1990, 5, 25, 14, 30, 28.61, 77.20, 5.5)
+    rng = np.random.default_rng(0)
+    cols = engine.calculate_charts_batch(
+        rng.integers(1950, 2010, BATCH), rng.integers(1, 13, BATCH), rng.integers(1, 29, BATCH),
+        rng.integers(0, 24, BATCH), rng.integers(0, 60, BATCH), np.full(BATCH, 28.61), np.full(BATCH, 77.20),
+        np.full(BATCH, 5.5),
+    )
+    longitudes, asc = cols["absolute_longitude"], cols["ascendant"]["absolute_longitude"]
+
+    print(f"Aspect Matrix Benchmark (per chart; batch of {BATCH})")
+    print("-" * 50)
+    print(f"string log (get_planet_aspects):    {time_call(lambda: get_planet_aspects(chart), RUNS):8.1f} us")
+    print(f"matrices, one chart (chart_aspects): {time_call(lambda: chart_aspects(chart), RUNS):8.1f} us")
+    per_chart = time_call(lambda: aspect_matrices(longitudes, asc), 20) / BATCH
+    print(f"matrices, batch (aspect_matrices):   {per_chart * 1000:8.0f} ns")
+    print("-" * 50)
+
+
+if __name__ == "__main__":
+    run_benchmark()
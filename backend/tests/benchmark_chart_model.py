@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+import statistics
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.astronomy.engine import VedicAstroEngine
+from src.astronomy.chart import Chart, Planet
+
+# Configuration
+CHART_COUNT = 10000
+ACCESS_RUNS = 200000
+
+
+def measure_memory(build):
+    tracemalloc.start()
+    charts = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return charts, current / len(charts)
+
+
+def time_access(label, fn):
+    samples = []
+    for _ in range(5):
+        t0 = time.perf_counter()
+        for _ in range(ACCESS_RUNS):
+            fn()
+        samples.append((time.perf_counter() - t0) / ACCESS_RUNS * 1e9)
+    print(f"{label:<36} {statistics.median(samples):8.1f} ns")
+
+
+def run_benchmark():
+    engine = VedicAstroEngine(cache_size=0)
+    template = engine.calculate_chart(1990, 5, 25, 14, 30, 28.61, 77.20, 5.5)
+
+    print(f"Chart Model Benchmark: {CHART_COUNT} charts")
+    print("-" * 50)
+
+    # 1. Memory per chart (legacy dict-of-dicts vs slotted Chart)
+    dicts, dict_bytes = measure_memory(lambda: [template.to_dict() for _ in range(CHART_COUNT)])
+    charts, chart_bytes = measure_memory(lambda: [Chart.from_dict(d) for d in dicts])
+    print(f"dict-of-dicts:  {dict_bytes:8.0f} bytes/chart")
+    print(f"Chart:          {chart_bytes:8.0f} bytes/chart ({dict_bytes / chart_bytes:.1f}x smaller)")
+    print("-" * 50)
+
+    # 2. Field access latency
+    d, positions, c = dicts[0], charts[0].positions, charts[0]
+    moon = int(Planet.MOON)
+    time_access('dict   d["Moon"]["sign_id"]', lambda: d["Moon"]["sign_id"])
+    time_access("Chart  positions[MOON].sign_id", lambda: positions[moon].sign_id)
+    time_access('Chart  c["Moon"]["sign_id"] (compat)', lambda: c["Moon"]["sign_id"])
+    print("-" * 50)
+
+    # 3. Full single-chart calculation (builds the Chart)
+    latencies = []
+    for i in range(2000):
+        t0 = time.perf_counter()
+        engine.calculate_chart(1990, 5, 25, 14, i % 60, 28.61, 77.20, 5.5)
+        latencies.append((time.perf_counter() - t0) * 1e6)
+    print(f"calculate_chart median: {statistics.median(latencies):.1f} us")
+
+
+if __name__ == "__main__":
+    run_benchmark()
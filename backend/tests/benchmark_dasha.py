@@ -0,0 +1,73 @@
+import os
+import sys
+import time
+import statistics
+import tracemalloc
+from datetime import datetime
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+from src.astronomy.dasha import DASHA_SYSTEMS, VimshottariDasha, dasha_timelines
+from src.astronomy.engine import VedicAstroEngine
+
+# Configuration
+RUNS = 2000
+TREE_RUNS = 50
+BIRTH = datetime(1990, 5, 25, 14, 30)
+MOON_LONGITUDE = 123.4
+TARGET = datetime(2026, 3, 1)
+POINTS = 10000  # dates per vectorized lookup
+
+
+def time_call(fn, runs):
+    latencies = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(latencies)
+
+
+def allocated(fn):
+    tracemalloc.start()
+    result = fn()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def run_benchmark():
+    dasha = VimshottariDasha()
+    dasha.calculate_timeline(MOON_LONGITUDE, BIRTH).current(TARGET)  # build the shared template once
+
+    print("Vimshottari Dasha Benchmark (4 levels, 8200 periods)")
+    print("-" * 50)
+
+    timeline, timeline_bytes = allocated(lambda: dasha.calculate_timeline(MOON_LONGITUDE, BIRTH))
+    _, tree_bytes = allocated(lambda: dasha.calculate_dashas(MOON_LONGITUDE, BIRTH))
+
+    print(f"calculate_timeline (columnar): {time_call(lambda: dasha.calculate_timeline(MOON_LONGITUDE, BIRTH), RUNS):10.1f} us  {timeline_bytes:>10} bytes")
+    print(f"calculate_dashas (nested dicts): {time_call(lambda: dasha.calculate_dashas(MOON_LONGITUDE, BIRTH), TREE_RUNS):8.1f} us  {tree_bytes:>10} bytes")
+    print(f"timeline.current():            {time_call(lambda: timeline.current(TARGET), RUNS):10.1f} us")
+    print("-" * 50)
+
+    # Every system through the shared template core, for one real chart
+    chart = VedicAstroEngine().calculate_chart(BIRTH.year, BIRTH.month, BIRTH.day, BIRTH.hour, BIRTH.minute, 28.61, 77.20, 5.5)
+    dates = np.datetime64(BIRTH, "D") + np.arange(POINTS) * 4
+    print(f"All systems ({', '.join(DASHA_SYSTEMS)}) for one chart")
+    print(f"dasha_timelines (all systems): {time_call(lambda: dasha_timelines(chart, BIRTH), RUNS):10.1f} us")
+    for name, system in DASHA_SYSTEMS.items():
+        tl = system.timeline(chart, BIRTH)
+        rows = tl.template.offsets[-1]
+        print(
+            f"{name:<12} {rows:>6} periods  timeline {time_call(lambda: system.timeline(chart, BIRTH), RUNS):6.1f} us"
+            f"  current {time_call(lambda: tl.current(TARGET), RUNS):5.1f} us"
+            f"  dasha_at x{POINTS} {time_call(lambda: tl.dasha_at(dates), 20) / 1000:5.2f} ms"
+        )
+    print("-" * 50)
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,81 @@
+import os
+import sys
+import time
+import statistics
+import numpy as np
+import swisseph as swe
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.astronomy.engine import VedicAstroEngine, SWE_BODIES, PLANET_NAMES
+from src.astronomy.ephemeris_table import EphemerisTable
+
+# Configuration
+ACCURACY_SAMPLES = 20000
+LATENCY_RUNS = 2000
+BATCH_SIZE = 1000
+
+
+def check_accuracy(table):
+    rng = np.random.default_rng(7)
+    jds = rng.uniform(table.start_jd, table.end_jd, ACCURACY_SAMPLES)
+    lon, speed = table.positions_batch(jds)
+
+    print("ACCURACY vs swisseph")
+    print("-" * 50)
+    for j, p_code in enumerate(SWE_BODIES):
+        ref = np.array([swe.calc_ut(jd, p_code, swe.FLG_SWIEPH | swe.FLG_SPEED)[0] for jd in jds])
+        lon_err = np.abs((lon[:, j] - ref[:, 0] + 180) % 360 - 180) * 3600
+        speed_err = np.abs(speed[:, j] - ref[:, 3])
+        print(f"{PLANET_NAMES[j]:<8} max {lon_err.max():.4f}\"  p99 {np.percentile(lon_err, 99):.4f}\"  speed max {speed_err.max():.6f} deg/day")
+    print("-" * 50)
+
+
+def time_single(engine):
+    latencies = []
+    for i in range(LATENCY_RUNS):
+        t0 = time.perf_counter()
+        engine.calculate_chart(1990, 5, 25, 14, i % 60, 28.61, 77.20, 5.5)
+        latencies.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(latencies)
+
+
+def time_batch(engine):
+    rng = np.random.default_rng(3)
+    cols = [
+        rng.integers(1900, 2100, BATCH_SIZE),
+        rng.integers(1, 13, BATCH_SIZE),
+        rng.integers(1, 29, BATCH_SIZE),
+        rng.integers(0, 24, BATCH_SIZE),
+        rng.integers(0, 60, BATCH_SIZE),
+        rng.uniform(-60, 60, BATCH_SIZE),
+        rng.uniform(-180, 180, BATCH_SIZE),
+        np.full(BATCH_SIZE, 5.5),
+    ]
+    t0 = time.perf_counter()
+    engine.calculate_charts_batch(*cols)
+    return BATCH_SIZE / (time.perf_counter() - t0)
+
+
+def run_benchmark():
+    table = EphemerisTable.load_if_available()
+    if table is None:
+        print("No ephemeris table found. Build it first: python -m src.astronomy.ephemeris_table")
+        return
+
+    check_accuracy(table)
+
+    swe_engine = VedicAstroEngine(cache_size=0)  # latencies of computed charts, not cache hits
+    table_engine = VedicAstroEngine(ephemeris_table=table, cache_size=0)
+
+    print("LATENCY")
+    print("-" * 50)
+    print(f"Single chart (swisseph): {time_single(swe_engine):.1f} us (median)")
+    print(f"Single chart (table):    {time_single(table_engine):.1f} us (median)")
+    print(f"Batch (swisseph):        {time_batch(swe_engine):.0f} charts/sec")
+    print(f"Batch (table):           {time_batch(table_engine):.0f} charts/sec")
+    print("-" * 50)
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,87 @@
+import os
+import sys
+import time
+import statistics
+import numpy as np
+import swisseph as swe
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.astronomy.ayanamsa import AyanamsaSystem
+from src.astronomy.engine import SWE_BODIES
+from src.astronomy.events import EVENT_KINDS, SIGN, EventCatalog
+from src.astronomy.tables import PADA_SPAN
+
+# Configuration
+RUNS = 2000
+START_JD = 2461041.5  # 2026-01-01
+YEAR = 365.25
+ACCURACY_SAMPLES = 2000
+
+
+def time_call(fn, runs):
+    latencies = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(latencies)
+
+
+def sampled_sign_changes(body, start_jd, days):
+    """
+    The dense-sampling alternative: one swisseph call per day, sign changes located to the day.
+    """
+    ayanamsa = AyanamsaSystem.get_model("LAHIRI")
+    jds = start_jd + np.arange(days)
+    lon = np.array([swe.calc_ut(jd, SWE_BODIES[body], swe.FLG_SWIEPH)[0][0] for jd in jds.tolist()])
+    signs = ((lon - ayanamsa.value(jds)) % 360 // 30).astype(int)
+    return jds[1:][signs[1:] != signs[:-1]]
+
+
+def ingress_error_seconds(catalog):
+    """
+    |sidereal longitude - boundary| / speed at random catalogued ingresses, in seconds of time.
+    """
+    ayanamsa = AyanamsaSystem.get_model("LAHIRI")
+    rows = catalog.events[catalog.events["kind"] <= 2]  # sign, nakshatra, pada
+    rng = np.random.default_rng(0)
+    errors = []
+    for row in rows[rng.choice(len(rows), ACCURACY_SAMPLES, replace=False)]:
+        body = int(row["body"])
+        xx = swe.calc_ut(float(row["jd"]), SWE_BODIES[min(body, 7)], swe.FLG_SWIEPH | swe.FLG_SPEED)[0]
+        lon = (xx[0] - ayanamsa.value(row["jd"]) + (180.0 if body == 8 else 0.0)) % 360
+        boundary = round(float(row["longitude"]) / PADA_SPAN) * PADA_SPAN
+        errors.append(abs((lon - boundary + 180) % 360 - 180) / abs(xx[3]) * 86400)
+    return np.array(errors)
+
+
+def run_benchmark():
+    catalog = EventCatalog.load_if_available()
+    if catalog is None:
+        print("Event catalog not built: python -m src.astronomy.events")
+        return
+
+    print(f"Event Catalog Benchmark ({len(catalog.events)} events, {catalog.events.nbytes / 1e6:.1f} MB)")
+    print("-" * 50)
+    for kind in range(len(EVENT_KINDS)):
+        count = int((catalog.events["kind"] == kind).sum())
+        print(f"  {EVENT_KINDS[kind]:<11} {count:>8}")
+    print("-" * 50)
+
+    t0 = time.perf_counter()
+    sampled = sampled_sign_changes(6, START_JD, int(30 * YEAR))
+    sampled_ms = (time.perf_counter() - t0) * 1000
+    found = catalog.between(START_JD, START_JD + 30 * YEAR, bodies=[6], kinds=[SIGN])
+    print(f"Saturn sign ingresses, 30 years: daily sampling {sampled_ms:8.1f} ms ({len(sampled)} found, to the day)")
+    print(f"                                 catalog        {time_call(lambda: catalog.between(START_JD, START_JD + 30 * YEAR, bodies=[6], kinds=[SIGN]), RUNS) / 1000:8.3f} ms ({len(found)} found)")
+    print(f"One year, all grahas and kinds:  catalog        {time_call(lambda: catalog.between(START_JD, START_JD + YEAR), 200) / 1000:8.3f} ms")
+    print(f"next_event (Saturn -> Pisces):   catalog        {time_call(lambda: catalog.next_event(6, SIGN, START_JD, 11), RUNS):8.1f} us")
+    print("-" * 50)
+
+    errors = ingress_error_seconds(catalog)
+    print(f"Ingress time vs swisseph ({ACCURACY_SAMPLES} samples): median {np.median(errors):.3f} s, max {errors.max():.3f} s")
+
+
+if __name__ == "__main__":
+    run_benchmark()
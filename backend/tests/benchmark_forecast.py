@@ -0,0 +1,98 @@
+import json
+import os
+import sys
+import time
+import statistics
+import tracemalloc
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.astronomy.ephemeris_table import EphemerisTable
+from src.astronomy.events import EventCatalog
+from src.astronomy.forecast import BatchForecaster
+from src.astronomy.transits import TransitEngine
+
+# Configuration
+RUNS = 2000
+LOCATION = {"lat": 28.61, "lon": 77.20, "tz": 5.5}
+STORED_SUBSCRIBERS = 200000
+BIRTH_SUBSCRIBERS = 20000
+
+
+def time_call(fn, runs):
+    latencies = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(latencies)
+
+
+def subscriber_lines(count, births):
+    """
+    Synthetic NDJSON subscribers: stored signs, or random births when births=True.
+    """
+    rng = np.random.default_rng(0)
+    for i in range(count):
+        if births:
+            yield json.dumps({
+                "id": i, "year": int(rng.integers(1950, 2010)), "month": int(rng.integers(1, 13)),
+                "day": int(rng.integers(1, 29)), "hour": int(rng.integers(0, 24)), "minute": 0,
+                "latitude": 28.61, "longitude": 77.20, "timezone": 5.5,
+            })
+        else:
+            yield json.dumps({"id": i, "ascendant_sign_id": i % 12, "moon_sign_id": i * 7 % 12})
+
+
+def stream_throughput(forecaster, count, births):
+    """
+    Subscribers/s through BatchForecaster.stream, then its peak traced memory on a second pass
+    (tracemalloc slows allocation, so it is kept out of the timing).
+    """
+    lines = list(subscriber_lines(count, births))
+    t0 = time.perf_counter()
+    for _ in forecaster.stream(lines):
+        pass
+    rate = count / (time.perf_counter() - t0)
+    tracemalloc.start()
+    for _ in forecaster.stream(lines):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rate, peak
+
+
+def run_benchmark():
+    engine = TransitEngine(
+        ephemeris_table=EphemerisTable.load_if_available(),
+        cache_size=0,  # every request computes its birth chart, like distinct users would
+        event_catalog=EventCatalog.load_if_available(),
+    )
+    birth = lambda: engine.calculate_chart(1990, 5, 25, 14, 30, LOCATION["lat"], LOCATION["lon"], LOCATION["tz"])
+    chart = birth()
+
+    def per_request_sky():
+        engine.sky.refresh()  # what every request used to pay: the sky recomputed
+        return engine.calculate_current_transits(chart, LOCATION)
+
+    print("Daily Forecast Benchmark (per request, median)")
+    print("-" * 50)
+    print(f"birth chart:                      {time_call(birth, RUNS):8.1f} us")
+    print(f"transits, sky recomputed:         {time_call(per_request_sky, RUNS):8.1f} us")
+    print(f"transits, shared CurrentSky:      {time_call(lambda: engine.calculate_current_transits(chart, LOCATION), RUNS):8.1f} us")
+    print(f"full forecast (chart + transits): {time_call(lambda: engine.calculate_current_transits(birth(), LOCATION), RUNS):8.1f} us")
+    print("-" * 50)
+
+    forecaster = BatchForecaster(engine)
+    loop_rate = RUNS / (time_call(lambda: [engine.calculate_current_transits(chart, LOCATION) for _ in range(RUNS)], 3) / 1e6)
+    print("Bulk forecasts (/daily_forecast/batch, NDJSON in and out)")
+    print(f"per-subscriber loop, charts precomputed: {loop_rate:10.0f} subscribers/s")
+    for label, count, births in [("stored signs", STORED_SUBSCRIBERS, False), ("birth details", BIRTH_SUBSCRIBERS, True)]:
+        rate, peak = stream_throughput(forecaster, count, births)
+        print(f"batch stream, {label:<13} x{count:<7} {rate:10.0f} subscribers/s  peak {peak / 1e6:5.1f} MB")
+    print("-" * 50)
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,154 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.knowledge_graph.bulk import (
+    HOUSE_LINK_QUERY, PLANET_LINK_QUERY, PLANET_NAMES, RULE_QUERY, bulk_ingest, compile_rows, format_stats,
+)
+
+# Configuration
+RULES = 20000
+BATCH_SIZES = [100, 1000, 5000]
+ROUND_TRIP = 0.0005  # seconds per request to a local Neo4j over bolt
+PER_ROW = 0.000002  # seconds of server work per UNWIND row
+ORDINALS = {1: "st", 2: "nd", 3: "rd"}
+
+
+class StandInGraph:
+    """In-memory stand-in for the Rule / Planet / House graph of schema.py: applies the bulk queries."""
+
+    def __init__(self):
+        self.planets = set(PLANET_NAMES)
+        self.houses = set(range(1, 13))
+        self.rules = {}
+        self.links = set()
+
+    def apply(self, query, rows):
+        for row in rows:
+            if query is RULE_QUERY:
+                self.rules.setdefault(row["id"], {}).update(row["props"])
+            elif query is PLANET_LINK_QUERY:
+                if row["id"] in self.rules and row["planet"] in self.planets:
+                    self.links.add((row["id"], "MENTIONS_PLANET", row["planet"]))
+            elif query is HOUSE_LINK_QUERY:
+                if row["id"] in self.rules and row["house"] in self.houses:
+                    self.links.add((row["id"], "APPLIES_TO_HOUSE", row["house"]))
+
+
+class StandInResult:
+    def consume(self):
+        return None
+
+
+class StandInTransaction:
+    def __init__(self, graph):
+        self.graph = graph
+
+    def run(self, query, rows=()):
+        time.sleep(ROUND_TRIP + PER_ROW * len(rows))
+        self.graph.apply(query, rows)
+        return StandInResult()
+
+
+class StandInSession:
+    """neo4j.Session subset: auto-commit run() and execute_write() (one more round trip to commit)."""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self, query, rows=()):
+        self.driver.requests += 1
+        return StandInTransaction(self.driver.graph).run(query, rows)
+
+    def execute_write(self, fn, *args):
+        self.driver.requests += 2
+        result = fn(StandInTransaction(self.driver.graph), *args)
+        time.sleep(ROUND_TRIP)
+        return result
+
+
+class StandInDriver:
+    def __init__(self):
+        self.graph = StandInGraph()
+        self.requests = 0
+
+    def session(self):
+        return StandInSession(self)
+
+
+def synthetic_rules(count):
+    rules = []
+    for i in range(count):
+        planet, other = PLANET_NAMES[i % 9], PLANET_NAMES[(i * 7 + 3) % 9]
+        house = i % 12 + 1
+        rules.append({
+            "id": f"rule_{i}",
+            "type": "yoga",
+            "entities": [planet, f"{other} (lord)", "Lagna"],
+            "main_condition": f"{planet} in {house}{ORDINALS.get(house, 'th')} House",
+            "modifying_condition": f"aspected by {other}",
+            "result": f"Result text of rule {i}",
+            "source": f"Chapter {i % 97}",
+        })
+    return rules
+
+
+def properties(rule):
+    return {
+        "text": rule["result"],
+        "main_condition": rule["main_condition"],
+        "modifying_condition": rule["modifying_condition"],
+        "source": rule["source"],
+        "type": "yoga",
+    }
+
+
+def per_row_ingest(driver, rule_rows, planet_rows, house_rows):
+    """The previous pattern: one auto-commit round trip per rule, planet link and house link."""
+    t0 = time.perf_counter()
+    with driver.session() as session:
+        for query, rows in ((RULE_QUERY, rule_rows), (PLANET_LINK_QUERY, planet_rows), (HOUSE_LINK_QUERY, house_rows)):
+            for row in rows:
+                session.run(query, rows=[row])
+    return time.perf_counter() - t0
+
+
+def run_benchmark():
+    rules = synthetic_rules(RULES)
+
+    print(f"Knowledge Graph Ingestion Benchmark ({RULES} rules, {ROUND_TRIP * 1e3:.1f} ms round trip stand-in)")
+    print("-" * 50)
+    t0 = time.perf_counter()
+    rows = compile_rows(rules, properties, lambda rule: rule["main_condition"])
+    total = sum(len(r) for r in rows)
+    print(f"compile_rows:        {(time.perf_counter() - t0) * 1e3:8.1f} ms for {total} rows")
+
+    # The per-row path is timed on a slice and extrapolated (it makes one request per row)
+    sample = [r[:len(r) // 20] for r in rows]
+    legacy = StandInDriver()
+    seconds = per_row_ingest(legacy, *sample) * total / sum(len(r) for r in sample)
+    print(f"per-row auto-commit: {total / seconds:10,.0f} rows/s (~{seconds:.1f} s, {total} requests)")
+
+    for batch_size in BATCH_SIZES:
+        driver = StandInDriver()
+        stats = bulk_ingest(driver, *rows, batch_size=batch_size)
+        print(f"UNWIND x {batch_size:<5}:     {stats['rows_per_sec']:10,.0f} rows/s ({driver.requests} requests)")
+
+    # Both paths build the same graph
+    check = StandInDriver()
+    bulk_ingest(check, *sample)
+    assert check.graph.rules == legacy.graph.rules and check.graph.links == legacy.graph.links
+    print(f"last run: {format_stats(stats)}")
+    print("-" * 50)
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,44 @@
+import os
+import sys
+import time
+import statistics
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.astronomy.engine import VedicAstroEngine
+from src.astronomy.jaimini import jaimini_analysis
+from src.astronomy.yogas import YogaEngine
+
+# Configuration
+RUNS = 5000
+BIRTH = (1990, 5, 25, 14, 30, 28.61, 77.20, 5.5)
+
+
+def time_call(fn, runs):
+    latencies = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(latencies)
+
+
+def run_benchmark():
+    engine = VedicAstroEngine(cache_size=0)  # the chart is computed every time
+    chart = engine.calculate_chart(*BIRTH)
+    yogas = YogaEngine()
+
+    print("Jaimini Bundle Benchmark (per chart)")
+    print("-" * 50)
+    jaimini = time_call(lambda: jaimini_analysis(chart), RUNS)
+    natal = time_call(lambda: engine.calculate_chart(*BIRTH), RUNS // 10)
+    print(f"jaimini_analysis (karakas, A1-A12, UL): {jaimini:8.1f} us")
+    print(f"  from a legacy dict chart:             {time_call(lambda: jaimini_analysis(chart.to_dict()), RUNS):8.1f} us")
+    print(f"for reference, calculate_chart:         {natal:8.1f} us")
+    print(f"for reference, check_yogas:             {time_call(lambda: yogas.check_yogas(chart), RUNS):8.1f} us")
+    print(f"added to /predict's chart work:         {jaimini / natal * 100:8.1f} %")
+    print("-" * 50)
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,75 @@
+import io
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.astronomy.ephemeris_table import EphemerisTable
+from src.astronomy.panchang import PanchangEngine, to_ndjson, to_parquet
+
+# Configuration
+YEAR = 2025
+CITIES = [
+    {"name": "Delhi", "latitude": 28.61, "longitude": 77.20, "timezone": 5.5},
+    {"name": "Mumbai", "latitude": 19.08, "longitude": 72.88, "timezone": 5.5},
+    {"name": "Chennai", "latitude": 13.08, "longitude": 80.27, "timezone": 5.5},
+    {"name": "Kolkata", "latitude": 22.57, "longitude": 88.36, "timezone": 5.5},
+    {"name": "Kathmandu", "latitude": 27.72, "longitude": 85.32, "timezone": 5.75},
+    {"name": "London", "latitude": 51.51, "longitude": -0.13, "timezone": 0.0},
+    {"name": "New York", "latitude": 40.71, "longitude": -74.01, "timezone": -5.0},
+    {"name": "Singapore", "latitude": 1.35, "longitude": 103.82, "timezone": 8.0},
+]
+# Polar first: the Parquet table must not take its columns from an error record
+MIXED_CITIES = [
+    {"name": "Longyearbyen", "latitude": 78.22, "longitude": 15.65, "timezone": 1.0},
+    CITIES[0],
+    {"name": "Alert", "latitude": 82.50, "longitude": -62.30, "timezone": -5.0},
+    CITIES[5],
+]
+
+
+def time_city_years(engine):
+    t0 = time.perf_counter()
+    size = sum(len(line) for line in to_ndjson(engine.stream(YEAR, CITIES)))
+    return (time.perf_counter() - t0) / len(CITIES), size / len(CITIES)
+
+
+def check_parquet(engine):
+    """
+    Mixed polar / normal cities: every city-day of the normal cities is in the table, unchanged,
+    and the polar cities are reported as errors.
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("Parquet check skipped: pyarrow not installed")
+        return
+    sink = io.BytesIO()
+    errors = to_parquet(engine.stream(YEAR, MIXED_CITIES), sink)
+    rows = pq.read_table(io.BytesIO(sink.getvalue())).to_pylist()
+    expected = [r for r in engine.stream(YEAR, MIXED_CITIES) if "error" not in r]
+    assert rows == expected, "Parquet rows differ from the stream"
+    assert [e["city"] for e in errors] == ["Longyearbyen", "Alert"]
+    print(f"Parquet check: {len(rows)} city-days, {len(errors)} polar cities reported as errors")
+
+
+def run_benchmark():
+    table = EphemerisTable.load_if_available()
+    print(f"Panchang Benchmark ({YEAR}, {len(CITIES)} cities, per city-year incl. NDJSON)")
+    print("-" * 50)
+    for label, ephemeris in (("swisseph", None), ("ephemeris table", table)):
+        if label == "ephemeris table" and table is None:
+            print("ephemeris table not built: python -m src.astronomy.ephemeris_table")
+            continue
+        engine = PanchangEngine(ephemeris)
+        cold, size = time_city_years(engine)
+        warm, _ = time_city_years(engine)  # sunrises cached
+        print(f"{label:<16} cold {cold * 1000:7.1f} ms   cached sunrises {warm * 1000:7.1f} ms")
+    print(f"NDJSON per city-year: {size / 1024:.0f} KB")
+    check_parquet(engine)
+    print("-" * 50)
+
+
+if __name__ == "__main__":
+    run_benchmark()
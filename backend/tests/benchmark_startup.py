@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+import statistics
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Configuration
+RUNS = 3
+READY_TIMEOUT = 120
+
+# Each probe runs in a fresh interpreter so nothing is already imported
+IMPORT_PROBE = """
+import time
+start = time.perf_counter()
+import src.api.main
+print(time.perf_counter() - start)
+"""
+
+STARTUP_PROBE = """
+import time
+start = time.perf_counter()
+from fastapi.testclient import TestClient
+from src.api.main import app
+with TestClient(app) as client:
+    served = time.perf_counter() - start
+    while client.get("/ready").status_code != 200:
+        if time.perf_counter() - start > {timeout}:
+            raise SystemExit("not ready")
+        time.sleep(0.05)
+    print(served, time.perf_counter() - start)
+"""
+
+
+def run_probe(code, mode):
+    env = dict(os.environ, STARTUP_MODE=mode)
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, env=env,
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return [float(x) for x in out.strip().splitlines()[-1].split()]
+
+
+def top_imports(count=8):
+    """
+    Slowest direct imports of src.api.main (python -X importtime, cumulative).
+    """
+    err = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.api.main"],
+        cwd=BACKEND_DIR, env=dict(os.environ, STARTUP_MODE="lazy"),
+        capture_output=True, text=True, check=True,
+    ).stderr
+    rows = []
+    for line in err.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # One indent level below the top: modules imported by src.api.main itself
+        if cumulative.strip().isdigit() and name.startswith("   ") and not name.startswith("    "):
+            rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:count]
+
+
+def run_benchmark():
+    print(f"Startup Benchmark ({RUNS} runs each, fresh interpreter per run)")
+    print("-" * 50)
+
+    imports = [run_probe(IMPORT_PROBE, "lazy")[0] for _ in range(RUNS)]
+    print(f"import src.api.main:           {statistics.median(imports):.2f} s")
+
+    for mode in ["eager", "background"]:
+        runs = [run_probe(STARTUP_PROBE.format(timeout=READY_TIMEOUT), mode) for _ in range(RUNS)]
+        served = statistics.median(r[0] for r in runs)
+        warmed = statistics.median(r[1] for r in runs)
+        print(f"{mode:<10} serving after {served:.2f} s, /ready after {warmed:.2f} s")
+    print("-" * 50)
+
+    print("Slowest imports (lazy mode, cumulative):")
+    for micros, name in top_imports():
+        print(f"  {micros / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
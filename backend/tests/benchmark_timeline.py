@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from itertools import islice
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.astronomy.chart import Planet
+from src.astronomy.dasha import VimshottariDasha
+from src.astronomy.engine import VedicAstroEngine
+from src.astronomy.events import EventCatalog
+from src.astronomy.life_events import LifeTimeline
+
+# Configuration
+BIRTH = (1990, 5, 25, 14, 30, 28.61, 77.20, 5.5)
+PAGE = 100
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - t0) * 1000
+
+
+def peak_memory(fn):
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def run_benchmark():
+    catalog = EventCatalog.load_if_available()
+    chart = VedicAstroEngine().calculate_chart(*BIRTH)
+    birth = datetime(*BIRTH[:5])
+    natal = {"lagna": chart.ascendant.sign_id, "moon": chart[Planet.MOON].sign_id}
+    life = LifeTimeline(VimshottariDasha().timeline(chart, birth), natal, catalog, BIRTH[7])
+    stream = lambda: life.events(depth=4)
+
+    count, full_ms = timed(lambda: sum(1 for _ in stream()))
+    print(f"Life Timeline Benchmark (Vimshottari to Sookshma{', dasha only' if catalog is None else ' + catalog transits'})")
+    print("-" * 50)
+    print(f"full lifetime, streamed:     {count:>7} events  {full_ms:8.1f} ms")
+    print(f"first page ({PAGE} events):     {timed(lambda: list(islice(stream(), PAGE)))[1]:18.2f} ms")
+    print(f"one year (2026):             {timed(lambda: list(life.events(datetime(2026, 1, 1), datetime(2027, 1, 1), depth=4)))[1]:18.2f} ms")
+    print("-" * 50)
+    print(f"peak memory, streamed:       {peak_memory(lambda: sum(1 for _ in stream())) / 1e6:8.2f} MB")
+    print(f"peak memory, materialized:   {peak_memory(lambda: list(stream())) / 1e6:8.2f} MB")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,80 @@
+import os
+import sys
+import time
+import statistics
+import numpy as np
+import swisseph as swe
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.astronomy.ayanamsa import AyanamsaSystem
+from src.astronomy.chart import Planet
+from src.astronomy.engine import SWE_BODIES, VedicAstroEngine
+from src.astronomy.events import EventCatalog
+from src.astronomy.tables import SATURN
+from src.astronomy.transit_windows import TransitWindowFinder
+
+# Configuration
+RUNS = 500
+YEARS = 100
+BIRTH = (1990, 5, 25, 14, 30, 28.61, 77.20, 5.5)
+YEAR = 365.25
+
+
+def time_call(fn, runs):
+    latencies = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(latencies)
+
+
+def sampled_sade_sati(moon_sign, start_jd, days):
+    """
+    The daily-sampling alternative: Saturn's sign every day, Sade Sati days flagged.
+    """
+    ayanamsa = AyanamsaSystem.get_model("LAHIRI")
+    jds = start_jd + np.arange(days)
+    lon = np.array([swe.calc_ut(jd, SWE_BODIES[SATURN], swe.FLG_SWIEPH)[0][0] for jd in jds.tolist()])
+    house = ((lon - ayanamsa.value(jds)) % 360 // 30 - moon_sign) % 12 + 1
+    return jds, np.isin(house, [12, 1, 2])
+
+
+def run_benchmark():
+    catalog = EventCatalog.load_if_available()
+    if catalog is None:
+        print("Event catalog not built: python -m src.astronomy.events")
+        return
+    finder = TransitWindowFinder(catalog)
+    engine = VedicAstroEngine(cache_size=0)  # the natal chart is computed every time
+    chart = engine.calculate_chart(*BIRTH)
+    natal = {
+        "moon": chart[Planet.MOON].sign_id,
+        "lagna": chart.ascendant.sign_id,
+        "saturn": chart[Planet.SATURN].sign_id,
+        "jupiter": chart[Planet.JUPITER].sign_id,
+    }
+    start_jd = engine.get_julian_day(*BIRTH[:5], BIRTH[7])
+    result = finder.find(natal, start_jd, YEARS)
+
+    print(f"Transit Window Benchmark ({YEARS} years, {len(result['windows'])} windows, per native)")
+    print("-" * 50)
+    t0 = time.perf_counter()
+    jds, sade_sati = sampled_sade_sati(natal["moon"], start_jd, int(YEARS * YEAR))
+    print(f"Sade Sati by daily sampling (Saturn only): {(time.perf_counter() - t0) * 1000:8.1f} ms")
+    print(f"all windows from catalog ingresses:        {time_call(lambda: finder.find(natal, start_jd, YEARS), RUNS) / 1000:8.2f} ms")
+    print(f"  incl. natal chart:                       {time_call(lambda: finder.find(natal, start_jd, YEARS) and engine.calculate_chart(*BIRTH), RUNS) / 1000:8.2f} ms")
+    print("-" * 50)
+
+    # Agreement: every sampled day is inside a catalog Sade Sati window and vice versa
+    windows = finder.find(natal, start_jd, YEARS, windows=["sade_sati"])["windows"]
+    stays = finder.sign_stays(SATURN, start_jd, start_jd + YEARS * YEAR)
+    house = (stays[2] - natal["moon"]) % 12 + 1
+    inside = np.isin(house, [12, 1, 2])
+    from_catalog = inside[np.searchsorted(stays[0], jds, side="right") - 1]
+    print(f"Sade Sati windows: {len(windows)}, sampled days disagreeing with the catalog: {int((from_catalog != sade_sati).sum())}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
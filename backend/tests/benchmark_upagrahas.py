@@ -0,0 +1,44 @@
+import os
+import sys
+import time
+import statistics
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.astronomy.upagrahas import UpagrahaEngine
+
+# Configuration
+RUNS = 500
+BIRTH = (1990, 5, 25, 14, 30, 28.61, 77.20, 5.5)
+
+
+def time_call(fn, runs):
+    latencies = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(latencies)
+
+
+def run_benchmark():
+    engine = UpagrahaEngine()
+
+    def cold():
+        engine.sunrises.cache.clear()
+        engine.calculate(*BIRTH)
+
+    # Another birth in the same city and day: a different minute and a point ~300 m away
+    same_city = (1990, 5, 25, 16, 5, 28.612, 77.202, 5.5)
+
+    print("Upagraha Benchmark (6 upagrahas per birth)")
+    print("-" * 50)
+    print(f"cold (3 rise_trans + 6 ascendants):  {time_call(cold, RUNS):8.1f} us")
+    engine.calculate(*BIRTH)
+    print(f"same city and day (cached sunrise):  {time_call(lambda: engine.calculate(*same_city), RUNS):8.1f} us")
+    print(f"sunrise cache: {engine.sunrises.info()}")
+    print("-" * 50)
+
+
+if __name__ == "__main__":
+    run_benchmark()
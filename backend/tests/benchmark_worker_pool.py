@@ -0,0 +1,85 @@
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.astronomy.engine import VedicAstroEngine
+from src.astronomy.worker_pool import AYANAMSA_NAMES, ChartWorkerPool, pack_births
+
+# Configuration
+BIRTH_COUNT = 4000
+CHUNK_SIZE = 250
+BIRTH = (1990, 5, 25, 14, 30, 28.61, 77.20, 5.5)
+
+
+def make_births(count):
+    rng = np.random.default_rng(11)
+    return pack_births(
+        rng.integers(1900, 2100, count),
+        rng.integers(1, 13, count),
+        rng.integers(1, 29, count),
+        rng.integers(0, 24, count),
+        rng.integers(0, 60, count),
+        rng.uniform(-60, 60, count),
+        rng.uniform(-180, 180, count),
+        np.full(count, 5.5),
+        rng.choice(AYANAMSA_NAMES, count),
+    )
+
+
+def check_ayanamsa(pool):
+    """
+    Every ayanamsa travels with its birth: each twin matches calculate_chart in that mode,
+    and no non-Lahiri twin comes back with the Lahiri chart.
+    """
+    twins = pool.map(pack_births(*[[value] * len(AYANAMSA_NAMES) for value in BIRTH], AYANAMSA_NAMES))
+    engine = VedicAstroEngine(cache_size=0)
+    for mode, row in zip(AYANAMSA_NAMES, twins):
+        chart = engine.calculate_chart(*BIRTH, mode)
+        expected = [chart[name]["absolute_longitude"] for name in chart.keys() if name != "Ascendant"]
+        assert np.allclose(row["absolute_longitude"], expected, atol=1e-6), mode
+        if mode != "LAHIRI":
+            assert not np.allclose(row["absolute_longitude"], twins[0]["absolute_longitude"]), mode
+    print(f"Ayanamsa check: {', '.join(AYANAMSA_NAMES)} twins match calculate_chart")
+
+
+def worker_counts():
+    counts = []
+    n = 1
+    while n < (os.cpu_count() or 1):
+        counts.append(n)
+        n *= 2
+    counts.append(os.cpu_count() or 1)
+    return counts
+
+
+def run_benchmark():
+    births = make_births(BIRTH_COUNT)
+
+    print(f"Worker Pool Scaling: {BIRTH_COUNT} births, chunks of {CHUNK_SIZE}, {os.cpu_count()} CPUs")
+    print("-" * 50)
+
+    baseline = None
+    for workers in worker_counts():
+        pool = ChartWorkerPool(workers=workers, chunk_size=CHUNK_SIZE)
+        pool.map(births[: workers * CHUNK_SIZE])  # warm up: spawn + engine init in every worker
+        if baseline is None:
+            check_ayanamsa(pool)
+
+        t0 = time.perf_counter()
+        pool.map(births)
+        elapsed = time.perf_counter() - t0
+        pool.close()
+
+        throughput = BIRTH_COUNT / elapsed
+        baseline = baseline or throughput
+        speedup = throughput / baseline
+        print(f"Workers: {workers:>3}  Throughput: {throughput:9.1f} births/sec  Speedup: {speedup:5.2f}x  Efficiency: {speedup / workers:5.0%}")
+
+    print("-" * 50)
+
+
+if __name__ == "__main__":
+    run_benchmark()
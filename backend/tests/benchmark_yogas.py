@@ -0,0 +1,81 @@
+import os
+import sys
+import time
+import statistics
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.astronomy.chart import CHART_KEYS
+from src.astronomy.engine import VedicAstroEngine
+from src.astronomy.yoga_rules import YOGA_RULES
+from src.astronomy.yogas import YogaEngine
+
+# Configuration
+RUNS = 2000
+BATCH = 10000
+RULE_COUNTS = [18, len(YOGA_RULES), 250, 500, 1000]
+
+
+def time_call(fn, runs):
+    latencies = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(latencies)
+
+
+def synthetic_rules(count):
+    """
+    YOGA_RULES padded to `count` with generated placements (house lord in house, graha or
+    lord in house from the Moon, lord with graha, graha in kendra from graha): the shapes of
+    the classical bhava-phala rules.
+    """
+    extra = []
+    for h in range(1, 13):
+        for target in range(1, 13):
+            extra.append([("house", f"lord:{h}", (target,))])
+    for p in CHART_KEYS[:9]:
+        for target in range(1, 13):
+            extra.append([("from", p, "Moon", (target,)), ("dignity", p, ("Own", "Exalted"))])
+    for h in range(1, 13):
+        for p in CHART_KEYS[:9]:
+            extra.append([("conjunct", f"lord:{h}", p), ("house", p, (1, 5, 9))])
+    for h in range(1, 13):
+        for target in range(1, 13):
+            extra.append([("from", f"lord:{h}", "Moon", (target,)), ("dignity", f"lord:{h}", ("Own",))])
+    for p in CHART_KEYS[:9]:
+        for q in CHART_KEYS[:9]:
+            if p != q:
+                extra.append([("from", p, q, (1, 4, 7, 10)), ("from", q, "Ascendant", (1, 5, 9))])
+    rules = list(YOGA_RULES[:count])
+    for i, clause in enumerate(extra[:max(0, count - len(rules))]):
+        rules.append({"name": f"Synthetic {i}", "category": "Synthetic", "desc": "", "all": clause})
+    return rules
+
+
+def run_benchmark():
+    engine = VedicAstroEngine(cache_size=0)
+    chart = engine.calculate_chart(1990, 5, 25, 14, 30, 28.61, 77.20, 5.5)
+    rng = np.random.default_rng(0)
+    cols = engine.calculate_charts_batch(
+        rng.integers(1950, 2010, BATCH), rng.integers(1, 13, BATCH), rng.integers(1, 29, BATCH),
+        rng.integers(0, 24, BATCH), rng.integers(0, 60, BATCH), np.full(BATCH, 28.61), np.full(BATCH, 77.20),
+        np.full(BATCH, 5.5),
+    )
+    batch = (cols["sign_id"], cols["degree"], cols["ascendant"]["sign_id"])
+
+    print(f"Compiled Yoga Rules Benchmark (per chart; batch of {BATCH})")
+    print("-" * 50)
+    print(f"{'rules':>6} {'atoms':>6}  {'check_yogas':>12}  {'batch / chart':>14}")
+    for count in RULE_COUNTS:
+        yogas = YogaEngine(synthetic_rules(count))
+        single = time_call(lambda: yogas.check_yogas(chart), RUNS)
+        per_chart = time_call(lambda: yogas.check_yogas_batch(*batch), 20) / BATCH
+        print(f"{count:>6} {len(yogas.compiled.ATOM_A):>6}  {single:9.1f} us  {per_chart * 1000:10.0f} ns")
+    print("-" * 50)
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,74 @@
+import os
+import sys
+import time
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.astronomy.engine import VedicAstroEngine
+
+# Configuration
+THREADS = 16
+CHART_COUNT = 500
+ROUNDS = 5
+AYANAMSAS = ["LAHIRI", "RAMAN", "KP", "YUKTESHWAR"]
+
+
+def make_cases(count):
+    rng = random.Random(42)
+    cases = []
+    for _ in range(count):
+        cases.append(
+            (
+                rng.randint(1900, 2100),
+                rng.randint(1, 12),
+                rng.randint(1, 28),
+                rng.randint(0, 23),
+                rng.randint(0, 59),
+                rng.uniform(-60, 60),
+                rng.uniform(-180, 180),
+                rng.choice([5.5, 0.0, -5.0, 8.0]),
+                rng.choice(AYANAMSAS),
+            )
+        )
+    return cases
+
+
+def run_stress():
+    engine = VedicAstroEngine(cache_size=0)  # every round computes its charts
+    cases = make_cases(CHART_COUNT)
+
+    print(f"Concurrency Stress: {CHART_COUNT} charts x {ROUNDS} rounds on {THREADS} threads")
+    print("-" * 50)
+
+    # Serial reference (mixed ayanamsas interleaved)
+    reference = [engine.calculate_chart(*c) for c in cases]
+
+    mismatches = 0
+    start_time = time.time()
+
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        for _ in range(ROUNDS):
+            results = list(pool.map(lambda c: engine.calculate_chart(*c), cases))
+            for ref, res in zip(reference, results):
+                for p_name, ref_data in ref.items():
+                    if res[p_name]["absolute_longitude"] != ref_data["absolute_longitude"]:
+                        mismatches += 1
+
+    total_time = time.time() - start_time
+    total = CHART_COUNT * ROUNDS
+
+    print(f"Charts:         {total}")
+    print(f"Mismatches:     {mismatches}")
+    print(f"Throughput:     {total / total_time:.2f} charts/sec")
+    print("-" * 50)
+
+    if mismatches:
+        print("FAILED: concurrent results differ from serial results.")
+        sys.exit(1)
+    print("PASSED: concurrent results match serial results.")
+
+
+if __name__ == "__main__":
+    run_stress()